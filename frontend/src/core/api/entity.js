@@ -44,15 +44,15 @@ export default class EntityAPI extends APIBase {
      * Return a list of entities for a project and locale.
      *
      * Pass in a `resource` to restrict the list to a specific path.
-     * If the `exclude` array has values, those entities will be excluded from
-     * the query. Use this to query for the next set of entities.
+     * Pass in the `cursor` returned with a set of entities to query for the
+     * next set of entities.
      */
     async getEntities(
         locale: string,
         project: string,
         resource: string,
         entityIds: ?Array<number>,
-        exclude: Array<number>,
+        cursor: ?string,
         entity: ?string,
         search: ?string,
         status: ?string,
@@ -74,8 +74,8 @@ export default class EntityAPI extends APIBase {
             payload.append('entity_ids', entityIds.join(','));
         }
 
-        if (exclude.length) {
-            payload.append('exclude_entities', exclude.join(','));
+        if (cursor) {
+            payload.append('cursor', cursor);
         }
 
         if (entity) {
@@ -29,12 +29,18 @@ export type ReceiveAction = {
     type: typeof RECEIVE,
     entities: Entities,
     hasMore: boolean,
+    cursor: ?string,
 };
-export function receive(entities: Entities, hasMore: boolean): ReceiveAction {
+export function receive(
+    entities: Entities,
+    hasMore: boolean,
+    cursor: ?string,
+): ReceiveAction {
     return {
         type: RECEIVE,
         entities,
         hasMore,
+        cursor,
     };
 }
 
@@ -68,7 +74,7 @@ export function get(
     project: string,
     resource: string,
     entityIds: ?Array<number>,
-    exclude: Array<number>,
+    cursor: ?string,
     entity: ?string,
     search: ?string,
     status: ?string,
@@ -85,7 +91,7 @@ export function get(
             project,
             resource,
             entityIds,
-            exclude,
+            cursor,
             entity,
             search,
             status,
@@ -96,7 +102,9 @@ export function get(
         );
 
         if (content.entities) {
-            dispatch(receive(content.entities, content.has_next));
+            dispatch(
+                receive(content.entities, content.has_next, content.cursor),
+            );
             dispatch(stats.actions.update(content.stats));
         }
     };
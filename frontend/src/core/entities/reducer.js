@@ -18,6 +18,7 @@ export type EntitiesState = {
     +fetching: boolean,
     +fetchCount: number,
     +hasMore: boolean,
+    +cursor: ?string,
 };
 
 function updateEntityTranslation(
@@ -45,11 +46,21 @@ function updateEntityTranslation(
     });
 }
 
+// The first page of entities may include the selected entity, which the
+// server then returns again in its place on a later page.
+function addEntities(state: Object, entities: Entities): Entities {
+    const pks = new Set(state.entities.map((entity) => entity.pk));
+    return state.entities.concat(
+        entities.filter((entity) => !pks.has(entity.pk)),
+    );
+}
+
 const initial: EntitiesState = {
     entities: [],
     fetching: false,
     fetchCount: 0,
     hasMore: true,
+    cursor: null,
 };
 
 export default function reducer(
@@ -60,10 +71,11 @@ export default function reducer(
         case RECEIVE:
             return {
                 ...state,
-                entities: state.entities.concat(action.entities),
+                entities: addEntities(state, action.entities),
                 fetching: false,
                 fetchCount: state.fetchCount + 1,
                 hasMore: action.hasMore,
+                cursor: action.cursor,
             };
         case REQUEST:
             return {
@@ -77,6 +89,7 @@ export default function reducer(
                 entities: [],
                 fetching: false,
                 hasMore: true,
+                cursor: null,
             };
         case UPDATE:
             return {
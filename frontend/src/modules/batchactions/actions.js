@@ -45,7 +45,7 @@ function updateUI(
             project,
             resource,
             entities,
-            [],
+            null,
         );
 
         if (entitiesData.stats) {
@@ -206,7 +206,7 @@ export function selectAll(
             project,
             resource,
             null,
-            [],
+            null,
             null,
             search,
             status,
@@ -305,10 +305,8 @@ export class EntitiesListBase extends React.Component<InternalProps> {
         // Do not return a specific list of entities defined by their IDs.
         const entityIds = null;
 
-        // Currently shown entities should be excluded from the next results.
-        const currentEntityIds = props.entities.entities.map(
-            (entity) => entity.pk,
-        );
+        // Continue after the currently shown entities.
+        const cursor = props.entities.cursor;
 
         props.dispatch(
             entities.actions.get(
@@ -316,7 +314,7 @@ export class EntitiesListBase extends React.Component<InternalProps> {
                 project,
                 resource,
                 entityIds,
-                currentEntityIds,
+                cursor,
                 entity.toString(),
                 search,
                 status,
@@ -103,10 +103,10 @@ describe('<EntitiesList>', () => {
         expect(wrapper.find('Entity')).toHaveLength(2);
     });
 
-    it('excludes current entities when requesting new entities', () => {
+    it('passes the cursor of current entities when requesting new entities', () => {
         const store = createReduxStore();
 
-        store.dispatch(entities.actions.receive(ENTITIES, false));
+        store.dispatch(entities.actions.receive(ENTITIES, true, 'cursor'));
 
         const wrapper = shallowUntilTarget(
             <EntitiesList store={store} />,
@@ -115,8 +115,8 @@ describe('<EntitiesList>', () => {
 
         wrapper.instance().getMoreEntities();
 
-        // Verify the 5th argument of `actions.get` is the list of current entities.
-        expect(entities.actions.get.args[0][4]).toEqual([1, 2]);
+        // Verify the 5th argument of `actions.get` is the cursor.
+        expect(entities.actions.get.args[0][4]).toEqual('cursor');
     });
 
     it('redirects to the first entity when none is selected', () => {
@@ -199,6 +199,7 @@ class RepositoryInline(admin.TabularInline):
         "type",
         "url",
         "branch",
+        "git_clone",
         "website",
         "permalink_prefix",
         "last_synced_revisions",
@@ -284,6 +284,7 @@ class GetEntitiesForm(forms.Form):
     pk_only = forms.BooleanField(required=False)
     inplace_editor = forms.BooleanField(required=False)
     entity = forms.IntegerField(required=False)
+    cursor = forms.CharField(required=False)
 
     def clean_paths(self):
         try:
@@ -309,6 +310,15 @@ class GetEntitiesForm(forms.Form):
     def clean_entity_ids(self):
         return utils.split_ints(self.cleaned_data["entity_ids"])
 
+    def clean_cursor(self):
+        if not self.cleaned_data["cursor"]:
+            return None
+
+        try:
+            return utils.decode_cursor(self.cleaned_data["cursor"])
+        except ValueError as e:
+            raise forms.ValidationError(str(e))
+
 
 class AddCommentForm(forms.Form):
     """
@@ -0,0 +1,72 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Max, Min
+
+from pontoon.base.models import Locale, TranslationMemoryEntry
+from pontoon.machinery.utils import get_translation_memory_data
+
+
+class Command(BaseCommand):
+    help = """
+        Measure latency of Translation Memory lookups of the given locale, using
+        sources of randomly picked Translation Memory entries as lookup texts.
+
+        Meant to be run against a production-sized database, e.g. to compare
+        lookups before and after changes to Translation Memory queries.
+        """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "locale", help="Code of the locale to look up Translation Memory of",
+        )
+
+        parser.add_argument(
+            "--samples",
+            action="store",
+            dest="samples",
+            type=int,
+            default=100,
+            help="Number of lookups to measure",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            locale = Locale.objects.get(code=options["locale"])
+        except Locale.DoesNotExist:
+            raise CommandError("Locale {} not found.".format(options["locale"]))
+
+        entries = TranslationMemoryEntry.objects.filter(locale=locale)
+        pks = entries.aggregate(min=Min("pk"), max=Max("pk"))
+        if pks["min"] is None:
+            raise CommandError("No Translation Memory entries found.")
+
+        durations = []
+        while len(durations) < options["samples"]:
+            # Avoid ORDER BY random(), which scans the whole table
+            entry = entries.filter(
+                pk__gte=random.randint(pks["min"], pks["max"])
+            ).first()
+            if entry is None:
+                continue
+
+            start = time.time()
+            get_translation_memory_data(entry.source, locale)
+            durations.append(time.time() - start)
+
+        durations.sort()
+
+        def percentile(p):
+            return durations[min(int(len(durations) * p), len(durations) - 1)]
+
+        self.stdout.write(
+            "Translation Memory lookups of {locale} ({count} samples): "
+            "p50 {p50:.3f}s, p95 {p95:.3f}s, max {max:.3f}s".format(
+                locale=locale.code,
+                count=len(durations),
+                p50=percentile(0.5),
+                p95=percentile(0.95),
+                max=durations[-1],
+            )
+        )
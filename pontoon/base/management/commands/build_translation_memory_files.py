@@ -0,0 +1,51 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Exists, OuterRef
+
+from pontoon.base.models import Locale, TranslationMemoryEntry
+from pontoon.base.utils import write_translation_memory_file
+
+
+log = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = """
+        Precompute gzipped TMX files of all projects for the given locales, or
+        for all locales with Translation Memory entries if none are given.
+
+        Files are stored in settings.TMX_FILES_ROOT and served on download of
+        all-projects Translation Memory for settings.TMX_FILE_MAX_AGE seconds.
+        """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "locales", nargs="*", help="Codes of locales to build TMX files of",
+        )
+
+    def handle(self, *args, **options):
+        locales = Locale.objects.filter(
+            Exists(TranslationMemoryEntry.objects.filter(locale=OuterRef("pk")))
+        )
+
+        if options["locales"]:
+            locales = Locale.objects.filter(code__in=options["locales"])
+            missing = set(options["locales"]) - set(
+                locales.values_list("code", flat=True)
+            )
+            if missing:
+                raise CommandError(
+                    "Locales not found: {}.".format(", ".join(sorted(missing)))
+                )
+
+        for locale in locales.order_by("code"):
+            start = time.time()
+            path = write_translation_memory_file(locale)
+
+            log.info(
+                "Built TMX file of {locale} in {duration:.1f}s: {path}".format(
+                    locale=locale.code, duration=time.time() - start, path=path,
+                )
+            )
@@ -1,22 +1,50 @@
 import logging
+import time
 
-from django.core.management.base import BaseCommand
+from multiprocessing import Pool
+
+from celery import group
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
 from django.db.models import Count
 
 from pontoon.base.models import (
+    Locale,
     Project,
-    TranslatedResource,
+)
+from pontoon.base.tasks import (
+    calculate_project_stats,
+    calculate_stats_checkpoint_key,
+    calculate_stats_error_key,
 )
 
 
 log = logging.getLogger(__name__)
 
 
+def _calculate_project_stats(project_pk):
+    """Run the task synchronously in a process of the local process pool."""
+    return calculate_project_stats(project_pk)
+
+
 class Command(BaseCommand):
     help = """
         Re-calculate statistics for all translated resources and corresponding
         objects.
 
+        Stats are calculated project by project, either serially, in a pool of
+        local processes (--processes) or as Celery tasks (--celery). Completed
+        projects are checkpointed in the cache, so with a persistent cache backend
+        an interrupted run can be continued with --resume. Locale stats are
+        aggregated once, after all projects are done.
+
+        With --celery, the command waits for the tasks at most --timeout
+        seconds. It exits with an error if any of the tasks fails or doesn't
+        complete in time. Celery tasks report to the command through the
+        cache, so it must be shared with the workers, e.g. memcached.
+
         Note: while unlikely, it's possible that running this command may
         result in IntegrityErrors. That happens if at the same time when
         calculate_stats() is being executed for a TranslatedResource instance,
@@ -28,24 +56,174 @@ class Command(BaseCommand):
         See bug 1470337 for more details.
         """
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            action="store",
+            dest="processes",
+            type=int,
+            default=1,
+            help="Number of local processes to calculate project stats in",
+        )
+
+        parser.add_argument(
+            "--celery",
+            action="store_true",
+            dest="celery",
+            default=False,
+            help="Calculate project stats in Celery tasks",
+        )
+
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            dest="resume",
+            default=False,
+            help="Skip projects completed by a previous, interrupted run",
+        )
+
+        parser.add_argument(
+            "--poll-interval",
+            action="store",
+            dest="poll_interval",
+            type=int,
+            default=10,
+            help="Seconds between progress checks of Celery tasks",
+        )
+
+        parser.add_argument(
+            "--timeout",
+            action="store",
+            dest="timeout",
+            type=int,
+            default=6 * 60 * 60,
+            help="Seconds to wait for Celery tasks to complete",
+        )
+
     def handle(self, *args, **options):
+        if options["celery"] and not settings.CELERY_ALWAYS_EAGER:
+            backend = settings.CACHES["default"]["BACKEND"]
+            if backend.endswith((".LocMemCache", ".DummyCache")):
+                raise CommandError(
+                    "Celery workers can't report progress through the {} cache "
+                    "backend, use --processes instead.".format(backend)
+                )
+
         # Start with enabled projects in ascending order of resource count
-        projects = Project.objects.annotate(resource_count=Count("resources")).order_by(
-            "disabled", "resource_count"
+        project_pks = list(
+            Project.objects.annotate(resource_count=Count("resources"))
+            .order_by("disabled", "resource_count")
+            .values_list("pk", flat=True)
         )
 
-        for index, project in enumerate(projects):
+        checkpoint_keys = [calculate_stats_checkpoint_key(pk) for pk in project_pks]
+
+        if options["resume"]:
+            done = cache.get_many(checkpoint_keys)
+            pending = [
+                pk for pk, key in zip(project_pks, checkpoint_keys) if key not in done
+            ]
+        else:
+            cache.delete_many(checkpoint_keys)
+            pending = project_pks
+
+        cache.delete_many([calculate_stats_error_key(pk) for pk in pending])
+
+        self.total = len(project_pks)
+        self.done = self.total - len(pending)
+        self.translated_resources = 0
+        self.start = time.time()
+
+        if options["resume"]:
             log.info(
-                u'Calculating stats for project "{project}" ({index}/{total})'.format(
-                    index=index + 1, total=len(projects), project=project.name,
+                "Resuming stats calculation, {done}/{total} projects done.".format(
+                    done=self.done, total=self.total,
                 )
             )
 
-            translated_resources = TranslatedResource.objects.filter(
-                resource__project=project
+        if options["celery"]:
+            self.calculate_in_celery(
+                pending, options["poll_interval"], options["timeout"]
             )
+        elif options["processes"] > 1:
+            self.calculate_in_processes(pending, options["processes"])
+        else:
+            for project_pk in pending:
+                self.project_done(calculate_project_stats(project_pk))
 
-            for translated_resource in translated_resources:
-                translated_resource.calculate_stats()
+        # Locales span multiple projects, so they're aggregated only once
+        for locale in Locale.objects.all():
+            locale.aggregate_stats()
 
         log.info("Calculating stats complete for all projects.")
+
+    def project_done(self, count):
+        self.done += 1
+        self.translated_resources += count
+        duration = time.time() - self.start
+
+        log.info(
+            "Calculated stats for {done}/{total} projects, {count} translated "
+            "resources in {duration:.1f}s ({rate:.1f}/s).".format(
+                done=self.done,
+                total=self.total,
+                count=self.translated_resources,
+                duration=duration,
+                rate=self.translated_resources / duration if duration else 0,
+            )
+        )
+
+    def calculate_in_processes(self, project_pks, processes):
+        # Forked processes must not share the database connection of the parent
+        connections.close_all()
+
+        with Pool(processes) as pool:
+            for count in pool.imap_unordered(_calculate_project_stats, project_pks):
+                self.project_done(count)
+
+    def calculate_in_celery(self, project_pks, poll_interval, timeout):
+        group(calculate_project_stats.si(pk) for pk in project_pks).apply_async()
+
+        # Results of Celery tasks aren't stored, so wait for the checkpoints or
+        # errors they store in the cache
+        pending = set(project_pks)
+        errors = {}
+        deadline = time.time() + timeout
+
+        while pending:
+            results = cache.get_many(
+                [calculate_stats_checkpoint_key(pk) for pk in pending]
+                + [calculate_stats_error_key(pk) for pk in pending]
+            )
+
+            for pk in list(pending):
+                if calculate_stats_checkpoint_key(pk) in results:
+                    pending.remove(pk)
+                    self.project_done(results[calculate_stats_checkpoint_key(pk)])
+                elif calculate_stats_error_key(pk) in results:
+                    pending.remove(pk)
+                    errors[pk] = results[calculate_stats_error_key(pk)]
+
+            if pending and time.time() < deadline:
+                time.sleep(poll_interval)
+            else:
+                break
+
+        for pk, error in sorted(errors.items()):
+            log.error("Calculating stats failed for project {}: {}".format(pk, error))
+
+        if pending:
+            log.error(
+                "Calculating stats didn't complete in {timeout}s for projects: "
+                "{pks}".format(
+                    timeout=timeout, pks=", ".join(map(str, sorted(pending)))
+                )
+            )
+
+        if errors or pending:
+            raise CommandError(
+                "Calculating stats failed for {failed} and timed out for "
+                "{timed_out} of {total} projects.".format(
+                    failed=len(errors), timed_out=len(pending), total=len(project_pks)
+                )
+            )
@@ -0,0 +1,20 @@
+from django.db import migrations
+
+import pontoon.db.migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0012_auto_20201020_1830"),
+    ]
+
+    operations = [
+        pontoon.db.migrations.GINIndex(
+            table="base_translationmemoryentry",
+            field="source",
+            expression="source",
+            index_opts="gin_trgm_ops",
+            index_suffix="trigram_index",
+        ),
+    ]
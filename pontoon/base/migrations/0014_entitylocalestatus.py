@@ -0,0 +1,121 @@
+# Generated by Django 3.1.3 on 2026-10-18 04:39
+
+from django.db import migrations, models
+from django.db.models import Count, Q, Value
+from django.db.models.functions import Coalesce
+import django.db.models.deletion
+
+
+def calculate_entity_locale_statuses(apps, schema_editor):
+    Locale = apps.get_model("base", "Locale")
+    Translation = apps.get_model("base", "Translation")
+    EntityLocaleStatus = apps.get_model("base", "EntityLocaleStatus")
+
+    no_failed_checks = Q(errors__isnull=True, warnings__isnull=True)
+    approved_or_fuzzy = Q(approved=True) | Q(fuzzy=True)
+    status_queries = {
+        "approved_or_fuzzy": approved_or_fuzzy,
+        "approved": Q(approved=True) & no_failed_checks,
+        "fuzzy": Q(fuzzy=True) & no_failed_checks,
+        "errors": approved_or_fuzzy & Q(errors__isnull=False),
+        "warnings": approved_or_fuzzy & Q(warnings__isnull=False),
+        "unreviewed": Q(approved=False, fuzzy=False, rejected=False),
+        "rejected": Q(rejected=True),
+    }
+    plural_form = Coalesce("plural_form", Value(0))
+
+    for locale in Locale.objects.all():
+        # Locale.nplurals isn't available on historical models
+        nplurals = len(locale.cldr_plurals.split(",")) if locale.cldr_plurals else 1
+
+        translations = Translation.objects.filter(locale=locale).filter(
+            Q(entity__string_plural="") | Q(plural_form__lt=nplurals)
+        )
+
+        # Unreviewed translations are counted one by one, other fields count
+        # plural forms
+        rows = (
+            translations.order_by()
+            .values("entity", "entity__string_plural")
+            .annotate(
+                **{
+                    "status_"
+                    + field: Count(
+                        "pk" if field == "unreviewed" else plural_form,
+                        distinct=True,
+                        filter=query,
+                    )
+                    for field, query in status_queries.items()
+                }
+            )
+        )
+
+        EntityLocaleStatus.objects.bulk_create(
+            (
+                EntityLocaleStatus(
+                    entity_id=row["entity"],
+                    locale=locale,
+                    plural_forms=nplurals if row["entity__string_plural"] else 1,
+                    **{field: row["status_" + field] for field in status_queries}
+                )
+                for row in rows.iterator()
+            ),
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0013_translationmemoryentry_source_trigram_index"),
+        ("checks", "0001_squashed_0004_auto_20200206_0932"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EntityLocaleStatus",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("plural_forms", models.PositiveSmallIntegerField(default=1)),
+                ("approved_or_fuzzy", models.PositiveSmallIntegerField(default=0)),
+                ("approved", models.PositiveSmallIntegerField(default=0)),
+                ("fuzzy", models.PositiveSmallIntegerField(default=0)),
+                ("errors", models.PositiveSmallIntegerField(default=0)),
+                ("warnings", models.PositiveSmallIntegerField(default=0)),
+                ("unreviewed", models.PositiveSmallIntegerField(default=0)),
+                ("rejected", models.PositiveSmallIntegerField(default=0)),
+                (
+                    "entity",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="statuses",
+                        to="base.entity",
+                    ),
+                ),
+                (
+                    "locale",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="entity_statuses",
+                        to="base.locale",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("entity", "locale")},
+                "index_together": {("locale", "entity")},
+            },
+        ),
+        migrations.RunPython(
+            code=calculate_entity_locale_statuses,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,28 @@
+from django.db import migrations
+
+import pontoon.db.migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0014_entitylocalestatus"),
+    ]
+
+    operations = [
+        pontoon.db.migrations.MultiFieldTRGMIndex(
+            table="base_entity",
+            from_fields=[
+                "string",
+                "string_plural",
+                "comment",
+                "group_comment",
+                "resource_comment",
+                "key",
+            ],
+            field="search",
+        ),
+        pontoon.db.migrations.MultiFieldTRGMIndex(
+            table="base_translation", from_fields=["string"], field="string",
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 3.1.3 on 2026-10-18 05:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0015_search_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="repository",
+            name="git_clone",
+            field=models.CharField(
+                choices=[
+                    ("full", "Full"),
+                    ("shallow", "Shallow"),
+                    ("blobless", "Blobless"),
+                ],
+                default="full",
+                help_text="\n        How Git repositories are cloned and updated. Full clones fetch all\n        branches with their complete history. Shallow clones only fetch the\n        latest commit of the configured branch, blobless clones fetch its\n        history without file contents, which are downloaded when needed.\n        Ignored for other repository types.\n    ",
+                max_length=20,
+                verbose_name="Git clone",
+            ),
+        ),
+    ]
@@ -7,12 +7,15 @@ import operator
 import os.path
 import re
 import requests
+import threading
 
 import Levenshtein
 
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dirtyfields import DirtyFieldsMixin
-from django.db.models.functions import Length, Substr, Cast
+from django.db.models.functions import Coalesce, Length, Substr, Cast
 from functools import reduce
 from urllib.parse import quote, urlencode, urlparse
 
@@ -20,9 +23,10 @@ from django.conf import settings
 from django.contrib.auth.models import User, Group
 from django.contrib.postgres.fields import ArrayField
 
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_email
-from django.db import models
+from django.db import DatabaseError, models, transaction
 from django.db.models import (
     Count,
     F,
@@ -532,6 +536,96 @@ class AggregatedStats(models.Model):
         return n / self.total_strings * 100 if self.total_strings else 0
 
 
+class StatsDiffs(object):
+    """
+    Accumulator of stats diffs for rows of AggregatedStats models.
+
+    Diffs of the same row are summed up and written with a single F() expression
+    update per row on flush(), no matter how many translations changed them.
+    """
+
+    FIELDS = (
+        "total_strings",
+        "approved_strings",
+        "fuzzy_strings",
+        "strings_with_errors",
+        "strings_with_warnings",
+        "unreviewed_strings",
+    )
+
+    def __init__(self):
+        self.diffs = defaultdict(lambda: dict.fromkeys(self.FIELDS, 0))
+
+    def add(self, model, lookup, diffs):
+        """
+        Add diffs for the row of the given model, matching the given lookup.
+
+        :arg dict lookup: filter arguments identifying the row, e.g. {"pk": 1}.
+        :arg dict diffs: diffs keyed by field names.
+        """
+        row = self.diffs[(model, tuple(sorted(lookup.items())))]
+        for field, diff in diffs.items():
+            row[field] += diff
+
+    def flush(self):
+        # Update rows in a consistent order to avoid deadlocks between workers
+        for (model, lookup), diffs in sorted(
+            self.diffs.items(), key=lambda item: (item[0][0].__name__, item[0][1])
+        ):
+            changed = {
+                field: F(field) + diff for field, diff in diffs.items() if diff != 0
+            }
+            if changed:
+                model.objects.filter(**dict(lookup)).update(**changed)
+
+        ProjectLocale.invalidate_parts_stats(
+            (dict(lookup)["project"], dict(lookup)["locale"])
+            for model, lookup in self.diffs
+            if model is ProjectLocale
+        )
+
+        self.diffs.clear()
+
+
+_stats_diffs = threading.local()
+
+
+@contextmanager
+def batch_stats_updates():
+    """
+    Defer stats adjustments caused by saving translations until the end of the
+    block, then write them as one update per TranslatedResource, Project, Locale
+    and ProjectLocale row.
+
+    Nested blocks are merged into the outermost one. Stats read inside the block
+    don't reflect the deferred adjustments yet.
+
+    Adjustments are also written if the block raises an exception, because
+    translations saved before the error stay saved. The exception is re-raised
+    afterwards. If the block runs in a transaction, rolling it back discards
+    both the translations and the adjustments.
+    """
+    if getattr(_stats_diffs, "current", None) is not None:
+        yield _stats_diffs.current
+        return
+
+    stats_diffs = _stats_diffs.current = StatsDiffs()
+    try:
+        yield stats_diffs
+    except Exception:
+        _stats_diffs.current = None
+        try:
+            stats_diffs.flush()
+        except DatabaseError:
+            # The transaction is broken and gets rolled back together with the
+            # translations, the original error is the one worth reporting.
+            pass
+        raise
+    else:
+        _stats_diffs.current = None
+        stats_diffs.flush()
+
+
 def validate_cldr(value):
     for item in value.split(","):
         try:
@@ -971,7 +1065,22 @@ class Locale(AggregatedStats):
         ]
 
     def parts_stats(self, project):
-        """Get locale-project pages/paths with stats."""
+        """
+        Get locale-project pages/paths with stats.
+
+        Cached until stats or resources of the ProjectLocale change.
+        """
+        key = ProjectLocale.parts_stats_cache_key(project.pk, self.pk)
+        parts = cache.get(key)
+
+        if parts is None:
+            parts = self.calculate_parts_stats(project)
+            cache.set(key, parts, settings.PARTS_STATS_CACHE_TIMEOUT)
+
+        return parts
+
+    def calculate_parts_stats(self, project):
+        """Calculate locale-project pages/paths with stats."""
 
         def get_details(parts):
             return parts.order_by("title").values(
@@ -1763,6 +1872,29 @@ class ProjectLocale(AggregatedStats):
             locale=self.locale,
         ).distinct().aggregate_stats(self)
 
+        ProjectLocale.invalidate_parts_stats([(self.project_id, self.locale_id)])
+
+    @staticmethod
+    def parts_stats_cache_key(project_pk, locale_pk):
+        """Cache key of Locale.parts_stats() of the given project and locale."""
+        return "parts_stats:project={}:locale={}".format(project_pk, locale_pk)
+
+    @classmethod
+    def invalidate_parts_stats(cls, project_locales):
+        """
+        Invalidate cached Locale.parts_stats() of the given project locales.
+
+        :arg project_locales: iterable of (project_pk, locale_pk) tuples.
+        """
+        keys = [cls.parts_stats_cache_key(*pair) for pair in project_locales]
+        if keys:
+            cache.delete_many(keys)
+
+            # Until stats changed in a transaction are committed, other processes
+            # can still cache old stats
+            if transaction.get_connection().in_atomic_block:
+                transaction.on_commit(lambda: cache.delete_many(keys))
+
 
 class Repository(models.Model):
     """
@@ -1775,6 +1907,12 @@ class Repository(models.Model):
         ("svn", "SVN"),
     )
 
+    GIT_CLONE_CHOICES = (
+        ("full", "Full"),
+        ("shallow", "Shallow"),
+        ("blobless", "Blobless"),
+    )
+
     project = models.ForeignKey(Project, models.CASCADE, related_name="repositories")
     type = models.CharField(max_length=255, default="git", choices=TYPE_CHOICES)
     url = models.CharField("URL", max_length=2000)
@@ -1813,6 +1951,20 @@ class Repository(models.Model):
     """,
     )
 
+    git_clone = models.CharField(
+        "Git clone",
+        max_length=20,
+        default="full",
+        choices=GIT_CLONE_CHOICES,
+        help_text="""
+        How Git repositories are cloned and updated. Full clones fetch all
+        branches with their complete history. Shallow clones only fetch the
+        latest commit of the configured branch, blobless clones fetch its
+        history without file contents, which are downloaded when needed.
+        Ignored for other repository types.
+    """,
+    )
+
     def __repr__(self):
         repo_kind = "Repository"
         if self.source_repo:
@@ -1944,25 +2096,58 @@ class Repository(models.Model):
         pulling.
         """
         if not self.multi_locale:
-            update_from_vcs(self.type, self.url, self.checkout_path, self.branch)
+            update_from_vcs(
+                self.type,
+                self.url,
+                self.checkout_path,
+                self.branch,
+                timeout=settings.SYNC_PULL_TIMEOUT or None,
+                git_clone=self.git_clone,
+            )
             return {"single_locale": get_revision(self.type, self.checkout_path)}
         else:
             current_revisions = {}
             locales = locales or self.project.locales.all()
 
-            for locale in locales:
-                repo_type = self.type
-                url = self.locale_url(locale)
-                checkout_path = self.locale_checkout_path(locale)
-                repo_branch = self.branch
+            # Resolve URLs and paths up front, so that pulling threads don't
+            # need to touch the database
+            checkouts = [
+                (
+                    locale.code,
+                    self.locale_url(locale),
+                    self.locale_checkout_path(locale),
+                )
+                for locale in locales
+            ]
+
+            def pull_locale(checkout):
+                locale_code, url, checkout_path = checkout
 
                 try:
-                    update_from_vcs(repo_type, url, checkout_path, repo_branch)
-                    current_revisions[locale.code] = get_revision(
-                        repo_type, checkout_path
+                    update_from_vcs(
+                        self.type,
+                        url,
+                        checkout_path,
+                        self.branch,
+                        timeout=settings.SYNC_PULL_TIMEOUT or None,
+                        git_clone=self.git_clone,
                     )
+                    return locale_code, get_revision(self.type, checkout_path), None
                 except PullFromRepositoryException as e:
-                    log.error("%s Pull Error for %s: %s" % (repo_type.upper(), url, e))
+                    return locale_code, None, e
+
+            # Pulling is mostly waiting for the network, so locale repositories
+            # are pulled concurrently
+            with ThreadPoolExecutor(max_workers=settings.SYNC_PULL_THREADS) as pool:
+                results = list(pool.map(pull_locale, checkouts))
+
+            for (locale_code, revision, error), (_, url, _) in zip(results, checkouts):
+                if error is None:
+                    current_revisions[locale_code] = revision
+                else:
+                    log.error(
+                        "%s Pull Error for %s: %s" % (self.type.upper(), url, error)
+                    )
 
             return current_revisions
 
@@ -2121,6 +2306,23 @@ class Subpage(models.Model):
 
 
 class EntityQuerySet(models.QuerySet):
+    def after(self, order_fields, values):
+        """
+        Filter entities following the given values of order fields, i.e. the
+        next page of keyset pagination.
+
+        :arg tuple order_fields: fields entities are ordered by
+        :arg list values: values of `order_fields` of the last entity of the
+            previous page
+        """
+        filters = []
+        for i, field in enumerate(order_fields):
+            query = dict(zip(order_fields[:i], values[:i]))
+            query[field + "__gt"] = values[i]
+            filters.append(Q(**query))
+
+        return self.filter(reduce(operator.ior, filters))
+
     def get_filtered_entities(
         self, locale, query, rule, project=None, match_all=True, prefetch=None
     ):
@@ -2208,12 +2410,7 @@ class EntityQuerySet(models.QuerySet):
 
         """
         return ~Q(
-            pk__in=self.get_filtered_entities(
-                locale,
-                Q(approved=True) | Q(fuzzy=True),
-                lambda x: x.approved or x.fuzzy,
-                project=project,
-            )
+            pk__in=EntityLocaleStatus.objects.all_forms(locale, "approved_or_fuzzy")
         )
 
     def fuzzy(self, locale, project=None):
@@ -2227,14 +2424,7 @@ class EntityQuerySet(models.QuerySet):
         :returns: a django ORM Q object to use as a filter
 
         """
-        return Q(
-            pk__in=self.get_filtered_entities(
-                locale,
-                Q(fuzzy=True, warnings__isnull=True, errors__isnull=True),
-                lambda x: x.fuzzy,
-                project=project,
-            )
-        )
+        return Q(pk__in=EntityLocaleStatus.objects.all_forms(locale, "fuzzy"))
 
     def warnings(self, locale, project=None):
         """Return a filter to be used to select entities with translations with warnings.
@@ -2247,16 +2437,7 @@ class EntityQuerySet(models.QuerySet):
         :returns: a django ORM Q object to use as a filter
 
         """
-        return Q(
-            pk__in=self.get_filtered_entities(
-                locale,
-                Q(Q(Q(approved=True) | Q(fuzzy=True)) & Q(warnings__isnull=False)),
-                lambda x: (x.approved or x.fuzzy) and x.warnings.count(),
-                match_all=False,
-                prefetch=Prefetch("warnings"),
-                project=None,
-            )
-        )
+        return Q(pk__in=EntityLocaleStatus.objects.any_form(locale, "warnings"))
 
     def errors(self, locale, project=None):
         """Return a filter to be used to select entities with translations with errors.
@@ -2269,16 +2450,7 @@ class EntityQuerySet(models.QuerySet):
         :returns: a django ORM Q object to use as a filter
 
         """
-        return Q(
-            pk__in=self.get_filtered_entities(
-                locale,
-                Q(Q(Q(approved=True) | Q(fuzzy=True)) & Q(errors__isnull=False)),
-                lambda x: (x.approved or x.fuzzy) and x.errors.count(),
-                match_all=False,
-                prefetch=Prefetch("errors"),
-                project=project,
-            )
-        )
+        return Q(pk__in=EntityLocaleStatus.objects.any_form(locale, "errors"))
 
     def translated(self, locale, project):
         """Return a filter to be used to select entities marked as "approved".
@@ -2291,14 +2463,7 @@ class EntityQuerySet(models.QuerySet):
         :returns: a django ORM Q object to use as a filter
 
         """
-        return Q(
-            pk__in=self.get_filtered_entities(
-                locale,
-                Q(approved=True, warnings__isnull=True, errors__isnull=True),
-                lambda x: x.approved,
-                project=project,
-            )
-        )
+        return Q(pk__in=EntityLocaleStatus.objects.all_forms(locale, "approved"))
 
     def unreviewed(self, locale, project=None):
         """Return a filter to be used to select entities with suggested translations.
@@ -2311,15 +2476,7 @@ class EntityQuerySet(models.QuerySet):
         :returns: a django ORM Q object to use as a filter
 
         """
-        return Q(
-            pk__in=self.get_filtered_entities(
-                locale,
-                Q(approved=False, rejected=False, fuzzy=False),
-                lambda x: not x.approved and not x.rejected and not x.fuzzy,
-                match_all=False,
-                project=project,
-            )
-        )
+        return Q(pk__in=EntityLocaleStatus.objects.any_form(locale, "unreviewed"))
 
     def rejected(self, locale, project=None):
         """Return a filter to be used to select entities with rejected translations.
@@ -2332,15 +2489,7 @@ class EntityQuerySet(models.QuerySet):
         :returns: a django ORM Q object to use as a filter
 
         """
-        return Q(
-            pk__in=self.get_filtered_entities(
-                locale,
-                Q(rejected=True),
-                lambda x: x.rejected,
-                match_all=False,
-                project=None,
-            )
-        )
+        return Q(pk__in=EntityLocaleStatus.objects.any_form(locale, "rejected"))
 
     def empty(self, locale, project=None):
         """Return a filter to be used to select empty translations.
@@ -2537,87 +2686,15 @@ class Entity(DirtyFieldsMixin, models.Model):
         self.word_count = get_word_count(self.string)
         super(Entity, self).save(*args, **kwargs)
 
-    def get_stats(self, locale):
-        """
-        Get stats for a single (entity, locale) pair.
-
-        :arg Locale locale: filter translations for this locale.
-        :return: a dictionary with stats for an Entity, all keys are suffixed with `_diff` to
-            make them easier to pass into adjust_all_stats.
-        """
-        translations = list(
-            self.translation_set.filter(locale=locale).prefetch_related(
-                "errors", "warnings",
-            )
-        )
-
-        approved_strings_count = len(
-            [
-                t
-                for t in translations
-                if t.approved and not (t.errors.exists() or t.warnings.exists())
-            ]
-        )
-
-        fuzzy_strings_count = len(
-            [
-                t
-                for t in translations
-                if t.fuzzy and not (t.errors.exists() or t.warnings.exists())
-            ]
-        )
-
-        if self.string_plural:
-            approved = int(approved_strings_count == locale.nplurals)
-            fuzzy = int(fuzzy_strings_count == locale.nplurals)
-
-        else:
-            approved = int(approved_strings_count > 0)
-            fuzzy = int(fuzzy_strings_count > 0)
-
-        if not (approved or fuzzy):
-            has_errors = bool(
-                [
-                    t
-                    for t in translations
-                    if (t.approved or t.fuzzy) and t.errors.exists()
-                ]
-            )
-            has_warnings = bool(
-                [
-                    t
-                    for t in translations
-                    if (t.approved or t.fuzzy) and t.warnings.exists()
-                ]
-            )
-
-            errors = int(has_errors)
-            warnings = int(has_warnings)
-
-        else:
-            errors = 0
-            warnings = 0
-
-        unreviewed_count = len(
-            [t for t in translations if not (t.approved or t.fuzzy or t.rejected)]
-        )
-
-        return {
-            "total_strings_diff": 0,
-            "approved_strings_diff": approved,
-            "fuzzy_strings_diff": fuzzy,
-            "strings_with_errors_diff": errors,
-            "strings_with_warnings_diff": warnings,
-            "unreviewed_strings_diff": unreviewed_count,
-        }
-
     @classmethod
     def get_stats_diff(cls, stats_before, stats_after):
         """
         Return stat difference between the two states of the entity.
 
-        :arg dict stats_before: dict returned by get_stats() for the initial state.
-        :arg dict stats_after: dict returned by get_stats() for the current state.
+        :arg dict stats_before: dict returned by EntityLocaleStatus.get_stats()
+            for the initial state.
+        :arg dict stats_after: dict returned by EntityLocaleStatus.get_stats()
+            for the current state.
         :return: dictionary with differences between provided stats.
         """
         return {
@@ -2802,8 +2879,7 @@ class Entity(DirtyFieldsMixin, models.Model):
             search_query_list = [(s, locale.db_collation) for s in search_list]
 
             translation_filters = (
-                Q(translation__string__icontains_collate=search_query)
-                & Q(translation__locale=locale)
+                Q(string__icontains_collate=search_query)
                 for search_query in search_query_list
             )
             entity_filters = (
@@ -2822,22 +2898,64 @@ class Entity(DirtyFieldsMixin, models.Model):
             translation_query = reduce(operator.and_, translation_filters)
             entity_query = reduce(operator.and_, entity_filters)
 
-            translation_matches = entities.filter(translation_query).values_list(
-                "id", flat=True
-            )
-            entity_matches = entities.filter(entity_query).values_list("id", flat=True)
-            entities = Entity.objects.filter(
-                pk__in=set(list(translation_matches) + list(entity_matches))
+            # Both queries are served by trigram indexes of searched columns and
+            # evaluated in a single query, rather than fetching matching PKs.
+            translation_matches = (
+                Translation.objects.filter(locale=locale)
+                .filter(translation_query)
+                .values("entity")
             )
+            entities = entities.filter(Q(pk__in=translation_matches) | entity_query)
 
         if exclude_entities:
             entities = entities.exclude(pk__in=exclude_entities)
 
-        order_fields = ("resource__path", "order")
+        return entities.order_by(*Entity.get_order_fields(project))
+
+    @staticmethod
+    def get_order_fields(project):
+        """
+        Return fields Entities returned by `for_project_locale` are ordered by.
+
+        The fields uniquely identify each Entity, so they can also be used as
+        keys of keyset pagination.
+        """
+        order_fields = ("resource__path", "order", "pk")
         if project.slug == "all-projects":
             order_fields = ("resource__project__name",) + order_fields
 
-        return entities.order_by(*order_fields)
+        return order_fields
+
+    @staticmethod
+    def clean_cursor(order_fields, cursor):
+        """
+        Return values of a pagination cursor converted to types of the given
+        order fields.
+
+        :raises ValueError: if the cursor doesn't hold a valid value for each
+            of the order fields.
+        """
+        if len(cursor) != len(order_fields):
+            raise ValueError("Invalid cursor: {}".format(cursor))
+
+        values = []
+        for path, value in zip(order_fields, cursor):
+            model = Entity
+            *relations, name = path.split("__")
+            for relation in relations:
+                model = model._meta.get_field(relation).related_model
+
+            if value is None or isinstance(value, (list, dict)):
+                raise ValueError("Invalid cursor: {}".format(cursor))
+            field = model._meta.pk if name == "pk" else model._meta.get_field(name)
+            try:
+                value = field.to_python(value)
+                field.run_validators(value)
+            except ValidationError:
+                raise ValueError("Invalid cursor: {}".format(cursor))
+            values.append(value)
+
+        return values
 
     @classmethod
     def map_entities(
@@ -2906,6 +3024,27 @@ class Entity(DirtyFieldsMixin, models.Model):
         return entities_array
 
 
+class ChangedEntityLocaleQuerySet(models.QuerySet):
+    def bulk_mark_changed(self, entity_locales, batch_size=1000):
+        """
+        Mark the given entities as having changed translations in the given
+        locales since the last sync.
+
+        Pairs that are already marked are skipped by the database (ON CONFLICT
+        DO NOTHING), so existing marks don't need to be loaded first.
+
+        :arg entity_locales: iterable of (entity_pk, locale_pk) tuples.
+        """
+        self.bulk_create(
+            [
+                ChangedEntityLocale(entity_id=entity_pk, locale_id=locale_pk)
+                for entity_pk, locale_pk in set(entity_locales)
+            ],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+
+
 class ChangedEntityLocale(models.Model):
     """
     ManyToMany model for storing what locales have changed translations for a
@@ -2916,8 +3055,203 @@ class ChangedEntityLocale(models.Model):
     locale = models.ForeignKey(Locale, models.CASCADE)
     when = models.DateTimeField(default=timezone.now)
 
+    objects = ChangedEntityLocaleQuerySet.as_manager()
+
+    class Meta:
+        unique_together = ("entity", "locale")
+
+
+class EntityLocaleStatusQuerySet(models.QuerySet):
+    def refresh(self, entities, locales, batch_size=1000):
+        """
+        Re-calculate statuses of the given entities in the given locales.
+
+        Each status is calculated from all translations of the entity to the
+        locale. Entities without translations don't get a status.
+
+        Rows of the entities are locked until the end of the transaction, so
+        concurrent refreshes of the same entities run one after another and
+        each of them sees translations committed by the previous one.
+
+        :arg entities: list or queryset of entities or entity PKs.
+        :arg locales: iterable of Locale objects.
+        :return: a dict of stats diffs caused by the changed statuses, keyed by
+            (entity_pk, locale_pk) tuples, in the format of keyword arguments
+            of TranslatedResource.adjust_all_stats().
+        """
+        statuses = []
+        locales = list(locales)
+
+        if not isinstance(entities, models.QuerySet):
+            entities = [getattr(entity, "pk", entity) for entity in entities]
+
+        with transaction.atomic():
+            list(
+                Entity.objects.filter(pk__in=entities)
+                .order_by("pk")
+                .select_for_update()
+                .values_list("pk", flat=True)
+            )
+
+            old_statuses = {
+                (status.entity_id, status.locale_id): status
+                for status in self.filter(entity__in=entities, locale__in=locales)
+            }
+
+            for locale in locales:
+                translations = Translation.objects.filter(
+                    entity__in=entities, locale=locale
+                ).counted_in_stats([locale])
+
+                # Annotations are prefixed, because some of them share names
+                # with Translation fields.
+                rows = (
+                    translations.order_by()
+                    .values("entity", "entity__string_plural")
+                    .annotate(
+                        **{
+                            "status_"
+                            + field: EntityLocaleStatus.get_status_count(field, query)
+                            for field, query in EntityLocaleStatus.get_status_queries()
+                        }
+                    )
+                )
+
+                statuses += [
+                    EntityLocaleStatus(
+                        entity_id=row["entity"],
+                        locale=locale,
+                        plural_forms=(
+                            (locale.nplurals or 1)
+                            if row["entity__string_plural"]
+                            else 1
+                        ),
+                        **{
+                            field: row["status_" + field]
+                            for field, _ in EntityLocaleStatus.get_status_queries()
+                        },
+                    )
+                    for row in rows
+                ]
+
+            self.filter(pk__in=[status.pk for status in old_statuses.values()]).delete()
+            self.bulk_create(statuses, batch_size=batch_size)
+
+        new_statuses = {
+            (status.entity_id, status.locale_id): status for status in statuses
+        }
+        empty_stats = EntityLocaleStatus().get_stats()
+        stats_diffs = {}
+
+        for key in old_statuses.keys() | new_statuses.keys():
+            stats_before = (
+                old_statuses[key].get_stats() if key in old_statuses else empty_stats
+            )
+            stats_after = (
+                new_statuses[key].get_stats() if key in new_statuses else empty_stats
+            )
+            stats_diff = Entity.get_stats_diff(stats_before, stats_after)
+
+            if any(stats_diff.values()):
+                stats_diffs[key] = stats_diff
+
+        return stats_diffs
+
+    def all_forms(self, locale, field):
+        """
+        Return a queryset of PKs of entities, all plural forms of which match
+        the given status field in the given locale.
+        """
+        return self.filter(
+            locale=locale, **{field + "__gt": 0, field + "__gte": F("plural_forms")},
+        ).values("entity")
+
+    def any_form(self, locale, field):
+        """
+        Return a queryset of PKs of entities, at least one plural form of
+        which matches the given status field in the given locale.
+        """
+        return self.filter(locale=locale, **{field + "__gt": 0}).values("entity")
+
+
+class EntityLocaleStatus(models.Model):
+    """
+    Denormalized status of translations of an entity to a locale, used by
+    the status and extra filters of the Translate app.
+
+    Each field holds the number of plural forms of the entity (1 for entities
+    without plurals) that have a translation of the given kind, except for
+    `unreviewed`, which holds the number of unreviewed translations.
+    """
+
+    entity = models.ForeignKey(Entity, models.CASCADE, related_name="statuses")
+    locale = models.ForeignKey(Locale, models.CASCADE, related_name="entity_statuses")
+
+    #: Number of plural forms required to translate the entity
+    plural_forms = models.PositiveSmallIntegerField(default=1)
+
+    approved_or_fuzzy = models.PositiveSmallIntegerField(default=0)
+    approved = models.PositiveSmallIntegerField(default=0)
+    fuzzy = models.PositiveSmallIntegerField(default=0)
+    errors = models.PositiveSmallIntegerField(default=0)
+    warnings = models.PositiveSmallIntegerField(default=0)
+    unreviewed = models.PositiveSmallIntegerField(default=0)
+    rejected = models.PositiveSmallIntegerField(default=0)
+
+    objects = EntityLocaleStatusQuerySet.as_manager()
+
     class Meta:
         unique_together = ("entity", "locale")
+        index_together = (("locale", "entity"),)
+
+    @staticmethod
+    def get_status_count(field, query):
+        """
+        Return the aggregate counting translations of the given status field.
+
+        Unreviewed translations are counted one by one, the same way they're
+        counted in stats. Other fields count plural forms.
+        """
+        if field == "unreviewed":
+            return Count("pk", distinct=True, filter=query)
+
+        return Count(Coalesce("plural_form", Value(0)), distinct=True, filter=query)
+
+    def get_stats(self):
+        """
+        Return the contribution of the entity to stats of its TranslatedResource,
+        in the format of keyword arguments of TranslatedResource.adjust_all_stats().
+        """
+        approved = int(self.approved >= self.plural_forms)
+        fuzzy = int(self.fuzzy >= self.plural_forms)
+        checked = not (approved or fuzzy)
+
+        return {
+            "total_strings_diff": 0,
+            "approved_strings_diff": approved,
+            "fuzzy_strings_diff": fuzzy,
+            "strings_with_errors_diff": int(checked and self.errors > 0),
+            "strings_with_warnings_diff": int(checked and self.warnings > 0),
+            "unreviewed_strings_diff": self.unreviewed,
+        }
+
+    @staticmethod
+    def get_status_queries():
+        """
+        Return (field, query) pairs of translations counted in status fields.
+        """
+        no_failed_checks = Q(errors__isnull=True, warnings__isnull=True)
+        approved_or_fuzzy = Q(approved=True) | Q(fuzzy=True)
+
+        return (
+            ("approved_or_fuzzy", approved_or_fuzzy),
+            ("approved", Q(approved=True) & no_failed_checks),
+            ("fuzzy", Q(fuzzy=True) & no_failed_checks),
+            ("errors", approved_or_fuzzy & Q(errors__isnull=False)),
+            ("warnings", approved_or_fuzzy & Q(warnings__isnull=False)),
+            ("unreviewed", Q(approved=False, fuzzy=False, rejected=False)),
+            ("rejected", Q(rejected=True)),
+        )
 
 
 def extra_default():
@@ -2926,6 +3260,20 @@ def extra_default():
 
 
 class TranslationQuerySet(models.QuerySet):
+    def counted_in_stats(self, locales):
+        """
+        Filter translations counted in stats and entity statuses of the given
+        locales: translations of singular entities and of plural forms the
+        locale has. Locales without plural rules have one plural form.
+
+        :arg locales: iterable of Locale objects.
+        """
+        query = Q(entity__string_plural="")
+        for locale in locales:
+            query |= Q(locale=locale, plural_form__lt=locale.nplurals or 1)
+
+        return self.filter(query)
+
     def translated_resources(self, locale):
         return TranslatedResource.objects.filter(
             resource__entities__translation__in=self, locale=locale
@@ -2980,6 +3328,85 @@ class TranslationQuerySet(models.QuerySet):
 
         return translations
 
+    def stats_per_translated_resource(self):
+        """
+        Calculate stats of all (resource, locale) pairs the translations in the
+        queryset belong to.
+
+        Stats of singular entities are summed up in a single grouped query. Plural
+        entities are grouped per entity in another query, because an entity only
+        counts as approved or fuzzy if all of its plural forms are.
+
+        :return: a dict of stats, keyed by (resource_id, locale_id) tuples.
+        """
+        translations = self.filter(entity__obsolete=False).order_by()
+
+        locales = Locale.objects.filter(pk__in=translations.values("locale"))
+        nplurals = {locale.pk: locale.nplurals or 1 for locale in locales}
+        translations = translations.counted_in_stats(locales)
+
+        no_failed_checks = Q(errors__isnull=True, warnings__isnull=True)
+        approved_or_fuzzy = Q(approved=True) | Q(fuzzy=True)
+
+        counts = {
+            "approved_strings": Count(
+                "pk", distinct=True, filter=Q(approved=True) & no_failed_checks,
+            ),
+            "fuzzy_strings": Count(
+                "pk", distinct=True, filter=Q(fuzzy=True) & no_failed_checks
+            ),
+            "strings_with_errors": Count(
+                "pk", distinct=True, filter=approved_or_fuzzy & Q(errors__isnull=False),
+            ),
+            "strings_with_warnings": Count(
+                "pk",
+                distinct=True,
+                filter=approved_or_fuzzy & Q(warnings__isnull=False),
+            ),
+            "unreviewed_strings": Count(
+                "pk",
+                distinct=True,
+                filter=Q(approved=False, fuzzy=False, rejected=False),
+            ),
+        }
+
+        stats = defaultdict(lambda: dict.fromkeys(counts, 0))
+
+        # Singular
+        singular = (
+            translations.filter(entity__string_plural="")
+            .values("entity__resource", "locale")
+            .annotate(**counts)
+        )
+
+        for row in singular:
+            key = (row["entity__resource"], row["locale"])
+            for stat in counts:
+                stats[key][stat] += row[stat]
+
+        # Plural
+        plural = list(
+            translations.exclude(entity__string_plural="")
+            .values("entity", "entity__resource", "locale")
+            .annotate(**counts)
+        )
+
+        for row in plural:
+            key = (row["entity__resource"], row["locale"])
+
+            if row["approved_strings"] == nplurals[row["locale"]]:
+                stats[key]["approved_strings"] += 1
+            elif row["fuzzy_strings"] == nplurals[row["locale"]]:
+                stats[key]["fuzzy_strings"] += 1
+            elif row["strings_with_errors"]:
+                stats[key]["strings_with_errors"] += 1
+            elif row["strings_with_warnings"]:
+                stats[key]["strings_with_warnings"] += 1
+
+            stats[key]["unreviewed_strings"] += row["unreviewed_strings"]
+
+        return dict(stats)
+
 
 class Translation(DirtyFieldsMixin, models.Model):
     entity = models.ForeignKey(Entity, models.CASCADE)
@@ -3146,10 +3573,6 @@ class Translation(DirtyFieldsMixin, models.Model):
         return self.string
 
     def save(self, update_stats=True, failed_checks=None, *args, **kwargs):
-        # We parametrize update of stats to make testing easier.
-        if update_stats:
-            stats_before = self.entity.get_stats(self.locale)
-
         super(Translation, self).save(*args, **kwargs)
 
         project = self.entity.resource.project
@@ -3213,12 +3636,18 @@ class Translation(DirtyFieldsMixin, models.Model):
         if failed_checks is not None:
             save_failed_checks(self, failed_checks)
 
-        # We parametrize update of stats to make testing easier.
+        # Stats are adjusted by the difference between the old and the new
+        # status of the entity, AFTER changing approval status. Callers passing
+        # update_stats=False refresh statuses and recalculate stats themselves,
+        # e.g. once for a batch of translations.
         if update_stats:
-            # Update stats AFTER changing approval status.
-            stats_after = self.entity.get_stats(self.locale)
-            stats_diff = Entity.get_stats_diff(stats_before, stats_after)
-            translatedresource.adjust_all_stats(**stats_diff)
+            stats_diffs = EntityLocaleStatus.objects.refresh(
+                [self.entity_id], [self.locale]
+            )
+            if stats_diffs:
+                translatedresource.adjust_all_stats(
+                    **stats_diffs[(self.entity_id, self.locale_id)]
+                )
 
     def update_latest_translation(self):
         """
@@ -3333,6 +3762,9 @@ class Translation(DirtyFieldsMixin, models.Model):
 
 
 class TranslationMemoryEntryQuerySet(models.QuerySet):
+    # Minimal length of texts to look up in the trigram index of TM sources
+    TRIGRAM_MIN_LENGTH = 20
+
     def postgres_levenshtein_ratio(
         self, text, min_quality, min_dist, max_dist, levenshtein_param=None
     ):
@@ -3424,7 +3856,7 @@ class TranslationMemoryEntryQuerySet(models.QuerySet):
         entries = self.filter(pk__in=matches_pks,).annotate(
             quality=Case(
                 *quality_sql_map,
-                **dict(default=Value(0), output_field=models.DecimalField(),)
+                **dict(default=Value(0), output_field=models.DecimalField(),),
             )
         )
         return entries
@@ -3432,16 +3864,26 @@ class TranslationMemoryEntryQuerySet(models.QuerySet):
     def minimum_levenshtein_ratio(self, text, min_quality=0.7):
         """
         Returns entries that match minimal levenshtein_ratio
+
+        For texts of at least TRIGRAM_MIN_LENGTH characters, only entries found
+        in the trigram index of the source column, i.e. sharing enough trigrams
+        with the text (pg_trgm.similarity_threshold), are scored, instead of all
+        entries of similar length. Trigrams of shorter texts are too few to tell
+        similar strings apart.
         """
         # Only check entities with similar length
         length = len(text)
         min_dist = int(math.ceil(max(length * min_quality, 2)))
         max_dist = int(math.floor(min(length / min_quality, 1000)))
 
-        get_matches = self.postgres_levenshtein_ratio
+        candidates = self
+        if length >= self.TRIGRAM_MIN_LENGTH:
+            candidates = self.filter(source__trigram_similar=text)
+
+        get_matches = candidates.postgres_levenshtein_ratio
 
         if min_dist > 255 or max_dist > 255:
-            get_matches = self.python_levenshtein_ratio
+            get_matches = candidates.python_levenshtein_ratio
 
         return get_matches(text, min_quality, min_dist, max_dist,)
 
@@ -3521,28 +3963,31 @@ class TranslatedResourceQuerySet(models.QuerySet):
 
         return translated_resources.aggregated_stats()
 
-    def update_stats(self):
-        """
-        Update stats on a list of TranslatedResource.
+    def calculate_stats(self):
         """
-        self = self.prefetch_related("resource__project", "locale")
+        Re-calculate stats of all TranslatedResources in the queryset, without
+        aggregating stats of the corresponding projects and locales.
 
-        locales = Locale.objects.filter(translatedresources__in=self,).distinct()
-
-        projects = Project.objects.filter(
-            resources__translatedresources__in=self,
-        ).distinct()
+        :return: a list of updated TranslatedResources.
+        """
+        translated_resources = list(self.select_related("resource", "locale"))
 
-        projectlocales = ProjectLocale.objects.filter(
-            project__resources__translatedresources__in=self,
-            locale__translatedresources__in=self,
-        ).distinct()
+        stats = Translation.objects.filter(
+            entity__resource__in={tr.resource_id for tr in translated_resources},
+            locale__in={tr.locale_id for tr in translated_resources},
+        ).stats_per_translated_resource()
 
-        for translated_resource in self:
-            translated_resource.calculate_stats(save=False)
+        for translated_resource in translated_resources:
+            translated_resource.calculate_stats(
+                save=False,
+                stats=stats.get(
+                    (translated_resource.resource_id, translated_resource.locale_id),
+                    {},
+                ),
+            )
 
         TranslatedResource.objects.bulk_update(
-            list(self),
+            translated_resources,
             fields=[
                 "total_strings",
                 "approved_strings",
@@ -3553,6 +3998,29 @@ class TranslatedResourceQuerySet(models.QuerySet):
             ],
         )
 
+        ProjectLocale.invalidate_parts_stats(
+            {(tr.resource.project_id, tr.locale_id) for tr in translated_resources}
+        )
+
+        return translated_resources
+
+    def update_stats(self):
+        """
+        Update stats on a list of TranslatedResource.
+        """
+        locales = Locale.objects.filter(translatedresources__in=self,).distinct()
+
+        projects = Project.objects.filter(
+            resources__translatedresources__in=self,
+        ).distinct()
+
+        projectlocales = ProjectLocale.objects.filter(
+            project__resources__translatedresources__in=self,
+            locale__translatedresources__in=self,
+        ).distinct()
+
+        self.calculate_stats()
+
         for project in projects:
             project.aggregate_stats()
 
@@ -3590,116 +4058,71 @@ class TranslatedResource(AggregatedStats):
     class Meta(object):
         unique_together = (("locale", "resource"),)
 
-    def adjust_all_stats(self, *args, **kwargs):
-        project = self.resource.project
-        locale = self.locale
+    def adjust_all_stats(
+        self,
+        total_strings_diff,
+        approved_strings_diff,
+        fuzzy_strings_diff,
+        strings_with_errors_diff,
+        strings_with_warnings_diff,
+        unreviewed_strings_diff,
+    ):
+        """
+        Adjust stats of the TranslatedResource and the corresponding Project,
+        Locale and ProjectLocale.
 
-        project_locale = utils.get_object_or_none(
-            ProjectLocale, project=project, locale=locale,
+        Inside batch_stats_updates() blocks adjustments are deferred and merged
+        with other adjustments of the same rows.
+        """
+        project = self.resource.project
+        diffs = dict(
+            zip(
+                StatsDiffs.FIELDS,
+                (
+                    total_strings_diff,
+                    approved_strings_diff,
+                    fuzzy_strings_diff,
+                    strings_with_errors_diff,
+                    strings_with_warnings_diff,
+                    unreviewed_strings_diff,
+                ),
+            )
         )
 
-        self.adjust_stats(*args, **kwargs)
-        project.adjust_stats(*args, **kwargs)
+        with batch_stats_updates() as stats_diffs:
+            stats_diffs.add(TranslatedResource, {"pk": self.pk}, diffs)
+            stats_diffs.add(Project, {"pk": project.pk}, diffs)
 
-        if not project.system_project:
-            locale.adjust_stats(*args, **kwargs)
+            if not project.system_project:
+                stats_diffs.add(Locale, {"pk": self.locale_id}, diffs)
+
+            stats_diffs.add(
+                ProjectLocale, {"project": project.pk, "locale": self.locale_id}, diffs,
+            )
 
-        if project_locale:
-            project_locale.adjust_stats(*args, **kwargs)
+    def calculate_stats(self, save=True, stats=None):
+        """
+        Update stats, including denormalized ones.
 
-    def calculate_stats(self, save=True):
-        """Update stats, including denormalized ones."""
+        :arg dict stats: stats of this TranslatedResource, as returned by
+            TranslationQuerySet.stats_per_translated_resource(). Calculated
+            if not provided.
+        """
         resource = self.resource
         locale = self.locale
 
-        entity_ids = Translation.objects.filter(locale=locale).values("entity")
-        translated_entities = Entity.objects.filter(
-            pk__in=entity_ids, resource=resource, obsolete=False
-        )
-
-        # Singular
-        translations = Translation.objects.filter(
-            entity__in=translated_entities.filter(string_plural=""), locale=locale,
-        )
-
-        approved = translations.filter(
-            approved=True, errors__isnull=True, warnings__isnull=True,
-        ).count()
-
-        fuzzy = translations.filter(
-            fuzzy=True, errors__isnull=True, warnings__isnull=True,
-        ).count()
-
-        errors = (
-            translations.filter(
-                Q(Q(Q(approved=True) | Q(fuzzy=True)) & Q(errors__isnull=False)),
-            )
-            .distinct()
-            .count()
-        )
-
-        warnings = (
-            translations.filter(
-                Q(Q(Q(approved=True) | Q(fuzzy=True)) & Q(warnings__isnull=False)),
+        if stats is None:
+            stats = (
+                Translation.objects.filter(entity__resource=resource, locale=locale)
+                .stats_per_translated_resource()
+                .get((resource.pk, locale.pk), {})
             )
-            .distinct()
-            .count()
-        )
-
-        unreviewed = translations.filter(
-            approved=False, fuzzy=False, rejected=False,
-        ).count()
-
-        # Plural
-        nplurals = locale.nplurals or 1
-        for e in translated_entities.exclude(string_plural="").values_list("pk"):
-            translations = Translation.objects.filter(entity_id=e, locale=locale,)
-
-            plural_approved_count = translations.filter(
-                approved=True, errors__isnull=True, warnings__isnull=True,
-            ).count()
-
-            plural_fuzzy_count = translations.filter(
-                fuzzy=True, errors__isnull=True, warnings__isnull=True,
-            ).count()
-
-            if plural_approved_count == nplurals:
-                approved += 1
-            elif plural_fuzzy_count == nplurals:
-                fuzzy += 1
-            else:
-                plural_errors_count = (
-                    translations.filter(
-                        Q(
-                            Q(Q(approved=True) | Q(fuzzy=True))
-                            & Q(errors__isnull=False)
-                        ),
-                    )
-                    .distinct()
-                    .count()
-                )
-
-                plural_warnings_count = (
-                    translations.filter(
-                        Q(
-                            Q(Q(approved=True) | Q(fuzzy=True))
-                            & Q(warnings__isnull=False)
-                        ),
-                    )
-                    .distinct()
-                    .count()
-                )
-
-                if plural_errors_count:
-                    errors += 1
-                elif plural_warnings_count:
-                    warnings += 1
 
-            plural_unreviewed_count = translations.filter(
-                approved=False, fuzzy=False, rejected=False
-            ).count()
-            if plural_unreviewed_count:
-                unreviewed += plural_unreviewed_count
+        approved = stats.get("approved_strings", 0)
+        fuzzy = stats.get("fuzzy_strings", 0)
+        errors = stats.get("strings_with_errors", 0)
+        warnings = stats.get("strings_with_warnings", 0)
+        unreviewed = stats.get("unreviewed_strings", 0)
 
         if not save:
             self.total_strings = resource.total_strings
@@ -3,17 +3,30 @@ from guardian.models import GroupObjectPermission
 from django.contrib.auth.models import User, Group, Permission
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models.signals import post_save, pre_save, post_delete, pre_delete
+from django.db.models.signals import (
+    m2m_changed,
+    post_save,
+    pre_save,
+    post_delete,
+    pre_delete,
+)
 from django.dispatch import receiver
 
 from pontoon.base import errors
 from pontoon.base.models import (
+    batch_stats_updates,
+    EntityLocaleStatus,
     Locale,
     Project,
     ProjectLocale,
+    Resource,
+    Subpage,
     TranslatedResource,
+    Translation,
     UserProfile,
 )
+from pontoon.checks.models import Error, Warning
+from pontoon.checks.utils import in_bulk_failed_checks_changes
 
 
 @receiver(post_delete, sender=ProjectLocale)
@@ -204,3 +217,78 @@ def assign_project_locale_group_permissions(sender, **kwargs):
 def create_user_profile(sender, instance, created, **kwargs):
     if created:
         UserProfile.objects.create(user=instance)
+
+
+@receiver(post_save, sender=Resource)
+@receiver(post_delete, sender=Resource)
+@receiver(post_save, sender=Subpage)
+@receiver(post_delete, sender=Subpage)
+def invalidate_parts_stats(sender, instance, **kwargs):
+    """
+    Resource paths and deadlines and subpages are part of Locale.parts_stats(),
+    so invalidate its cache for all locales of the project.
+    """
+    project_pk = instance.project_id
+    ProjectLocale.invalidate_parts_stats(
+        (project_pk, locale_pk)
+        for locale_pk in ProjectLocale.objects.filter(project=project_pk).values_list(
+            "locale", flat=True
+        )
+    )
+
+
+@receiver(post_save, sender=TranslatedResource)
+@receiver(post_delete, sender=TranslatedResource)
+def translated_resource_changed(sender, instance, **kwargs):
+    ProjectLocale.invalidate_parts_stats(
+        [(instance.resource.project_id, instance.locale_id)]
+    )
+
+
+@receiver(m2m_changed, sender=Subpage.resources.through)
+def subpage_resources_changed(sender, instance, action, **kwargs):
+    # Instance is either a Subpage or a Resource, both belong to a project
+    if action.startswith("post_"):
+        invalidate_parts_stats(sender, instance)
+
+
+@receiver(post_save, sender=Error)
+@receiver(post_save, sender=Warning)
+@receiver(post_delete, sender=Error)
+@receiver(post_delete, sender=Warning)
+def failed_check_changed(sender, instance, **kwargs):
+    """
+    Refresh status of the translated entity and adjust stats by the change
+    when a failed check is saved or deleted individually. Bulk operations
+    refresh statuses themselves.
+    """
+    if in_bulk_failed_checks_changes():
+        return
+
+    # The translation is gone if the failed check is deleted along with it
+    translation = (
+        Translation.objects.filter(pk=instance.translation_id)
+        .select_related("entity", "locale")
+        .first()
+    )
+    if translation is None:
+        return
+
+    with batch_stats_updates():
+        stats_diffs = EntityLocaleStatus.objects.refresh(
+            [translation.entity_id], [translation.locale]
+        )
+        if not stats_diffs:
+            return
+
+        translated_resource = (
+            TranslatedResource.objects.filter(
+                resource=translation.entity.resource_id, locale=translation.locale
+            )
+            .select_related("resource__project")
+            .first()
+        )
+        if translated_resource is not None:
+            translated_resource.adjust_all_stats(
+                **stats_diffs[(translation.entity_id, translation.locale_id)]
+            )
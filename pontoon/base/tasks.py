@@ -1,8 +1,22 @@
+import logging
 import sys
+import time
 
-from celery import Task
+from celery import shared_task, Task
+
+from django.core.cache import cache
 
 from pontoon.base.errors import send_exception
+from pontoon.base.models import (
+    Entity,
+    EntityLocaleStatus,
+    Locale,
+    Project,
+    TranslatedResource,
+)
+
+
+log = logging.getLogger(__name__)
 
 
 class PontoonTask(Task):
@@ -15,3 +29,83 @@ class PontoonTask(Task):
         # but inspect can't process their custom class.
         _, _, traceback = sys.exc_info()
         send_exception(exc, exc_info=(einfo.type, exc, traceback))
+
+
+def calculate_stats_checkpoint_key(project_pk):
+    """
+    Cache key marking that stats of the given project have been recalculated
+    by the `calculate_stats` management command.
+    """
+    return "calculate_stats:project={}".format(project_pk)
+
+
+def calculate_stats_error_key(project_pk):
+    """
+    Cache key holding the error that failed recalculation of stats of the given
+    project by the `calculate_stats` management command.
+    """
+    return "calculate_stats:error:project={}".format(project_pk)
+
+
+@shared_task(base=PontoonTask)
+def calculate_project_stats(project_pk):
+    """
+    Re-calculate stats of all TranslatedResources of the given project, locale
+    by locale, and aggregate stats of the project and its ProjectLocales once
+    at the end.
+
+    Stats of locales are not aggregated, because they span multiple projects.
+    Statuses of all entities of the project are refreshed too, to repair ones
+    that got out of sync with translations.
+
+    Errors are stored in the cache before they're raised, so the management
+    command waiting for the task can report them.
+
+    :arg int project_pk: primary key of the project.
+    :return: number of TranslatedResources updated.
+    """
+    try:
+        return _calculate_project_stats(project_pk)
+    except Exception as e:
+        cache.set(
+            calculate_stats_error_key(project_pk),
+            "{}: {}".format(type(e).__name__, e),
+            timeout=None,
+        )
+        raise
+
+
+def _calculate_project_stats(project_pk):
+    start = time.time()
+    project = Project.objects.get(pk=project_pk)
+    translated_resources = TranslatedResource.objects.filter(resource__project=project)
+
+    count = 0
+    locales = Locale.objects.filter(
+        pk__in=translated_resources.values("locale").distinct()
+    )
+    for locale in locales:
+        EntityLocaleStatus.objects.refresh(
+            Entity.objects.filter(resource__project=project), [locale]
+        )
+        count += len(translated_resources.filter(locale=locale).calculate_stats())
+
+    for project_locale in project.project_locale.all():
+        project_locale.aggregate_stats()
+
+    project.aggregate_stats()
+
+    duration = time.time() - start
+    cache.set(calculate_stats_checkpoint_key(project_pk), count, timeout=None)
+
+    log.info(
+        u'Calculated stats for project "{project}": {count} translated resources '
+        u"in {duration:.1f}s ({rate:.1f}/s).".format(
+            project=project.name,
+            count=count,
+            duration=duration,
+            rate=count / duration if duration else count,
+        )
+    )
+
+    return count
@@ -0,0 +1,108 @@
+from unittest.mock import patch
+
+import pytest
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from pontoon.base.models import TranslatedResource
+from pontoon.base.tasks import (
+    calculate_project_stats,
+    calculate_stats_checkpoint_key,
+    calculate_stats_error_key,
+)
+
+
+@pytest.fixture
+def translated_resource_a(translation_a):
+    translation_a.approved = True
+    translation_a.save(update_stats=False)
+
+    return TranslatedResource.objects.get(
+        resource=translation_a.entity.resource, locale=translation_a.locale,
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("celery", (False, True))
+def test_cmd_calculate_stats(translated_resource_a, celery):
+    call_command("calculate_stats", celery=celery, poll_interval=0)
+
+    translated_resource_a.refresh_from_db()
+    assert translated_resource_a.approved_strings == 1
+
+    project = translated_resource_a.resource.project
+    project.refresh_from_db()
+    assert project.approved_strings == 1
+
+    locale = translated_resource_a.locale
+    locale.refresh_from_db()
+    assert locale.approved_strings == 1
+
+    assert cache.get(calculate_stats_checkpoint_key(project.pk)) == 1
+
+
+@pytest.mark.django_db
+def test_cmd_calculate_stats_resume(translated_resource_a):
+    project = translated_resource_a.resource.project
+    cache.set(calculate_stats_checkpoint_key(project.pk), 1)
+
+    call_command("calculate_stats", resume=True)
+
+    # Stats of a project completed by a previous run aren't recalculated
+    assert (
+        TranslatedResource.objects.get(pk=translated_resource_a.pk).approved_strings
+        == 0
+    )
+
+    call_command("calculate_stats")
+
+    assert (
+        TranslatedResource.objects.get(pk=translated_resource_a.pk).approved_strings
+        == 1
+    )
+
+
+@pytest.mark.django_db
+def test_calculate_project_stats_error(translated_resource_a):
+    project = translated_resource_a.resource.project
+
+    with patch(
+        "pontoon.base.tasks._calculate_project_stats",
+        side_effect=ValueError("Broken project"),
+    ):
+        with pytest.raises(ValueError):
+            calculate_project_stats(project.pk)
+
+    assert (
+        cache.get(calculate_stats_error_key(project.pk)) == "ValueError: Broken project"
+    )
+
+
+@pytest.mark.django_db
+def test_cmd_calculate_stats_celery_error(translated_resource_a):
+    project = translated_resource_a.resource.project
+
+    def apply_async():
+        cache.set(calculate_stats_error_key(project.pk), "ValueError: Broken")
+
+    # Other tasks never report back, e.g. workers don't share the cache
+    with patch("pontoon.base.management.commands.calculate_stats.group") as group:
+        group.return_value.apply_async.side_effect = apply_async
+
+        with pytest.raises(CommandError, match=r"failed for 1 and timed out for \d+"):
+            call_command("calculate_stats", celery=True, poll_interval=0, timeout=0)
+
+    # Stats of locales aren't aggregated after failures
+    locale = translated_resource_a.locale
+    locale.refresh_from_db()
+    assert locale.approved_strings == 0
+
+
+@pytest.mark.django_db
+def test_cmd_calculate_stats_celery_local_cache(settings, translated_resource_a):
+    settings.CELERY_ALWAYS_EAGER = False
+
+    with pytest.raises(CommandError, match="LocMemCache"):
+        call_command("calculate_stats", celery=True)
@@ -92,3 +92,29 @@ def test_levenshtein_ratio_python_with_too_long_string(tm_entry_long):
         (tm_entry_long.pk, tm_entry_long.source, tm_entry_long.target, 100),
     ]
     assert python_results == expected_results
+
+
+@pytest.mark.django_db
+def test_levenshtein_ratio_trigram_candidates():
+    """
+    Only entries sharing trigrams with long enough texts are scored.
+    """
+    similar = TranslationMemoryFactory.create(
+        source=u"Save the document before closing",
+    )
+    TranslationMemoryFactory.create(
+        locale=similar.locale, source=u"Lorem ipsum dolor sit amet, consectetur",
+    )
+    entries = TranslationMemoryEntry.objects.filter(
+        locale=similar.locale
+    ).minimum_levenshtein_ratio(u"Save this document before closing")
+
+    assert " % " in str(entries.query)
+    assert list(entries.values_list("pk", flat=True)) == [similar.pk]
+
+
+@pytest.mark.django_db
+def test_levenshtein_ratio_short_text_without_trigrams(tm_entry_short):
+    entries = TranslationMemoryEntry.objects.minimum_levenshtein_ratio(u"a" * 19)
+
+    assert " % " not in str(entries.query)
@@ -1,6 +1,6 @@
 import pytest
 
-from pontoon.base.models import Entity, Project
+from pontoon.base.models import ChangedEntityLocale, Entity, Project
 from pontoon.test.factories import (
     EntityFactory,
     ResourceFactory,
@@ -180,6 +180,34 @@ def test_reset_active_translation_fuzzy_and_unreviewed(
     assert entity.reset_active_translation(locale) == translation_a
 
 
+@pytest.mark.django_db
+def test_bulk_mark_changed(
+    django_assert_num_queries, entity_a, entity_b, locale_a, locale_b
+):
+    """
+    Only pairs that aren't marked as changed yet are inserted, in one query.
+    """
+    entity_a.mark_changed(locale_a)
+    changed = ChangedEntityLocale.objects.get()
+
+    with django_assert_num_queries(1):
+        ChangedEntityLocale.objects.bulk_mark_changed(
+            [
+                (entity_a.pk, locale_a.pk),
+                (entity_a.pk, locale_b.pk),
+                (entity_b.pk, locale_a.pk),
+                (entity_b.pk, locale_a.pk),
+            ]
+        )
+
+    assert set(ChangedEntityLocale.objects.values_list("entity", "locale")) == {
+        (entity_a.pk, locale_a.pk),
+        (entity_a.pk, locale_b.pk),
+        (entity_b.pk, locale_a.pk),
+    }
+    assert ChangedEntityLocale.objects.get(pk=changed.pk).when == changed.when
+
+
 @pytest.mark.django_db
 def test_reset_term_translation(locale_a):
     """
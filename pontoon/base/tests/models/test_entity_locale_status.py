@@ -0,0 +1,194 @@
+import pytest
+
+from pontoon.base.models import (
+    Entity,
+    EntityLocaleStatus,
+    TranslatedResource,
+    Translation,
+)
+from pontoon.checks.models import Error
+from pontoon.base.tasks import calculate_project_stats
+from pontoon.test.factories import (
+    EntityFactory,
+    TranslatedResourceFactory,
+    TranslationFactory,
+)
+
+
+@pytest.mark.django_db
+def test_entity_locale_status_plural_forms(resource_a, locale_a):
+    """
+    Status fields count plural forms with translations of the given kind.
+    """
+    locale_a.cldr_plurals = "1,5"
+    locale_a.save()
+    entity = EntityFactory.create(
+        resource=resource_a, string="entity", string_plural="plural"
+    )
+
+    TranslationFactory.create(
+        locale=locale_a, entity=entity, plural_form=0, approved=True
+    )
+    TranslationFactory.create(locale=locale_a, entity=entity, plural_form=0)
+    TranslationFactory.create(locale=locale_a, entity=entity, plural_form=1)
+
+    status = EntityLocaleStatus.objects.get(entity=entity, locale=locale_a)
+    assert status.plural_forms == 2
+    assert status.approved == 1
+    assert status.unreviewed == 2
+    assert set(resource_a.entities.filter(Entity.objects.missing(locale_a))) == {entity}
+
+    TranslationFactory.create(
+        locale=locale_a, entity=entity, plural_form=1, approved=True
+    )
+
+    status = EntityLocaleStatus.objects.get(entity=entity, locale=locale_a)
+    assert status.approved == 2
+    assert status.unreviewed == 1
+    assert set(resource_a.entities.filter(Entity.objects.missing(locale_a))) == set()
+    assert set(
+        Entity.objects.filter(Entity.objects.translated(locale_a, resource_a.project))
+    ) == {entity}
+
+
+@pytest.mark.django_db
+def test_entity_locale_status_unreviewed(resource_a, locale_a, entity_a):
+    """
+    Unreviewed translations are counted one by one, the way stats count them.
+    """
+    TranslationFactory.create(locale=locale_a, entity=entity_a)
+    TranslationFactory.create(locale=locale_a, entity=entity_a)
+
+    status = EntityLocaleStatus.objects.get(entity=entity_a, locale=locale_a)
+    assert status.unreviewed == 2
+    assert status.get_stats()["unreviewed_strings_diff"] == 2
+
+
+@pytest.mark.django_db
+def test_entity_locale_status_refresh_stats_diffs(resource_a, locale_a, entity_a):
+    """
+    Refreshing statuses returns stats diffs of the changed entities only.
+    """
+    entity_b = EntityFactory.create(resource=resource_a, string="entity b")
+    translation = TranslationFactory.create(locale=locale_a, entity=entity_a)
+    TranslationFactory.create(locale=locale_a, entity=entity_b)
+
+    Translation.objects.filter(pk=translation.pk).update(approved=True)
+
+    assert EntityLocaleStatus.objects.refresh([entity_a, entity_b], [locale_a]) == {
+        (entity_a.pk, locale_a.pk): {
+            "total_strings_diff": 0,
+            "approved_strings_diff": 1,
+            "fuzzy_strings_diff": 0,
+            "strings_with_errors_diff": 0,
+            "strings_with_warnings_diff": 0,
+            "unreviewed_strings_diff": -1,
+        }
+    }
+
+
+@pytest.mark.django_db
+def test_entity_locale_status_calculate_project_stats(resource_a, locale_a, entity_a):
+    """
+    Statuses are repaired by the calculate_stats task, e.g. after translations
+    are updated in bulk.
+    """
+    TranslatedResourceFactory.create(resource=resource_a, locale=locale_a)
+    TranslationFactory.create(locale=locale_a, entity=entity_a, approved=True)
+
+    Translation.objects.filter(entity=entity_a).update(approved=False, rejected=True)
+    assert set(Entity.objects.filter(Entity.objects.rejected(locale_a))) == set()
+
+    calculate_project_stats(resource_a.project.pk)
+    assert set(Entity.objects.filter(Entity.objects.rejected(locale_a))) == {entity_a}
+    assert set(resource_a.entities.filter(Entity.objects.missing(locale_a))) == {
+        entity_a
+    }
+
+
+def get_stats(translated_resource):
+    translated_resource.refresh_from_db()
+    return {
+        field: getattr(translated_resource, field)
+        for field in (
+            "approved_strings",
+            "fuzzy_strings",
+            "strings_with_errors",
+            "strings_with_warnings",
+            "unreviewed_strings",
+        )
+    }
+
+
+def assert_stats_recalculated(translated_resource):
+    """
+    Stats adjusted by status changes equal stats calculated from scratch.
+    """
+    stats = get_stats(translated_resource)
+    translated_resource.calculate_stats()
+    assert get_stats(translated_resource) == stats
+    return stats
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("cldr_plurals", ("", "1,5"))
+def test_entity_locale_status_plural_stats(
+    resource_a, locale_a, project_locale_a, cldr_plurals
+):
+    """
+    Statuses count the same plural forms as stats, also for locales without
+    plural rules, which have one plural form.
+    """
+    locale_a.cldr_plurals = cldr_plurals
+    locale_a.save()
+    translated_resource = TranslatedResourceFactory.create(
+        resource=resource_a, locale=locale_a
+    )
+    entity = EntityFactory.create(
+        resource=resource_a, string="entity", string_plural="plural"
+    )
+
+    for plural_form in range(locale_a.nplurals or 1):
+        translation = TranslationFactory.create(
+            locale=locale_a, entity=entity, plural_form=plural_form, approved=True
+        )
+    assert assert_stats_recalculated(translated_resource)["approved_strings"] == 1
+
+    # Plural forms the locale doesn't have aren't counted
+    TranslationFactory.create(locale=locale_a, entity=entity, plural_form=5)
+    assert assert_stats_recalculated(translated_resource)["unreviewed_strings"] == 0
+
+    translation.save()
+    assert assert_stats_recalculated(translated_resource)["approved_strings"] == 1
+
+
+@pytest.mark.django_db
+def test_entity_locale_status_translation_saved_without_stats(locale_a, entity_a):
+    """
+    Saving a translation with update_stats=False leaves statuses alone.
+    """
+    Translation(locale=locale_a, entity=entity_a, string="T").save(update_stats=False)
+    assert not EntityLocaleStatus.objects.filter(entity=entity_a).exists()
+
+
+@pytest.mark.django_db
+def test_entity_locale_status_failed_check_changed(translation_a):
+    """
+    Stats are adjusted when a failed check is saved or deleted individually.
+    """
+    translated_resource = TranslatedResource.objects.get(
+        resource=translation_a.entity.resource, locale=translation_a.locale
+    )
+    translation_a.approved = True
+    translation_a.save()
+    assert get_stats(translated_resource)["approved_strings"] == 1
+
+    error = Error.objects.create(
+        translation=translation_a, library="p", message="error"
+    )
+    stats = assert_stats_recalculated(translated_resource)
+    assert (stats["approved_strings"], stats["strings_with_errors"]) == (0, 1)
+
+    error.delete()
+    stats = assert_stats_recalculated(translated_resource)
+    assert (stats["approved_strings"], stats["strings_with_errors"]) == (1, 0)
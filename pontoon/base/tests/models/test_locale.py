@@ -2,13 +2,16 @@ from unittest.mock import patch
 
 import pytest
 
-from pontoon.base.models import ProjectLocale
+from django.core.cache import cache
+
+from pontoon.base.models import ProjectLocale, TranslatedResource
 from pontoon.test.factories import (
     EntityFactory,
     LocaleFactory,
     ResourceFactory,
     SubpageFactory,
     TranslatedResourceFactory,
+    TranslationFactory,
 )
 
 
@@ -184,3 +187,50 @@ def test_locale_parts_stats_pages_tied_to_resources(locale_parts):
     assert details0[1]["unreviewed_strings"] == 0
     assert detailsX[0]["title"] == "Other Subpage"
     assert detailsX[0]["unreviewed_strings"] == 0
+
+
+@pytest.mark.django_db
+def test_locale_parts_stats_cached(django_assert_num_queries, locale_parts):
+    """
+    Parts stats are cached until stats or resources of the project change.
+    """
+    locale_a, locale_b, entity_a = locale_parts
+    project = entity_a.resource.project
+    details = locale_a.parts_stats(project)
+
+    with django_assert_num_queries(0):
+        assert locale_a.parts_stats(project) == details
+
+    # Stats change
+    TranslationFactory.create(locale=locale_a, entity=entity_a)
+    entity_a.resource.translatedresources.get(locale=locale_a).calculate_stats()
+    details = locale_a.parts_stats(project)
+    assert details[0]["unreviewed_strings"] == 1
+
+    # Subpages change
+    SubpageFactory.create(project=project, name="Subpage")
+    details = locale_a.parts_stats(project)
+    assert details[0]["title"] == "Subpage"
+
+
+@pytest.mark.django_db
+def test_locale_parts_stats_invalidated_on_commit(locale_parts):
+    """
+    Parts stats cached by other processes before stats changed in a transaction
+    are committed are invalidated on commit.
+    """
+    locale_a, locale_b, entity_a = locale_parts
+    project = entity_a.resource.project
+    translated_resource = entity_a.resource.translatedresources.get(locale=locale_a)
+    key = ProjectLocale.parts_stats_cache_key(project.pk, locale_a.pk)
+
+    with patch("pontoon.base.models.transaction.on_commit") as on_commit:
+        TranslationFactory.create(locale=locale_a, entity=entity_a)
+        TranslatedResource.objects.filter(pk=translated_resource.pk).calculate_stats()
+        cache.set(key, [])
+
+    # Commit
+    for call in on_commit.call_args_list:
+        call[0][0]()
+
+    assert locale_a.parts_stats(project)[0]["unreviewed_strings"] == 1
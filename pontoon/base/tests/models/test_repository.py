@@ -4,6 +4,7 @@ from unittest.mock import call, patch, Mock
 import pytest
 from urllib.parse import urlparse
 
+from pontoon.sync.vcs.repositories import PullFromRepositoryException
 from pontoon.test.factories import ProjectLocaleFactory
 
 
@@ -127,6 +128,7 @@ def test_repo_pull(repo_git):
         "pontoon.base.models.get_revision"
     ) as m_get_revision:
         repo_git.url = "https://example.com"
+        repo_git.git_clone = "shallow"
         m_get_revision.return_value = "asdf"
         assert repo_git.pull() == {"single_locale": "asdf"}
         assert m_update_from_vcs.call_args[0] == (
@@ -135,10 +137,11 @@ def test_repo_pull(repo_git):
             repo_git.checkout_path,
             u"",
         )
+        assert m_update_from_vcs.call_args[1]["git_clone"] == "shallow"
 
 
 @pytest.mark.django_db
-def test_repo_pull_multi_locale(project_locale_a, repo_git, locale_b):
+def test_repo_pull_multi_locale(project_locale_a, repo_git, locale_b, settings):
     """
     If the repo is multi-locale, pull all of the repos for the
     active locales.
@@ -147,6 +150,7 @@ def test_repo_pull_multi_locale(project_locale_a, repo_git, locale_b):
     ProjectLocaleFactory.create(
         project=repo_git.project, locale=locale_b,
     )
+    settings.SYNC_PULL_TIMEOUT = 60
 
     with patch("pontoon.base.models.update_from_vcs") as m_update_from_vcs:
         with patch("pontoon.base.models.get_revision") as m_get_revision:
@@ -161,20 +165,53 @@ def test_repo_pull_multi_locale(project_locale_a, repo_git, locale_b):
                 locale_a.code: "/media/%s" % locale_a.code,
                 locale_b.code: "/media/%s" % locale_b.code,
             }
-            assert m_update_from_vcs.call_args_list == [
-                call(
-                    "git",
-                    "https://example.com/%s" % locale_b.code,
-                    "/media/%s" % locale_b.code,
-                    "",
-                ),
-                call(
-                    "git",
-                    "https://example.com/%s" % locale_a.code,
-                    "/media/%s" % locale_a.code,
-                    "",
-                ),
-            ]
+
+            # Locale repos are pulled concurrently, in no particular order
+            assert m_update_from_vcs.call_count == 2
+            m_update_from_vcs.assert_has_calls(
+                [
+                    call(
+                        "git",
+                        "https://example.com/%s" % locale.code,
+                        "/media/%s" % locale.code,
+                        "",
+                        timeout=60,
+                        git_clone="full",
+                    )
+                    for locale in (locale_a, locale_b)
+                ],
+                any_order=True,
+            )
+
+
+@pytest.mark.django_db
+def test_repo_pull_multi_locale_error(project_locale_a, repo_git, locale_b):
+    """
+    A failed pull of one locale repo doesn't affect pulls of the other
+    locale repos.
+    """
+    locale_a = project_locale_a.locale
+    ProjectLocaleFactory.create(
+        project=repo_git.project, locale=locale_b,
+    )
+
+    def update_from_vcs(type, url, path, branch, **options):
+        if path.endswith(locale_a.code):
+            raise PullFromRepositoryException("Connection refused")
+
+    with patch(
+        "pontoon.base.models.update_from_vcs", side_effect=update_from_vcs
+    ), patch("pontoon.base.models.get_revision", return_value="asdf"), patch(
+        "pontoon.base.models.log"
+    ) as m_log:
+        repo_git.url = "https://example.com/{locale_code}/"
+        repo_git.locale_checkout_path = lambda locale: "/media/%s" % locale.code
+
+        assert repo_git.pull() == {locale_b.code: "asdf"}
+        m_log.error.assert_called_once_with(
+            "GIT Pull Error for https://example.com/%s/: Connection refused"
+            % locale_a.code
+        )
 
 
 @pytest.mark.django_db
@@ -2,11 +2,23 @@
 Test consistency of calculations between `calculate_stats` and `translation.save()`.
 """
 import pytest
-from pontoon.base.models import TranslatedResource
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from pontoon.base.models import (
+    batch_stats_updates,
+    TranslatedResource,
+)
 from pontoon.checks.models import (
     Error,
     Warning,
 )
+from pontoon.test.factories import (
+    EntityFactory,
+    TranslatedResourceFactory,
+    TranslationFactory,
+)
 
 
 @pytest.fixture
@@ -188,3 +200,137 @@ def test_translation_with_warning(stats_update, get_stats, translation_with_warn
         "warnings": 0,
         "errors": 0,
     }
+
+
+@pytest.fixture
+def plural_entity(resource_a, locale_a):
+    locale_a.cldr_plurals = "1,5"
+    locale_a.save()
+
+    resource_a.total_strings = 2
+    resource_a.save()
+
+    return EntityFactory.create(
+        resource=resource_a, string="entity", string_plural="entities",
+    )
+
+
+@pytest.mark.django_db
+def test_plural_translations(get_stats, translation_a, plural_entity):
+    translation_a.approved = True
+    translation_a.save(update_stats=False)
+
+    plural_translations = [
+        TranslationFactory.create(
+            entity=plural_entity,
+            locale=translation_a.locale,
+            plural_form=plural_form,
+            approved=True,
+        )
+        for plural_form in (0, 1)
+    ]
+    TranslatedResource.objects.filter(
+        resource=translation_a.entity.resource, locale=translation_a.locale,
+    ).update_stats()
+
+    assert get_stats(translation_a) == {
+        "total": 2,
+        "approved": 2,
+        "fuzzy": 0,
+        "unreviewed": 0,
+        "warnings": 0,
+        "errors": 0,
+    }
+
+    # A plural entity with one of the plural forms missing is not approved.
+    plural_translations[1].approved = False
+    plural_translations[1].save(update_stats=False)
+    Error.objects.create(
+        translation=plural_translations[0], library="p", message="error"
+    )
+    recalculate_stats(translation_a)
+
+    assert get_stats(translation_a) == {
+        "total": 2,
+        "approved": 1,
+        "fuzzy": 0,
+        "unreviewed": 1,
+        "warnings": 0,
+        "errors": 1,
+    }
+
+
+@pytest.mark.django_db
+def test_update_stats_multiple_translated_resources(translation_a, locale_b, entity_b):
+    TranslatedResourceFactory.create(resource=entity_b.resource, locale=locale_b)
+    TranslationFactory.create(entity=entity_b, locale=locale_b, fuzzy=True)
+    translation_a.approved = True
+    translation_a.save(update_stats=False)
+
+    translated_resources = TranslatedResource.objects.filter(
+        resource__in=[translation_a.entity.resource, entity_b.resource],
+    )
+    translated_resources.update_stats()
+
+    assert {
+        (tr.resource, tr.locale): (tr.approved_strings, tr.fuzzy_strings)
+        for tr in translated_resources
+    } == {
+        (translation_a.entity.resource, translation_a.locale): (1, 0),
+        (entity_b.resource, locale_b): (0, 1),
+    }
+
+
+@pytest.mark.django_db
+def test_batch_stats_updates(get_stats, translation_a, locale_a):
+    translations = [translation_a] + [
+        TranslationFactory.create(
+            entity=EntityFactory.create(resource=translation_a.entity.resource),
+            locale=locale_a,
+        )
+        for i in range(2)
+    ]
+    translated_resource = TranslatedResource.objects.get(
+        resource=translation_a.entity.resource, locale=locale_a,
+    )
+    translated_resource.calculate_stats()
+
+    with CaptureQueriesContext(connection) as queries:
+        with batch_stats_updates():
+            for translation in translations:
+                translation.approved = True
+                translation.save()
+
+            # Adjustments are deferred until the end of the block
+            assert get_stats(translation_a)["approved"] == 0
+
+    stats = get_stats(translation_a)
+    assert stats["approved"] == 3
+    assert stats["unreviewed"] == 0
+
+    # One update per TranslatedResource, Project, Locale and ProjectLocale
+    stats_updates = [
+        query
+        for query in queries.captured_queries
+        if query["sql"].startswith("UPDATE") and "approved_strings" in query["sql"]
+    ]
+    assert len(stats_updates) == 4
+
+
+@pytest.mark.django_db
+def test_batch_stats_updates_error(get_stats, translation_a):
+    translated_resource = TranslatedResource.objects.get(
+        resource=translation_a.entity.resource, locale=translation_a.locale,
+    )
+    translated_resource.calculate_stats()
+
+    with pytest.raises(ValueError):
+        with batch_stats_updates():
+            translation_a.approved = True
+            translation_a.save()
+            raise ValueError
+
+    # The saved translation is reflected in stats
+    stats = get_stats(translation_a)
+    assert stats["approved"] == 1
+    assert stats["unreviewed"] == 0
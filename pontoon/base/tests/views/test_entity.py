@@ -3,11 +3,16 @@ from unittest.mock import patch
 
 import pytest
 
-from pontoon.base.models import Entity, TranslatedResource
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from pontoon.base import utils
+from pontoon.base.models import Comment, Entity, TranslatedResource
 from pontoon.test.factories import (
     EntityFactory,
     ProjectLocaleFactory,
     TranslatedResourceFactory,
+    TranslationFactory,
 )
 
 
@@ -120,3 +125,205 @@ def test_view_entity_exclude_entities(
     assert [e["pk"] for e in json.loads(response.content)["entities"]] == [
         entities[0].pk
     ]
+
+
+@pytest.mark.django_db
+def test_view_entity_cursor(
+    member, resource_a, locale_a,
+):
+    """
+    Following cursors should return all entities in order, page by page.
+    """
+    TranslatedResource.objects.create(resource=resource_a, locale=locale_a)
+    ProjectLocaleFactory.create(project=resource_a.project, locale=locale_a)
+    entities = EntityFactory.create_batch(size=5, resource=resource_a)
+    params = {
+        "project": resource_a.project.slug,
+        "locale": locale_a.code,
+        "paths[]": [resource_a.path],
+        "limit": 2,
+    }
+
+    pages = []
+    has_next = True
+    while has_next:
+        response = member.client.post(
+            "/get-entities/", params, HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+        )
+        assert response.status_code == 200
+        content = json.loads(response.content)
+        pages.append([e["pk"] for e in content["entities"]])
+        has_next = content["has_next"]
+        params["cursor"] = content["cursor"]
+
+    assert pages == [
+        [entities[0].pk, entities[1].pk],
+        [entities[2].pk, entities[3].pk],
+        [entities[4].pk],
+    ]
+    assert params["cursor"] is None
+
+
+@pytest.mark.django_db
+def test_view_entity_cursor_search(
+    member, resource_a, locale_a,
+):
+    """
+    Pages should only contain entities matching the filters, including the
+    requested entity added to the first page.
+    """
+    TranslatedResource.objects.create(resource=resource_a, locale=locale_a)
+    ProjectLocaleFactory.create(project=resource_a.project, locale=locale_a)
+    entities = [
+        EntityFactory.create(resource=resource_a, string=string)
+        for string in ("match 0", "other", "match 1", "match 2", "other")
+    ]
+    params = {
+        "project": resource_a.project.slug,
+        "locale": locale_a.code,
+        "paths[]": [resource_a.path],
+        "search": "match",
+        "entity": entities[3].pk,
+        "limit": 1,
+    }
+
+    response = member.client.post(
+        "/get-entities/", params, HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+    )
+    assert response.status_code == 200
+    content = json.loads(response.content)
+    assert [e["pk"] for e in content["entities"]] == [entities[0].pk, entities[3].pk]
+    assert content["has_next"] is True
+
+    params["cursor"] = content["cursor"]
+    response = member.client.post(
+        "/get-entities/", params, HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+    )
+    content = json.loads(response.content)
+    assert [e["pk"] for e in content["entities"]] == [entities[2].pk]
+
+
+@pytest.mark.django_db
+def test_view_entity_invalid_cursor(
+    member, resource_a, locale_a,
+):
+    params = {
+        "project": resource_a.project.slug,
+        "locale": locale_a.code,
+        "paths[]": [resource_a.path],
+    }
+
+    cursors = [
+        "invalid",
+        utils.encode_cursor(["path", 1]),
+        utils.encode_cursor(["path", "order", 1]),
+        utils.encode_cursor(["path", 1, "pk"]),
+        utils.encode_cursor(["path", 1, None]),
+        utils.encode_cursor(["path", [1], 1]),
+        utils.encode_cursor(["path", 1, 2 ** 63]),
+    ]
+    for cursor in cursors:
+        params["cursor"] = cursor
+        response = member.client.post(
+            "/get-entities/", params, HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+        )
+        assert response.status_code == 400
+
+
+@pytest.fixture
+def entities_with_history(resource_a, locale_a, locale_b, user_a, user_b):
+    ProjectLocaleFactory.create(project=resource_a.project, locale=locale_a)
+    ProjectLocaleFactory.create(project=resource_a.project, locale=locale_b)
+    entities = EntityFactory.create_batch(size=3, resource=resource_a)
+
+    for entity in entities:
+        for user in (user_a, user_b):
+            translation = TranslationFactory.create(
+                entity=entity, locale=locale_a, user=user
+            )
+            Comment.objects.create(
+                translation=translation, author=user, content="Comment"
+            )
+
+        TranslationFactory.create(entity=entity, locale=locale_b, approved=True)
+
+    return entities
+
+
+def _get_json(client, url, params):
+    response = client.get(url, params, HTTP_X_REQUESTED_WITH="XMLHttpRequest")
+    assert response.status_code == 200
+    return json.loads(response.content)
+
+
+@pytest.mark.django_db
+def test_view_translation_history_batch(member, locale_a, entities_with_history):
+    """
+    Batched history should match history of individual entities and take
+    the same number of queries regardless of the number of entities.
+    """
+    pks = [e.pk for e in entities_with_history]
+    payload = _get_json(
+        member.client,
+        "/get-history-batch/",
+        {"entities": ",".join(map(str, pks)), "locale": locale_a.code},
+    )
+
+    for pk in pks:
+        history = _get_json(
+            member.client,
+            "/get-history/",
+            {"entity": pk, "locale": locale_a.code, "plural_form": -1},
+        )
+        assert len(history) == 2
+        assert [
+            {k: v for k, v in t.items() if k != "plural_form"} for t in payload[str(pk)]
+        ] == history
+
+    query_counts = []
+    for size in (1, len(pks)):
+        with CaptureQueriesContext(connection) as queries:
+            _get_json(
+                member.client,
+                "/get-history-batch/",
+                {"entities": ",".join(map(str, pks[:size])), "locale": locale_a.code},
+            )
+        query_counts.append(len(queries))
+
+    assert query_counts[0] == query_counts[1]
+
+
+@pytest.mark.django_db
+def test_view_translations_from_other_locales_batch(
+    member, locale_a, entities_with_history
+):
+    """
+    Batched translations from other locales should match translations of
+    individual entities and take the same number of queries regardless of
+    the number of entities.
+    """
+    pks = [e.pk for e in entities_with_history]
+    payload = _get_json(
+        member.client,
+        "/other-locales-batch/",
+        {"entities": ",".join(map(str, pks)), "locale": locale_a.code},
+    )
+
+    for pk in pks:
+        translations = _get_json(
+            member.client, "/other-locales/", {"entity": pk, "locale": locale_a.code},
+        )
+        assert len(translations["other"]) == 1
+        assert payload[str(pk)] == translations
+
+    query_counts = []
+    for size in (1, len(pks)):
+        with CaptureQueriesContext(connection) as queries:
+            _get_json(
+                member.client,
+                "/other-locales-batch/",
+                {"entities": ",".join(map(str, pks[:size])), "locale": locale_a.code},
+            )
+        query_counts.append(len(queries))
+
+    assert query_counts[0] == query_counts[1]
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
+import gzip
 import os
+import time
 from datetime import datetime
 
 import pytest
@@ -7,7 +9,11 @@ from lxml import etree
 
 from django.urls import reverse
 
-from pontoon.base.utils import build_translation_memory_file
+from pontoon.base.utils import (
+    build_translation_memory_file,
+    write_translation_memory_file,
+)
+from pontoon.test.factories import TranslationFactory, TranslationMemoryFactory
 
 
 def _check_xml(xml_content, expected_xml=None, dtd_path=None):
@@ -48,6 +54,82 @@ def test_view_tmx_bad_params(client, entity_a, locale_a, settings_debug):
     assert response.status_code == 404
 
 
+@pytest.fixture
+def tm_entry_a(entity_a, locale_a):
+    translation = TranslationFactory.create(
+        entity=entity_a, locale=locale_a, string="translation a", approved=True,
+    )
+    return TranslationMemoryFactory.create(
+        entity=entity_a,
+        locale=locale_a,
+        source=entity_a.string,
+        target=translation.string,
+        translation=translation,
+        project=entity_a.resource.project,
+    )
+
+
+@pytest.fixture
+def tmx_files_root(settings, tmpdir):
+    settings.TMX_FILES_ROOT = str(tmpdir)
+    return settings.TMX_FILES_ROOT
+
+
+@pytest.mark.django_db
+def test_view_tmx_all_projects_gzip(client, tm_entry_a, locale_a):
+    """Gzipped TMX files are built on the fly if there's no precomputed file."""
+    url = reverse("pontoon.download_tmx", args=(locale_a.code, "all-projects"))
+    response = client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+    assert response.status_code == 200
+    assert response["Content-Encoding"] == "gzip"
+
+    content = gzip.decompress(b"".join(response.streaming_content))
+    _check_xml(content)
+    assert b"translation a" in content
+
+
+@pytest.mark.django_db
+def test_view_tmx_precomputed_file(client, tm_entry_a, locale_a, tmx_files_root):
+    """Fresh precomputed TMX files are served as they are."""
+    path = write_translation_memory_file(locale_a)
+    assert path.startswith(tmx_files_root)
+
+    # Not included in the precomputed file
+    tm_entry_a.target = "changed translation"
+    tm_entry_a.save()
+
+    url = reverse("pontoon.download_tmx", args=(locale_a.code, "all-projects"))
+
+    response = client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+    assert response["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response["Vary"]
+    assert b"".join(response.streaming_content) == open(path, "rb").read()
+
+    response = client.get(url)
+    assert not response.has_header("Content-Encoding")
+    content = b"".join(response.streaming_content)
+    _check_xml(content)
+    assert b"translation a" in content
+
+    # Stale precomputed files are ignored
+    old = time.time() - 60 * 60 * 48
+    os.utime(path, (old, old))
+
+    response = client.get(url)
+    assert b"changed translation" in b"".join(response.streaming_content)
+
+
+def test_view_tmx_chunks():
+    """Entries are rendered in chunks of the given size."""
+    entries = [("path", "key", "source", "target", "Project", "project")] * 5
+    chunks = list(build_translation_memory_file(datetime(2010, 1, 1), "sl", entries, 2))
+
+    # Header, 3 chunks of entries and footer
+    assert len(chunks) == 5
+    assert chunks[1].count("<tu ") == 2
+    assert chunks[3].count("<tu ") == 1
+
+
 def test_view_tmx_empty_file():
     data_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data",)
     filepath = "tmx/no_entries.tmx"
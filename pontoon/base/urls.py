@@ -60,6 +60,11 @@ urlpatterns = [
     path("get-users/", views.get_users, name="pontoon.get_users"),
     path("perform-checks/", views.perform_checks, name="pontoon.perform.checks"),
     path("get-history/", views.get_translation_history, name="pontoon.get_history"),
+    path(
+        "get-history-batch/",
+        views.get_translation_history_batch,
+        name="pontoon.get_history_batch",
+    ),
     path(
         "get-team-comments/", views.get_team_comments, name="pontoon.get_team_comments",
     ),
@@ -71,6 +76,11 @@ urlpatterns = [
         views.get_translations_from_other_locales,
         name="pontoon.other_locales",
     ),
+    path(
+        "other-locales-batch/",
+        views.get_translations_from_other_locales_batch,
+        name="pontoon.other_locales_batch",
+    ),
     path(
         "translations/",
         views.download_translations,
@@ -1,6 +1,10 @@
+import base64
+import binascii
 import codecs
 import functools
+import gzip
 import io
+import json
 import os
 import re
 
@@ -17,7 +21,8 @@ from guardian.decorators import permission_required as guardian_permission_requi
 from urllib.parse import urljoin
 from xml.sax.saxutils import escape, quoteattr
 
-from django.db.models import Prefetch
+from django.conf import settings
+from django.db.models import Prefetch, Q
 from django.db.models.query import QuerySet
 from django.http import HttpResponseBadRequest
 from django.shortcuts import get_object_or_404
@@ -27,12 +32,37 @@ from django.utils.translation import trans_real
 
 UNUSABLE_SEARCH_CHAR = "☠"
 
+# Number of entries fetched from the database and rendered at once in TMX files
+TMX_CHUNK_SIZE = 1000
+
 
 def split_ints(s):
     """Splits string by comma and maps items to the integer."""
     return [int(part) for part in (s or "").split(",") if part]
 
 
+def encode_cursor(values):
+    """Encode a list of JSON-serializable values into an opaque cursor string."""
+    return base64.urlsafe_b64encode(json.dumps(values).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor string created by `encode_cursor`.
+
+    :raises ValueError: if the cursor is malformed.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (binascii.Error, UnicodeError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor: {}".format(e))
+
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor: {}".format(cursor))
+
+    return values
+
+
 def get_project_locale_from_request(request, locales):
     """Get Pontoon locale from Accept-language request header."""
 
@@ -278,7 +308,7 @@ def get_download_content(slug, code, part):
                 locale_path = temp.name
 
         # Update file from database
-        resource_file = formats.parse(locale_path, source_path)
+        resource_file = formats.parse(locale_path, source_path, cache=False)
         entities_dict = {}
         entities_qs = Entity.objects.filter(
             changedentitylocale__locale=locale,
@@ -360,7 +390,7 @@ def handle_upload_content(slug, code, part, f, user):
         for chunk in f.chunks():
             temp.write(chunk)
         temp.flush()
-        resource_file = formats.parse(temp.name)
+        resource_file = formats.parse(temp.name, cache=False)
 
     # Update database objects from file
     changeset = ChangeSet(
@@ -423,17 +453,9 @@ def handle_upload_content(slug, code, part, f, user):
     TranslatedResource.objects.get(resource=resource, locale=locale).calculate_stats()
 
     # Mark translations as changed
-    changed_entities = {}
-    existing = ChangedEntityLocale.objects.values_list("entity", "locale").distinct()
-    for t in changeset.changed_translations:
-        key = (t.entity.pk, t.locale.pk)
-        # Remove duplicate changes to prevent unique constraint violation
-        if key not in existing:
-            changed_entities[key] = ChangedEntityLocale(
-                entity=t.entity, locale=t.locale
-            )
-
-    ChangedEntityLocale.objects.bulk_create(changed_entities.values())
+    ChangedEntityLocale.objects.bulk_mark_changed(
+        (t.entity_id, t.locale_id) for t in changeset.changed_translations
+    )
 
     # Update latest translation
     if changeset.translations_to_create:
@@ -493,7 +515,37 @@ def get_last_months(n):
         start_date += relativedelta(months=-1)
 
 
-def build_translation_memory_file(creation_date, locale_code, entries):
+def get_translation_memory_file_entries(locale, project=None):
+    """
+    Return values of Translation Memory entries for the TMX file of the given
+    locale, in the format expected by build_translation_memory_file().
+
+    :arg Locale locale: locale of the TMX file.
+    :arg Project project: project of the TMX file, all projects if not set.
+    """
+    from pontoon.base.models import TranslationMemoryEntry
+
+    tm_entries = (
+        TranslationMemoryEntry.objects.filter(locale=locale, translation__isnull=False)
+        .exclude(Q(source="") | Q(target=""))
+        .exclude(translation__approved=False, translation__fuzzy=False)
+    )
+    if project is not None:
+        tm_entries = tm_entries.filter(project=project)
+
+    return tm_entries.values_list(
+        "entity__resource__path",
+        "entity__key",
+        "source",
+        "target",
+        "project__name",
+        "project__slug",
+    ).order_by("project__slug", "source")
+
+
+def build_translation_memory_file(
+    creation_date, locale_code, entries, chunk_size=TMX_CHUNK_SIZE
+):
     """
     TMX files will contain large amount of entries and it's impossible to render all the data with
     django templates. Rendering a string in memory is a lot faster.
@@ -506,6 +558,8 @@ def build_translation_memory_file(creation_date, locale_code, entries):
                          * target - translated string,
                          * project_name - name of a project,
                          * project_slug - slugified name of a project,
+    :arg int chunk_size: number of entries rendered into a single chunk, so
+        that e.g. gzip compression of the stream isn't flushed after each entry.
     """
     yield (
         u'<?xml version="1.0" encoding="UTF-8"?>'
@@ -522,9 +576,10 @@ def build_translation_memory_file(creation_date, locale_code, entries):
         u"\n\t</header>"
         u"\n\t<body>" % {"creation_date": creation_date.isoformat()}
     )
+    chunk = []
     for resource_path, key, source, target, project_name, project_slug in entries:
         tuid = ":".join((project_slug, resource_path, slugify(key)))
-        yield (
+        chunk.append(
             u'\n\t\t<tu tuid=%(tuid)s srclang="en-US">'
             u'\n\t\t\t<tuv xml:lang="en-US">'
             u"\n\t\t\t\t<seg>%(source)s</seg>"
@@ -542,9 +597,73 @@ def build_translation_memory_file(creation_date, locale_code, entries):
             }
         )
 
+        if len(chunk) >= chunk_size:
+            yield u"".join(chunk)
+            chunk = []
+
+    if chunk:
+        yield u"".join(chunk)
+
     yield (u"\n\t</body>" u"\n</tmx>\n")
 
 
+def translation_memory_file_path(locale_code):
+    """
+    Path of the precomputed, gzipped TMX file of all projects of the given locale.
+    """
+    return os.path.join(
+        settings.TMX_FILES_ROOT, "{code}.all-projects.tmx.gz".format(code=locale_code)
+    )
+
+
+def get_fresh_translation_memory_file(locale_code):
+    """
+    Return path of the precomputed TMX file of the given locale, or None if the
+    file doesn't exist or is older than settings.TMX_FILE_MAX_AGE.
+    """
+    path = translation_memory_file_path(locale_code)
+
+    try:
+        modified = os.path.getmtime(path)
+    except OSError:
+        return None
+
+    if time.time() - modified > settings.TMX_FILE_MAX_AGE:
+        return None
+
+    return path
+
+
+def write_translation_memory_file(locale):
+    """
+    Precompute the gzipped TMX file of all projects of the given locale.
+
+    The file is written next to its final path first and then moved into
+    place, so that a file being written is never served.
+    """
+    path = translation_memory_file_path(locale.code)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    entries = get_translation_memory_file_entries(locale).iterator(
+        chunk_size=TMX_CHUNK_SIZE
+    )
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f, gzip.open(f, "wt", encoding="utf-8") as tmx:
+            for chunk in build_translation_memory_file(
+                datetime.now(), locale.code, entries
+            ):
+                tmx.write(chunk)
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    return path
+
+
 def get_m2m_changes(current_qs, new_qs):
     """
     Get difference between states of a many to many relation.
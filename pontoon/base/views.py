@@ -1,3 +1,4 @@
+import gzip
 import logging
 import re
 
@@ -9,10 +10,10 @@ from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.models import User
-from django.core.paginator import Paginator, EmptyPage
 from django.db import transaction
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 from django.http import (
+    FileResponse,
     Http404,
     HttpResponse,
     HttpResponseForbidden,
@@ -21,6 +22,7 @@ from django.http import (
 )
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
+from django.utils.cache import patch_vary_headers
 from django.utils.datastructures import MultiValueDictKeyError
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
@@ -37,7 +39,6 @@ from pontoon.base.models import (
     Locale,
     Project,
     ProjectLocale,
-    TranslationMemoryEntry,
     TranslatedResource,
     Translation,
     Comment,
@@ -205,27 +206,45 @@ def _get_paginated_entities(locale, preferred_source_locale, project, form, enti
     """Return a paginated list of entities.
 
     This is used by the regular mode of the Translate page.
+
+    Entities are paginated by keyset: each page ends with a cursor, holding
+    values of the order fields of its last entity, which is used to fetch
+    the following page. That makes every page cost the same, regardless of
+    its position.
     """
-    paginator = Paginator(entities, form.cleaned_data["limit"])
+    limit = form.cleaned_data["limit"]
+    cursor = form.cleaned_data["cursor"]
+    order_fields = Entity.get_order_fields(project)
+
+    if cursor is not None:
+        try:
+            cursor = Entity.clean_cursor(order_fields, cursor)
+        except ValueError:
+            return JsonResponse(
+                {"status": False, "message": "Bad Request: Invalid cursor"}, status=400,
+            )
+        entities = entities.after(order_fields, cursor)
 
-    try:
-        entities_page = paginator.page(1)
-    except EmptyPage:
-        return JsonResponse({"has_next": False, "stats": {}})
+    # Fetch one more row than needed to find out if there is a next page
+    rows = list(entities.values_list(*order_fields)[: limit + 1])
+    has_next = len(rows) > limit
+    rows = rows[:limit]
 
-    has_next = entities_page.has_next()
-    entities_to_map = entities_page.object_list
+    entities_to_map_pks = [row[-1] for row in rows]
 
     # If requested entity not on the first page
-    if form.cleaned_data["entity"]:
+    if form.cleaned_data["entity"] and cursor is None:
         entity_pk = form.cleaned_data["entity"]
-        entities_to_map_pks = [e.pk for e in entities_to_map]
 
-        # TODO: entities_to_map.values_list() doesn't return entities from selected page
         if entity_pk not in entities_to_map_pks:
-            if entity_pk in entities.values_list("pk", flat=True):
+            if entities.filter(pk=entity_pk).exists():
                 entities_to_map_pks.append(entity_pk)
-                entities_to_map = entities.filter(pk__in=entities_to_map_pks)
+
+    # Entities of the page are already known, so map them by their primary
+    # keys rather than by evaluating the filtered query again.
+    entities_to_map = Entity.objects.filter(pk__in=entities_to_map_pks).order_by(
+        *order_fields
+    )
 
     return JsonResponse(
         {
@@ -233,6 +252,7 @@ def _get_paginated_entities(locale, preferred_source_locale, project, form, enti
                 locale, preferred_source_locale, entities_to_map, []
             ),
             "has_next": has_next,
+            "cursor": utils.encode_cursor(rows[-1]) if has_next else None,
             "stats": TranslatedResource.objects.stats(
                 project, form.cleaned_data["paths"], locale
             ),
@@ -313,29 +333,74 @@ def entities(request):
     )
 
 
-def _serialize_translation_values(query):
-    translations = query.values(
-        "locale__pk",
-        "locale__code",
-        "locale__name",
-        "locale__direction",
-        "locale__script",
-        "string",
+def _serialize_translation_value(translation):
+    return {
+        "locale": {
+            "pk": translation["locale__pk"],
+            "code": translation["locale__code"],
+            "name": translation["locale__name"],
+            "direction": translation["locale__direction"],
+            "script": translation["locale__script"],
+        },
+        "translation": translation["string"],
+    }
+
+
+def _get_translations_from_other_locales(user, entities, locale):
+    """
+    Get approved translations of given entities to all but given locale.
+
+    Translations of all entities are retrieved with a single query and
+    returned as a dict of {entity_pk: {"preferred": [...], "other": [...]}}.
+    """
+    translations = (
+        Translation.objects.filter(entity__in=entities, approved=True)
+        .filter(
+            Q(entity__string_plural="", plural_form=None)
+            | (~Q(entity__string_plural="") & Q(plural_form=0))
+        )
+        .exclude(locale=locale)
+        .order_by("locale__name")
+        .values(
+            "entity",
+            "locale__pk",
+            "locale__code",
+            "locale__name",
+            "locale__direction",
+            "locale__script",
+            "string",
+        )
     )
 
-    return [
-        {
-            "locale": {
-                "pk": translation["locale__pk"],
-                "code": translation["locale__code"],
-                "name": translation["locale__name"],
-                "direction": translation["locale__direction"],
-                "script": translation["locale__script"],
-            },
-            "translation": translation["string"],
-        }
-        for translation in translations
-    ]
+    if user.is_authenticated:
+        locales_order = user.profile.locales_order
+        preferred_source_locale = user.profile.preferred_source_locale
+    else:
+        locales_order = []
+        preferred_source_locale = False
+
+    payload = {entity.pk: {"preferred": [], "other": []} for entity in entities}
+
+    for translation in translations:
+        key = "preferred" if translation["locale__pk"] in locales_order else "other"
+        payload[translation["entity"]][key].append(
+            _serialize_translation_value(translation)
+        )
+
+    if preferred_source_locale:
+        # TODO: De-hardcode as part of bug 1328879.
+        source_locale = Locale.objects.get(code="en-US").serialize()
+
+    for entity in entities:
+        preferred = payload[entity.pk]["preferred"]
+        preferred.sort(key=lambda t: locales_order.index(t["locale"]["pk"]))
+
+        if preferred_source_locale:
+            preferred.insert(
+                0, {"locale": source_locale, "translation": entity.string},
+            )
+
+    return payload
 
 
 @utils.require_AJAX
@@ -352,74 +417,56 @@ def get_translations_from_other_locales(request):
 
     entity = get_object_or_404(Entity, pk=entity)
     locale = get_object_or_404(Locale, code=locale)
-    plural_form = None if entity.string_plural == "" else 0
 
-    translations = (
-        Translation.objects.filter(
-            entity=entity, plural_form=plural_form, approved=True,
-        )
-        .exclude(locale=locale)
-        .order_by("locale__name")
-    )
+    payload = _get_translations_from_other_locales(request.user, [entity], locale)
 
-    if request.user.is_authenticated:
-        preferred_locales = request.user.profile.preferred_locales
-        preferred = translations.filter(locale__in=preferred_locales)
-        other = translations.exclude(locale__in=preferred_locales)
-
-        preferred_translations = sorted(
-            _serialize_translation_values(preferred),
-            key=lambda t: request.user.profile.locales_order.index(t["locale"]["pk"]),
-        )
-
-        if request.user.profile.preferred_source_locale:
-            # TODO: De-hardcode as part of bug 1328879.
-            preferred_translations.insert(
-                0,
-                {
-                    "locale": Locale.objects.get(code="en-US").serialize(),
-                    "translation": entity.string,
-                },
-            )
-    else:
-        other = translations
-        preferred_translations = []
-
-    other_translations = _serialize_translation_values(other)
-
-    payload = {
-        "preferred": preferred_translations,
-        "other": other_translations,
-    }
-
-    return JsonResponse(payload, safe=False)
+    return JsonResponse(payload[entity.pk], safe=False)
 
 
 @utils.require_AJAX
-def get_translation_history(request):
-    """Get history of translations of given entity to given locale."""
+def get_translations_from_other_locales_batch(request):
+    """
+    Get translations of multiple entities for all but specified locale.
+
+    Returns a dict of payloads of `get_translations_from_other_locales`,
+    keyed by entity PK.
+    """
     try:
-        entity = int(request.GET["entity"])
+        entities = utils.split_ints(request.GET["entities"])
         locale = request.GET["locale"]
-        plural_form = int(request.GET["plural_form"])
     except (MultiValueDictKeyError, ValueError) as e:
         return JsonResponse(
             {"status": False, "message": "Bad Request: {error}".format(error=e)},
             status=400,
         )
 
-    entity = get_object_or_404(Entity, pk=entity)
+    entities = list(Entity.objects.filter(pk__in=entities))
     locale = get_object_or_404(Locale, code=locale)
 
-    translations = Translation.objects.filter(
-        entity=entity, locale=locale,
-    ).prefetch_related("comments")
+    payload = _get_translations_from_other_locales(request.user, entities, locale)
 
-    if plural_form != -1:
-        translations = translations.filter(plural_form=plural_form)
-    translations = translations.order_by("-active", "rejected", "-date")
+    return JsonResponse(payload, safe=False)
 
-    payload = []
+
+def _serialize_translation_history(translations):
+    """
+    Serialize history of given translations.
+
+    Users, failed checks and comments of all translations are retrieved with
+    a fixed number of queries, regardless of the number of translations.
+    """
+    translations = (
+        translations.select_related("user", "approved_user", "unapproved_user")
+        .prefetch_related(
+            "errors",
+            "warnings",
+            Prefetch(
+                "comments",
+                queryset=Comment.objects.order_by("timestamp").select_related("author"),
+            ),
+        )
+        .order_by("-active", "rejected", "-date")
+    )
 
     for t in translations:
         u = t.user or User(username="Imported", first_name="Imported", email="imported")
@@ -434,11 +481,68 @@ def get_translation_history(request):
                 "date_iso": t.date.isoformat(),
                 "approved_user": User.display_name_or_blank(t.approved_user),
                 "unapproved_user": User.display_name_or_blank(t.unapproved_user),
-                "comments": [c.serialize() for c in t.comments.order_by("timestamp")],
+                "comments": [c.serialize() for c in t.comments.all()],
                 "machinery_sources": t.machinery_sources_values,
             }
         )
-        payload.append(translation_dict)
+        yield t, translation_dict
+
+
+@utils.require_AJAX
+def get_translation_history(request):
+    """Get history of translations of given entity to given locale."""
+    try:
+        entity = int(request.GET["entity"])
+        locale = request.GET["locale"]
+        plural_form = int(request.GET["plural_form"])
+    except (MultiValueDictKeyError, ValueError) as e:
+        return JsonResponse(
+            {"status": False, "message": "Bad Request: {error}".format(error=e)},
+            status=400,
+        )
+
+    entity = get_object_or_404(Entity, pk=entity)
+    locale = get_object_or_404(Locale, code=locale)
+
+    translations = Translation.objects.filter(entity=entity, locale=locale,)
+
+    if plural_form != -1:
+        translations = translations.filter(plural_form=plural_form)
+
+    payload = [
+        translation_dict
+        for _, translation_dict in _serialize_translation_history(translations)
+    ]
+
+    return JsonResponse(payload, safe=False)
+
+
+@utils.require_AJAX
+def get_translation_history_batch(request):
+    """
+    Get history of translations of multiple entities to given locale.
+
+    Returns a dict of lists of translations in all plural forms, keyed by
+    entity PK. Each translation also contains its plural form.
+    """
+    try:
+        entities = utils.split_ints(request.GET["entities"])
+        locale = request.GET["locale"]
+    except (MultiValueDictKeyError, ValueError) as e:
+        return JsonResponse(
+            {"status": False, "message": "Bad Request: {error}".format(error=e)},
+            status=400,
+        )
+
+    locale = get_object_or_404(Locale, code=locale)
+
+    translations = Translation.objects.filter(entity__in=entities, locale=locale,)
+
+    payload = {entity: [] for entity in entities}
+
+    for t, translation_dict in _serialize_translation_history(translations):
+        translation_dict["plural_form"] = t.plural_form
+        payload[t.entity_id].append(translation_dict)
 
     return JsonResponse(payload, safe=False)
 
@@ -800,36 +904,28 @@ def upload(request):
 @condition(etag_func=None)
 def download_translation_memory(request, locale, slug):
     locale = get_object_or_404(Locale, code=locale)
+    filename = "{code}.{slug}.tmx".format(code=locale.code, slug=slug)
 
     if slug.lower() == "all-projects":
-        project_filter = Q()
+        project = None
+
+        # Serve the precomputed file if available
+        path = utils.get_fresh_translation_memory_file(locale.code)
+        if path is not None:
+            return serve_translation_memory_file(request, path, filename)
     else:
         project = get_object_or_404(
             Project.objects.visible_for(request.user).available(), slug=slug
         )
-        project_filter = Q(project=project)
 
-    tm_entries = (
-        TranslationMemoryEntry.objects.filter(project_filter)
-        .filter(locale=locale, translation__isnull=False)
-        .exclude(Q(source="") | Q(target=""))
-        .exclude(translation__approved=False, translation__fuzzy=False)
+    # Fetch entries with a server-side cursor to avoid loading all of them into
+    # memory. The response is gzipped on the fly by GZipMiddleware.
+    entries = utils.get_translation_memory_file_entries(locale, project).iterator(
+        chunk_size=utils.TMX_CHUNK_SIZE
     )
-    filename = "{code}.{slug}.tmx".format(code=locale.code, slug=slug)
 
     response = StreamingHttpResponse(
-        utils.build_translation_memory_file(
-            datetime.now(),
-            locale.code,
-            tm_entries.values_list(
-                "entity__resource__path",
-                "entity__key",
-                "source",
-                "target",
-                "project__name",
-                "project__slug",
-            ).order_by("project__slug", "source"),
-        ),
+        utils.build_translation_memory_file(datetime.now(), locale.code, entries),
         content_type="text/xml",
     )
     response["Content-Disposition"] = 'attachment; filename="{filename}"'.format(
@@ -838,6 +934,37 @@ def download_translation_memory(request, locale, slug):
     return response
 
 
+def serve_translation_memory_file(request, path, filename):
+    """
+    Serve the gzipped TMX file as is to clients accepting gzip content encoding,
+    and decompress it on the fly for the rest.
+    """
+    if re.search(r"\bgzip\b", request.META.get("HTTP_ACCEPT_ENCODING", "")):
+        response = FileResponse(
+            open(path, "rb"),
+            as_attachment=True,
+            filename=filename,
+            content_type="text/xml",
+        )
+        response["Content-Encoding"] = "gzip"
+    else:
+        response = StreamingHttpResponse(
+            read_gzipped_file(path), content_type="text/xml"
+        )
+        response["Content-Disposition"] = 'attachment; filename="{filename}"'.format(
+            filename=filename
+        )
+
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+def read_gzipped_file(path, chunk_size=64 * 1024):
+    with gzip.open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            yield chunk
+
+
 @utils.require_AJAX
 def user_data(request):
     user = request.user
@@ -2,6 +2,7 @@ import pytest
 
 from django.urls import reverse
 
+from pontoon.base.models import ProjectLocale, TranslatedResource
 from pontoon.checks.utils import bulk_run_checks
 from pontoon.test.factories import TranslationFactory, ProjectLocaleFactory
 
@@ -44,9 +45,10 @@ def translation_dtd_unapproved():
     )
     bulk_run_checks([translation])
 
+    # Stats are adjusted by diffs, so they must include the translation
     ProjectLocaleFactory.create(
         project=translation.entity.resource.project, locale=translation.locale,
-    )
+    ).aggregate_stats()
 
     yield translation
 
@@ -64,9 +66,10 @@ def translation_dtd_invalid_unapproved():
     )
     bulk_run_checks([translation])
 
+    # Stats are adjusted by diffs, so they must include the translation
     ProjectLocaleFactory.create(
         project=translation.entity.resource.project, locale=translation.locale,
-    )
+    ).aggregate_stats()
 
     yield translation
 
@@ -138,6 +141,20 @@ def test_batch_approve_valid_translations(
     translation_dtd_unapproved.refresh_from_db()
     assert translation_dtd_unapproved.approved
 
+    translated_resource = TranslatedResource.objects.get(
+        resource=translation_dtd_unapproved.entity.resource,
+        locale=translation_dtd_unapproved.locale,
+    )
+    assert translated_resource.approved_strings == 1
+    assert translated_resource.unreviewed_strings == 0
+
+    project_locale = ProjectLocale.objects.get(
+        project=translation_dtd_unapproved.entity.resource.project,
+        locale=translation_dtd_unapproved.locale,
+    )
+    assert project_locale.approved_strings == 1
+    assert project_locale.unreviewed_strings == 0
+
 
 @pytest.mark.django_db
 def test_batch_approve_invalid_translations(
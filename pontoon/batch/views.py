@@ -7,8 +7,10 @@ from django.shortcuts import get_object_or_404
 from django.views.decorators.http import require_POST
 
 from pontoon.base.models import (
+    batch_stats_updates,
     ChangedEntityLocale,
     Entity,
+    EntityLocaleStatus,
     Locale,
     Project,
     TranslationMemoryEntry,
@@ -29,18 +31,28 @@ log = logging.getLogger(__name__)
 def mark_changed_translation(changed_entities, locale):
     """Mark entities as changed, for later sync.
     """
-    changed_entities_array = []
-    existing = ChangedEntityLocale.objects.values_list("entity", "locale").distinct()
-    for changed_entity in changed_entities:
-        key = (changed_entity.pk, locale.pk)
-
-        # Remove duplicate changes to prevent unique constraint violation.
-        if key not in existing:
-            changed_entities_array.append(
-                ChangedEntityLocale(entity=changed_entity, locale=locale)
-            )
+    ChangedEntityLocale.objects.bulk_mark_changed(
+        (changed_entity.pk, locale.pk) for changed_entity in changed_entities
+    )
+
+
+def update_stats(changed_entities, locale):
+    """Refresh statuses of changed entities and adjust stats by the changes,
+    instead of re-calculating stats of whole resources.
+    """
+    stats_diffs = EntityLocaleStatus.objects.refresh(changed_entities, [locale])
+    resources = {entity.pk: entity.resource_id for entity in changed_entities}
+
+    translated_resources = {
+        tr.resource_id: tr
+        for tr in TranslatedResource.objects.filter(
+            resource__in=set(resources.values()), locale=locale,
+        ).select_related("resource__project")
+    }
 
-    ChangedEntityLocale.objects.bulk_create(changed_entities_array)
+    with batch_stats_updates():
+        for (entity_pk, _), stats_diff in stats_diffs.items():
+            translated_resources[resources[entity_pk]].adjust_all_stats(**stats_diff)
 
 
 def update_translation_memory(changed_translation_pks, project, locale):
@@ -129,8 +141,7 @@ def batch_edit_translations(request):
             {"count": 0, "invalid_translation_count": invalid_translation_count}
         )
 
-    tr_pks = [tr.pk for tr in action_status["translated_resources"]]
-    TranslatedResource.objects.filter(pk__in=tr_pks).update_stats()
+    update_stats(action_status["changed_entities"], locale)
 
     mark_changed_translation(action_status["changed_entities"], locale)
 
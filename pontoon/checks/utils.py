@@ -1,5 +1,31 @@
+import threading
+
+from contextlib import contextmanager
+
 from pontoon.checks import DB_LIBRARIES
 
+_bulk_changes = threading.local()
+
+
+@contextmanager
+def bulk_failed_checks_changes():
+    """
+    Mark failed checks saved or deleted inside the block as changed in bulk.
+
+    Statuses of entities aren't refreshed for each of those failed checks, the
+    code changing them refreshes statuses of all affected entities once.
+    """
+    previous = in_bulk_failed_checks_changes()
+    _bulk_changes.active = True
+    try:
+        yield
+    finally:
+        _bulk_changes.active = previous
+
+
+def in_bulk_failed_checks_changes():
+    return getattr(_bulk_changes, "active", False)
+
 
 def bulk_run_checks(translations):
     """
@@ -8,6 +34,7 @@ def bulk_run_checks(translations):
     *Important*
     To avoid performance problems, translations have to prefetch entities and locales objects.
     """
+    from pontoon.base.models import EntityLocaleStatus
     from pontoon.checks.libraries import run_checks
     from pontoon.checks.models import Warning, Error
 
@@ -29,13 +56,20 @@ def bulk_run_checks(translations):
         warnings.extend(warnings_)
         errors.extend(errors_)
 
-    # Remove old warnings and errors
-    Warning.objects.filter(translation__pk__in=[t.pk for t in translations]).delete()
-    Error.objects.filter(translation__pk__in=[t.pk for t in translations]).delete()
+    with bulk_failed_checks_changes():
+        # Remove old warnings and errors
+        Warning.objects.filter(
+            translation__pk__in=[t.pk for t in translations]
+        ).delete()
+        Error.objects.filter(translation__pk__in=[t.pk for t in translations]).delete()
+
+        # Insert new warnings and errors
+        Warning.objects.bulk_create(warnings)
+        Error.objects.bulk_create(errors)
 
-    # Insert new warnings and errors
-    Warning.objects.bulk_create(warnings)
-    Error.objects.bulk_create(errors)
+    EntityLocaleStatus.objects.refresh(
+        {t.entity_id for t in translations}, {t.locale for t in translations}
+    )
 
     return warnings, errors
 
@@ -79,11 +113,13 @@ def save_failed_checks(translation, failed_checks):
     """
     warnings, errors = get_failed_checks_db_objects(translation, failed_checks)
 
-    translation.warnings.all().delete()
-    translation.errors.all().delete()
+    # The status of the entity is refreshed when the translation is saved
+    with bulk_failed_checks_changes():
+        translation.warnings.all().delete()
+        translation.errors.all().delete()
 
-    translation.warnings.bulk_create(warnings)
-    translation.errors.bulk_create(errors)
+        translation.warnings.bulk_create(warnings)
+        translation.errors.bulk_create(errors)
 
 
 def are_blocking_checks(checks, ignore_warnings):
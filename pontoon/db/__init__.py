@@ -1,4 +1,5 @@
-from django.db.models import Func
+from django.contrib.postgres.lookups import TrigramSimilar
+from django.db.models import Func, TextField
 from django.db.models.lookups import (
     Field,
     IContains,
@@ -62,3 +63,7 @@ class IContainsCollate(IContains):
 
 
 Field.register_lookup(IContainsCollate, lookup_name="icontains_collate")
+
+
+# Provided by django.contrib.postgres, which isn't an installed app.
+TextField.register_lookup(TrigramSimilar)
@@ -1,11 +1,37 @@
-from django.core.management.base import BaseCommand
+from datetime import datetime
 
-from pontoon.insights.tasks import collect_insights
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from pontoon.insights.tasks import backfill_user_activity, collect_insights
+
+
+def parse_date(value):
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise CommandError("Invalid date {}, expected YYYY-MM-DD.".format(value))
 
 
 class Command(BaseCommand):
     help = "Collect data needed for the Insights tab"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--backfill-from",
+            action="store",
+            dest="backfill_from",
+            help="Only (re)collect user activity of days since YYYY-MM-DD",
+        )
+
+        parser.add_argument(
+            "--backfill-to",
+            action="store",
+            dest="backfill_to",
+            help="Only (re)collect user activity of days until YYYY-MM-DD (excluded), "
+            "defaults to today",
+        )
+
     def handle(self, *args, **options):
         """
         The Insights tab in the dashboard presents data that cannot be retrieved from
@@ -17,5 +43,22 @@ class Command(BaseCommand):
         a (previous) day, whereas completion data (stats) is collected as the current
         snapshot. Hence, it's important that the time of taking the snapshot is as close
         to the activity period as possible.
+
+        Daily user activity, from which Active users are derived, is collected
+        incrementally. With --backfill-from, only user activity of the given date
+        range is (re)collected, e.g. to include actions imported afterwards.
         """
-        collect_insights.delay()
+        if options["backfill_from"]:
+            start_date = parse_date(options["backfill_from"])
+            end_date = (
+                parse_date(options["backfill_to"])
+                if options["backfill_to"]
+                else timezone.now().date()
+            )
+            backfill_user_activity.delay(start_date, end_date)
+
+        elif options["backfill_to"]:
+            raise CommandError("--backfill-to requires --backfill-from.")
+
+        else:
+            collect_insights.delay()
@@ -0,0 +1,64 @@
+# Generated by Django 3.1.3 on 2026-10-18 04:05
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0013_translationmemoryentry_source_trigram_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("insights", "0002_project_projectlocale"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserActivity",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("translations_created", models.PositiveIntegerField(default=0)),
+                ("translations_reviewed", models.PositiveIntegerField(default=0)),
+                (
+                    "locale",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="base.locale"
+                    ),
+                ),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="base.project"
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="useractivity",
+            index=models.Index(
+                fields=["locale", "date"], name="insights_us_locale__cfe323_idx"
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="useractivity",
+            unique_together={("date", "user", "locale", "project")},
+        ),
+    ]
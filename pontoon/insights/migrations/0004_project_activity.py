@@ -0,0 +1,132 @@
+# Generated by Django 3.1.3 on 2026-10-18 04:12
+
+import datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("insights", "0003_useractivity"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectinsightssnapshot",
+            name="human_translations",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectinsightssnapshot",
+            name="machinery_translations",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectinsightssnapshot",
+            name="new_source_strings",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectinsightssnapshot",
+            name="new_suggestions",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectinsightssnapshot",
+            name="peer_approved",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectinsightssnapshot",
+            name="rejected",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectinsightssnapshot",
+            name="self_approved",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectinsightssnapshot",
+            name="unreviewed_suggestions_lifespan",
+            field=models.DurationField(default=datetime.timedelta(0)),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="projectlocaleinsightssnapshot",
+            name="human_translations",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectlocaleinsightssnapshot",
+            name="machinery_translations",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectlocaleinsightssnapshot",
+            name="new_source_strings",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectlocaleinsightssnapshot",
+            name="new_suggestions",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectlocaleinsightssnapshot",
+            name="peer_approved",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectlocaleinsightssnapshot",
+            name="rejected",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectlocaleinsightssnapshot",
+            name="self_approved",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectlocaleinsightssnapshot",
+            name="unreviewed_suggestions_lifespan",
+            field=models.DurationField(default=datetime.timedelta(0)),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="useractivity",
+            name="human_translations",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="useractivity",
+            name="machinery_translations",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="useractivity",
+            name="new_suggestions",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="useractivity",
+            name="peer_approved",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="useractivity",
+            name="rejected",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="useractivity",
+            name="self_approved",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="useractivity",
+            index=models.Index(
+                fields=["project", "date"], name="insights_us_project_50aa62_idx"
+            ),
+        ),
+    ]
@@ -15,15 +15,6 @@ def active_users_default():
 class InsightsSnapshot(AggregatedStats, models.Model):
     created_at = models.DateField(default=timezone.now)
 
-    # Active users
-    total_managers = models.PositiveIntegerField(default=0)
-    total_reviewers = models.PositiveIntegerField(default=0)
-    total_contributors = models.PositiveIntegerField(default=0)
-    active_users_last_12_months = models.JSONField(default=active_users_default)
-    active_users_last_6_months = models.JSONField(default=active_users_default)
-    active_users_last_3_months = models.JSONField(default=active_users_default)
-    active_users_last_month = models.JSONField(default=active_users_default)
-
     # Unreviewed lifespan
     unreviewed_suggestions_lifespan = models.DurationField()
 
@@ -46,14 +37,59 @@ class InsightsSnapshot(AggregatedStats, models.Model):
 class LocaleInsightsSnapshot(InsightsSnapshot):
     locale = models.ForeignKey("base.Locale", models.CASCADE)
 
+    # Active users
+    total_managers = models.PositiveIntegerField(default=0)
+    total_reviewers = models.PositiveIntegerField(default=0)
+    total_contributors = models.PositiveIntegerField(default=0)
+    active_users_last_12_months = models.JSONField(default=active_users_default)
+    active_users_last_6_months = models.JSONField(default=active_users_default)
+    active_users_last_3_months = models.JSONField(default=active_users_default)
+    active_users_last_month = models.JSONField(default=active_users_default)
+
 
-class ProjectInsightsSnapshot(AggregatedStats):
+class ProjectInsightsSnapshot(InsightsSnapshot):
     project = models.ForeignKey("base.Project", models.CASCADE)
-    created_at = models.DateField(default=timezone.now)
-    completion = models.FloatField()
 
 
-class ProjectLocaleInsightsSnapshot(AggregatedStats):
+class ProjectLocaleInsightsSnapshot(InsightsSnapshot):
     project_locale = models.ForeignKey("base.ProjectLocale", models.CASCADE)
-    created_at = models.DateField(default=timezone.now)
-    completion = models.FloatField()
+
+
+class UserActivity(models.Model):
+    """
+    Daily rollup of translation and review actions a user performed on
+    translations of a project and locale.
+
+    Insights of locales, projects and project locales, and activity over longer
+    periods, are derived from these rows instead of scanning the whole ActionLog.
+
+    A translation is counted in Translation activity and Review activity fields
+    of only one user per day, so these fields can be summed up over users.
+    """
+
+    date = models.DateField()
+    user = models.ForeignKey("auth.User", models.SET_NULL, null=True)
+    locale = models.ForeignKey("base.Locale", models.CASCADE)
+    project = models.ForeignKey("base.Project", models.CASCADE)
+
+    # Number of translation:created actions
+    translations_created = models.PositiveIntegerField(default=0)
+    # Number of translation:(un)approved and translation:(un)rejected actions
+    translations_reviewed = models.PositiveIntegerField(default=0)
+
+    # Translation activity
+    human_translations = models.PositiveIntegerField(default=0)
+    machinery_translations = models.PositiveIntegerField(default=0)
+
+    # Review activity
+    peer_approved = models.PositiveIntegerField(default=0)
+    self_approved = models.PositiveIntegerField(default=0)
+    rejected = models.PositiveIntegerField(default=0)
+    new_suggestions = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ("date", "user", "locale", "project")
+        indexes = [
+            models.Index(fields=["locale", "date"]),
+            models.Index(fields=["project", "date"]),
+        ]
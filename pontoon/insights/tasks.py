@@ -1,25 +1,58 @@
 import logging
 
 from celery import shared_task
+from collections import defaultdict
 from datetime import timedelta
 from dateutil.relativedelta import relativedelta
 
-from django.db.models import F
+from django.db import transaction
+from django.db.models import (
+    Count,
+    DateTimeField,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    Max,
+    Q,
+    Sum,
+    Value,
+)
 from django.contrib.auth.models import User
 from django.utils import timezone
 
 from pontoon.actionlog.models import ActionLog
 from pontoon.base.models import Entity, Locale, Project, ProjectLocale, Translation
-from pontoon.base.utils import group_dict_by
+from pontoon.base.utils import aware_datetime, group_dict_by
 from pontoon.insights.models import (
     LocaleInsightsSnapshot,
     ProjectInsightsSnapshot,
     ProjectLocaleInsightsSnapshot,
+    UserActivity,
 )
 
 
 log = logging.getLogger(__name__)
 
+REVIEW_ACTIONS = (
+    "translation:approved",
+    "translation:unapproved",
+    "translation:rejected",
+    "translation:unrejected",
+)
+
+# Periods (in months) of the Active users panel
+ACTIVE_USERS_PERIODS = (1, 3, 6, 12)
+
+# UserActivity fields of the Translation activity and Review activity charts
+ACTIVITY_FIELDS = (
+    "human_translations",
+    "machinery_translations",
+    "peer_approved",
+    "self_approved",
+    "rejected",
+    "new_suggestions",
+)
+
 
 @shared_task(bind=True)
 def collect_insights(self):
@@ -38,20 +71,142 @@ def collect_insights(self):
 
     log.info("Collect insights for {}: Begin.".format(date))
 
-    collect_project_insights(start_of_today)
+    collect_user_activity(start_of_today)
+    log.info("Collect insights for {}: User activity collected.".format(date))
+
+    # Translation activity, Review activity and Unreviewed suggestions lifespan
+    # by locale, by project and by project locale
+    activity = get_activity(start_of_today)
+    suggestions = get_suggestions()
+    entities = get_entities(start_of_today)
+
+    locale_data, project_data, project_locale_data = zip(
+        activity, suggestions, entities
+    )
+
+    collect_project_insights(start_of_today, project_data)
     log.info("Collect insights for {}: Project insights created.".format(date))
 
-    collect_project_locale_insights(start_of_today)
+    collect_project_locale_insights(start_of_today, project_locale_data)
     log.info("Collect insights for {}: ProjectLocale insights created.".format(date))
 
-    collect_locale_insights(start_of_today)
+    collect_locale_insights(start_of_today, locale_data)
     log.info("Collect insights for {}: Locale insights created.".format(date))
 
 
-def collect_project_insights(start_of_today):
+def collect_user_activity(start_of_today):
+    """
+    Collect UserActivity of days since the last collected day, up to yesterday.
+
+    If no activity has been collected yet, it's collected for the longest period
+    of the Active users panel.
+    """
+    latest = UserActivity.objects.aggregate(Max("date"))["date__max"]
+
+    if latest is None:
+        start_date = (start_of_today - relativedelta(months=12)).date()
+    else:
+        start_date = latest + timedelta(days=1)
+
+    backfill_user_activity(start_date, start_of_today.date())
+
+
+@shared_task
+def backfill_user_activity(start_date, end_date):
+    """
+    (Re)collect UserActivity of each day from start_date up to, but excluding,
+    end_date.
+    """
+    sync_user = User.objects.get(email="pontoon-sync@example.com").pk
+    date = start_date
+
+    while date < end_date:
+        start_of_day = aware_datetime(date.year, date.month, date.day)
+
+        # Actions by project locale, and by user in order of their first action
+        actions = defaultdict(lambda: defaultdict(list))
+
+        for action in get_activity_actions(start_of_day):
+            key = (
+                action["translation__locale"],
+                action["translation__entity__resource__project"],
+            )
+            actions[key][action["performed_by"]].append(action)
+
+        user_activity = []
+        for (locale, project), users in actions.items():
+            counted = defaultdict(set)
+            for user, user_actions in users.items():
+                user_activity.append(
+                    get_user_activity(
+                        date, (user, locale, project), user_actions, sync_user, counted,
+                    )
+                )
+
+        with transaction.atomic():
+            UserActivity.objects.filter(date=date).delete()
+            UserActivity.objects.bulk_create(user_activity, batch_size=1000)
+
+        log.debug("User activity collected for {}.".format(date))
+        date += timedelta(days=1)
+
+    log.info("User activity collected from {} to {}.".format(start_date, end_date))
+
+
+def get_user_activity(date, key, actions, sync_user, counted):
+    """
+    Create UserActivity instance for the given day using given actions.
+
+    Several users can act on the same translation, e.g. approve and reject it,
+    but a translation is only counted once in each activity field of a project
+    locale and day. It's counted for the first of those users, and added to
+    the `counted` dict of translations by field of the project locale.
+    """
+    user, locale, project = key
+
+    charts_data = dict(
+        zip(
+            (
+                "human_translations",
+                "machinery_translations",
+                "new_suggestions",
+                "peer_approved",
+                "self_approved",
+                "rejected",
+            ),
+            get_activity_charts_data(actions, sync_user),
+        )
+    )
+
+    activity = {}
+    for field, translations in charts_data.items():
+        translations -= counted[field]
+        counted[field] |= translations
+        activity[field] = len(translations)
+
+    return UserActivity(
+        date=date,
+        user_id=user,
+        locale_id=locale,
+        project_id=project,
+        translations_created=sum(
+            1 for a in actions if a["action_type"] == "translation:created"
+        ),
+        translations_reviewed=sum(
+            1 for a in actions if a["action_type"] in REVIEW_ACTIONS
+        ),
+        # Translation activity and Review activity
+        **activity,
+    )
+
+
+def collect_project_insights(start_of_today, data):
     """
     Collect insights for each available Project.
+
+    :arg tuple data: activity, suggestions and entities by project.
     """
+
     ProjectInsightsSnapshot.objects.bulk_create(
         [
             ProjectInsightsSnapshot(
@@ -65,6 +220,7 @@ def collect_project_insights(start_of_today):
                 strings_with_errors=project.strings_with_errors,
                 strings_with_warnings=project.strings_with_warnings,
                 unreviewed_strings=project.unreviewed_strings,
+                **get_activity_data(*data, project.pk),
             )
             for project in Project.objects.available()
         ],
@@ -72,10 +228,13 @@ def collect_project_insights(start_of_today):
     )
 
 
-def collect_project_locale_insights(start_of_today):
+def collect_project_locale_insights(start_of_today, data):
     """
     Collect insights for each available ProjectLocale.
+
+    :arg tuple data: activity, suggestions and entities by project locale.
     """
+
     ProjectLocaleInsightsSnapshot.objects.bulk_create(
         [
             ProjectLocaleInsightsSnapshot(
@@ -89,6 +248,9 @@ def collect_project_locale_insights(start_of_today):
                 strings_with_errors=project_locale.strings_with_errors,
                 strings_with_warnings=project_locale.strings_with_warnings,
                 unreviewed_strings=project_locale.unreviewed_strings,
+                **get_activity_data(
+                    *data, (project_locale.project_id, project_locale.locale_id),
+                ),
             )
             for project_locale in ProjectLocale.objects.all()
         ],
@@ -96,19 +258,16 @@ def collect_project_locale_insights(start_of_today):
     )
 
 
-def collect_locale_insights(start_of_today):
+def collect_locale_insights(start_of_today, data):
     """
     Collect insights for each available Locale.
+
+    :arg tuple data: activity, suggestions and entities by locale.
     """
     # Get data sources to retrieve insights from
     privileged_users = get_privileged_users()
     contributors = get_contributors()
-    active_users_actions = get_active_users_actions(start_of_today)
-    suggestions = get_suggestions()
-    activity_actions = get_activity_actions(start_of_today)
-    entities = get_entities(start_of_today)
-
-    sync_user = User.objects.get(email="pontoon-sync@example.com").pk
+    active_users = get_active_users(start_of_today)
 
     LocaleInsightsSnapshot.objects.bulk_create(
         [
@@ -116,12 +275,9 @@ def collect_locale_insights(start_of_today):
                 locale,
                 start_of_today,
                 privileged_users[locale.id],
-                contributors[locale.id],
-                active_users_actions[locale.id],
-                suggestions[locale.id],
-                activity_actions[locale.id],
-                entities[locale.id],
-                sync_user,
+                contributors.get(locale.id, 0),
+                active_users[locale.id],
+                get_activity_data(*data, locale.id),
             )
             for locale in Locale.objects.available()
         ],
@@ -129,6 +285,36 @@ def collect_locale_insights(start_of_today):
     )
 
 
+def sum_by_locale_and_project(rows, fields):
+    """
+    Sum values of the given fields of rows by locale, by project and by project
+    locale, i.e. (project, locale) pair.
+
+    Rows must contain locale, project, project_system and project_visibility
+    keys. Only rows of public, non-system projects are summed up by locale.
+    """
+    locales = {}
+    projects = {}
+    project_locales = {}
+
+    for row in rows:
+        groups = [
+            (projects, row["project"]),
+            (project_locales, (row["project"], row["locale"])),
+        ]
+        if not row["project_system"] and row["project_visibility"] == "public":
+            groups.append((locales, row["locale"]))
+
+        for totals, key in groups:
+            total = totals.setdefault(key, {})
+            for field in fields:
+                total[field] = (
+                    total[field] + row[field] if field in total else row[field]
+                )
+
+    return locales, projects, project_locales
+
+
 def get_privileged_users():
     """Get managers and translators."""
     privileged_users = (
@@ -145,160 +331,198 @@ def get_privileged_users():
     return group_dict_by(privileged_users, "pk")
 
 
+def get_system_users():
+    return User.objects.filter(email__regex=r"^pontoon-(\w+)@example.com$",).values(
+        "pk"
+    )
+
+
 def get_contributors():
-    """Get all contributors without system users.
+    """Get the number of contributors of each locale, without system users.
 
     Note that excluding system user emails in the Translation QuerySet directly is slow.
     """
-    system_users = User.objects.filter(
-        email__regex=r"^pontoon-(\w+)@example.com$",
-    ).values("pk")
-
     contributors = (
         Translation.objects.filter(user__isnull=False)
-        .exclude(user__pk__in=system_users)
+        .exclude(user__pk__in=get_system_users())
+        .values("locale")
+        .annotate(count=Count("user", distinct=True))
+        .order_by()
+    )
+
+    return {c["locale"]: c["count"] for c in contributors}
+
+
+def get_active_users(start_of_today):
+    """
+    Get dates of the latest translation and review activity of users in the
+    previous year, needed for the Active users panel.
+    """
+    active_users = (
+        UserActivity.objects.filter(
+            date__gte=(start_of_today - relativedelta(months=12)).date(),
+            date__lt=start_of_today.date(),
+            user__isnull=False,
+        )
+        .exclude(user__pk__in=get_system_users())
         .values("locale", "user")
-        .distinct()
+        .annotate(
+            last_created=Max("date", filter=Q(translations_created__gt=0)),
+            last_reviewed=Max("date", filter=Q(translations_reviewed__gt=0)),
+        )
+        .order_by()
     )
 
-    return group_dict_by(contributors, "locale")
+    return group_dict_by(active_users, "locale")
 
 
-def get_active_users_actions(start_of_today):
-    """Get actions of the previous year, needed for the Active users charts."""
-    actions = (
-        ActionLog.objects.filter(
-            created_at__gte=start_of_today - relativedelta(year=1),
-            created_at__lt=start_of_today,
+def get_activity(start_of_today):
+    """
+    Get Translation and Review activity of the previous day by locale, by project
+    and by project locale.
+    """
+    activity = (
+        UserActivity.objects.filter(date=(start_of_today - timedelta(days=1)).date())
+        .values(
+            "locale",
+            "project",
+            project_system=F("project__system_project"),
+            project_visibility=F("project__visibility"),
         )
-        .values("action_type", "created_at", "performed_by", "translation__locale")
-        .distinct()
+        .annotate(**{field: Sum(field) for field in ACTIVITY_FIELDS})
+        .order_by()
     )
 
-    return group_dict_by(actions, "translation__locale")
+    return sum_by_locale_and_project(activity, ACTIVITY_FIELDS)
 
 
 def get_suggestions():
-    """Get currently unreviewed suggestions."""
-    suggestions = Translation.objects.filter(
-        # Make sure TranslatedResource is still enabled for the locale
-        locale=F("entity__resource__translatedresources__locale"),
-        approved=False,
-        fuzzy=False,
-        rejected=False,
-        entity__obsolete=False,
-        entity__resource__project__disabled=False,
-        entity__resource__project__system_project=False,
-        entity__resource__project__visibility="public",
-    ).values("locale", "date")
-
-    return group_dict_by(suggestions, "locale")
-
-
-def get_activity_actions(start_of_today):
-    """Get actions of the previous day, needed for the Translation and Review activity charts."""
-    actions = ActionLog.objects.filter(
-        created_at__gte=start_of_today - relativedelta(days=1),
-        created_at__lt=start_of_today,
-        translation__entity__resource__project__system_project=False,
-        translation__entity__resource__project__visibility="public",
-    ).values(
-        "action_type",
-        "performed_by",
-        "translation",
-        "translation__locale",
-        "translation__machinery_sources",
-        "translation__user",
-        "translation__approved_user",
-        "translation__date",
-        "translation__approved_date",
+    """
+    Get count and total age of currently unreviewed suggestions by locale, by
+    project and by project locale.
+    """
+    suggestions = (
+        Translation.objects.filter(
+            # Make sure TranslatedResource is still enabled for the locale
+            locale=F("entity__resource__translatedresources__locale"),
+            approved=False,
+            fuzzy=False,
+            rejected=False,
+            entity__obsolete=False,
+            entity__resource__project__disabled=False,
+        )
+        .values(
+            "locale",
+            project=F("entity__resource__project"),
+            project_system=F("entity__resource__project__system_project"),
+            project_visibility=F("entity__resource__project__visibility"),
+        )
+        .annotate(
+            count=Count("pk"),
+            age=Sum(
+                ExpressionWrapper(
+                    Value(timezone.now(), output_field=DateTimeField()) - F("date"),
+                    output_field=DurationField(),
+                )
+            ),
+        )
+        .order_by()
     )
 
-    return group_dict_by(actions, "translation__locale")
+    return sum_by_locale_and_project(suggestions, ("count", "age"))
+
+
+def get_activity_actions(start_of_day):
+    """Get actions of the given day, needed for the Translation and Review activity charts."""
+    return (
+        ActionLog.objects.filter(
+            created_at__gte=start_of_day,
+            created_at__lt=start_of_day + timedelta(days=1),
+            action_type__in=("translation:created",) + REVIEW_ACTIONS,
+        )
+        .order_by("created_at", "pk")
+        .values(
+            "action_type",
+            "performed_by",
+            "translation",
+            "translation__locale",
+            "translation__entity__resource__project",
+            "translation__machinery_sources",
+            "translation__user",
+            "translation__approved_user",
+            "translation__date",
+            "translation__approved_date",
+        )
+    )
 
 
 def get_entities(start_of_today):
-    """Get entities created on the previous day."""
+    """
+    Get the number of entities created on the previous day by locale, by project
+    and by project locale.
+    """
     entities = Entity.objects.filter(
         date_created__gte=start_of_today - relativedelta(days=1),
         date_created__lt=start_of_today,
         obsolete=False,
         resource__project__disabled=False,
-        resource__project__system_project=False,
-        resource__project__visibility="public",
-    ).values("pk", "resource__translatedresources__locale")
+    )
 
-    return group_dict_by(entities, "resource__translatedresources__locale")
+    entities_by_locale = (
+        entities.values(
+            locale=F("resource__translatedresources__locale"),
+            project=F("resource__project"),
+            project_system=F("resource__project__system_project"),
+            project_visibility=F("resource__project__visibility"),
+        )
+        .annotate(count=Count("pk"))
+        .order_by()
+    )
+    locales, _, project_locales = sum_by_locale_and_project(
+        entities_by_locale, ("count",)
+    )
+
+    # Entities are counted once per project, not once per locale
+    entities_by_project = (
+        entities.values(project=F("resource__project"))
+        .annotate(count=Count("pk"))
+        .order_by()
+    )
+    projects = {e["project"]: {"count": e["count"]} for e in entities_by_project}
+
+    return locales, projects, project_locales
 
 
 def get_locale_insights_snapshot(
     locale,
     start_of_today,
     privileged_users,
-    contributors,
-    active_users_actions,
-    suggestions,
-    activity_actions,
-    entities,
-    sync_user,
+    total_contributors,
+    active_users,
+    activity,
 ):
     """Create LocaleInsightsSnapshot instance for the given locale and day using given data."""
     all_managers, all_reviewers = get_privileged_users_data(privileged_users)
-    all_contributors = {c["user"] for c in contributors}
 
     total_managers = len(all_managers)
     total_reviewers = len(all_reviewers)
-    total_contributors = len(all_contributors)
-
-    active_users_last_month = get_active_users_data(
-        start_of_today,
-        privileged_users,
-        active_users_actions,
-        all_reviewers,
-        all_contributors,
-        months=1,
-    )
-    active_users_last_3_months = get_active_users_data(
-        start_of_today,
-        privileged_users,
-        active_users_actions,
-        all_reviewers,
-        all_contributors,
-        months=3,
-    )
-    active_users_last_6_months = get_active_users_data(
-        start_of_today,
-        privileged_users,
-        active_users_actions,
-        all_reviewers,
-        all_contributors,
-        months=6,
-    )
-    active_users_last_12_months = get_active_users_data(
-        start_of_today,
-        privileged_users,
-        active_users_actions,
-        all_reviewers,
-        all_contributors,
-        months=12,
-    )
-
-    unreviewed_suggestions_lifespan = get_unreviewed_suggestions_lifespan_data(
-        suggestions
-    )
 
     (
-        human_translations,
-        machinery_translations,
-        new_suggestions,
-        peer_approved,
-        self_approved,
-        rejected,
-    ) = get_activity_charts_data(activity_actions, sync_user)
+        active_users_last_month,
+        active_users_last_3_months,
+        active_users_last_6_months,
+        active_users_last_12_months,
+    ) = (
+        get_active_users_data(
+            start_of_today, privileged_users, active_users, all_reviewers, months,
+        )
+        for months in ACTIVE_USERS_PERIODS
+    )
 
     return LocaleInsightsSnapshot(
         locale=locale,
         created_at=start_of_today,
+        completion=round(locale.completed_percent, 2),
         # AggregatedStats
         total_strings=locale.total_strings,
         approved_strings=locale.approved_strings,
@@ -314,18 +538,7 @@ def get_locale_insights_snapshot(
         active_users_last_3_months=active_users_last_3_months,
         active_users_last_6_months=active_users_last_6_months,
         active_users_last_12_months=active_users_last_12_months,
-        # Unreviewed suggestions lifespan
-        unreviewed_suggestions_lifespan=unreviewed_suggestions_lifespan,
-        # Translation activity
-        completion=round(locale.completed_percent, 2),
-        human_translations=len(human_translations),
-        machinery_translations=len(machinery_translations),
-        new_source_strings=len(entities),
-        # Review activity
-        peer_approved=len(peer_approved),
-        self_approved=len(self_approved),
-        rejected=len(rejected),
-        new_suggestions=len(new_suggestions),
+        **activity,
     )
 
 
@@ -348,12 +561,7 @@ def get_privileged_users_data(privileged_users):
 
 
 def get_active_users_data(
-    start_of_today,
-    privileged_users,
-    active_users_actions,
-    all_reviewers,
-    all_contributors,
-    months=12,
+    start_of_today, privileged_users, active_users, all_reviewers, months=12,
 ):
     """Get active user counts for the Active users panel."""
     active_managers = set()
@@ -369,22 +577,20 @@ def get_active_users_data(
             if last_login + relativedelta(months=months) > start_of_today:
                 active_managers.add(manager)
 
-    # Get active reviewers and contributors. Make sure they are included among all
+    # Get active reviewers and contributors. Make sure reviewers are privileged
     # users, otherwise we might include PMs and privileged users of other locales.
-    for action in active_users_actions:
-        user = action["performed_by"]
-        if user in all_reviewers and action["action_type"] in (
-            "translation:approved",
-            "translation:unapproved",
-            "translation:rejected",
-            "translation:unrejected",
-        ):
-            if action["created_at"] + relativedelta(months=months) > start_of_today:
-                active_reviewers.add(user)
-
-        if user in all_contributors and action["action_type"] == "translation:created":
-            if action["created_at"] + relativedelta(months=months) > start_of_today:
-                active_contributors.add(user)
+    since = (start_of_today - relativedelta(months=months)).date()
+
+    for activity in active_users:
+        user = activity["user"]
+        last_created = activity["last_created"]
+        last_reviewed = activity["last_reviewed"]
+
+        if user in all_reviewers and last_reviewed and last_reviewed >= since:
+            active_reviewers.add(user)
+
+        if last_created and last_created >= since:
+            active_contributors.add(user)
 
     return {
         "managers": len(active_managers),
@@ -393,20 +599,25 @@ def get_active_users_data(
     }
 
 
-def get_unreviewed_suggestions_lifespan_data(suggestions):
-    """Get average age of the unreviewed suggestion."""
-    unreviewed_suggestions_lifespan = timedelta()
-    suggestion_count = len(suggestions)
-
-    if suggestion_count > 0:
-        total_suggestion_age = timedelta()
+def get_activity_data(activity, suggestions, entities, key):
+    """
+    Get Unreviewed suggestions lifespan, Translation activity and Review activity
+    fields of an insights snapshot of the given locale, project or project locale.
+    """
+    activity = activity.get(key, {})
+    suggestions = suggestions.get(key)
 
-        for s in suggestions:
-            total_suggestion_age += timezone.now() - s["date"]
+    unreviewed_suggestions_lifespan = timedelta()
+    if suggestions and suggestions["count"] > 0:
+        unreviewed_suggestions_lifespan = suggestions["age"] / suggestions["count"]
 
-        unreviewed_suggestions_lifespan = total_suggestion_age / suggestion_count
+    data = {
+        "unreviewed_suggestions_lifespan": unreviewed_suggestions_lifespan,
+        "new_source_strings": entities.get(key, {}).get("count", 0),
+    }
+    data.update({field: activity.get(field, 0) for field in ACTIVITY_FIELDS})
 
-    return unreviewed_suggestions_lifespan
+    return data
 
 
 def get_activity_charts_data(activity_actions, sync_user):
@@ -0,0 +1,289 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from dateutil.relativedelta import relativedelta
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+from pontoon.actionlog.models import ActionLog
+from pontoon.base.utils import aware_datetime
+from pontoon.insights.models import UserActivity
+from pontoon.insights.tasks import (
+    backfill_user_activity,
+    collect_user_activity,
+    get_active_users,
+    get_active_users_data,
+    get_activity_data,
+    get_entities,
+    sum_by_locale_and_project,
+)
+from pontoon.test.factories import (
+    EntityFactory,
+    TranslatedResourceFactory,
+    UserFactory,
+)
+
+
+@pytest.fixture(autouse=True)
+def sync_user(db):
+    """Make sure the sync user has the email its actions are recognized by."""
+    User.objects.filter(username="pontoon-sync").update(
+        email="pontoon-sync@example.com"
+    )
+
+
+@pytest.fixture
+def day():
+    return timezone.now().date() - timedelta(days=1)
+
+
+def log(action_type, user, translation, day):
+    action = ActionLog.objects.create(
+        action_type=action_type, performed_by=user, translation=translation,
+    )
+    ActionLog.objects.filter(pk=action.pk).update(
+        created_at=aware_datetime(day.year, day.month, day.day) + timedelta(hours=1)
+    )
+
+
+def backfill(day):
+    backfill_user_activity(day, day + timedelta(days=1))
+
+    return {
+        activity.user: activity
+        for activity in UserActivity.objects.filter(date=day).select_related("user")
+    }
+
+
+@pytest.mark.django_db
+def test_backfill_user_activity(day, translation_a, user_a, user_b):
+    """
+    Actions of a day are rolled up by user, locale and project.
+    """
+    log("translation:created", user_a, translation_a, day)
+    log("translation:approved", user_b, translation_a, day)
+
+    # Actions of other days are ignored
+    log("translation:rejected", user_b, translation_a, day - timedelta(days=1))
+
+    activity = backfill(day)
+    assert set(activity) == {user_a, user_b}
+
+    created = activity[user_a]
+    assert created.locale == translation_a.locale
+    assert created.project == translation_a.entity.resource.project
+    assert (created.translations_created, created.translations_reviewed) == (1, 0)
+    assert (created.human_translations, created.new_suggestions) == (1, 1)
+
+    reviewed = activity[user_b]
+    assert (reviewed.translations_created, reviewed.translations_reviewed) == (0, 1)
+    assert (reviewed.peer_approved, reviewed.rejected) == (1, 0)
+
+
+@pytest.mark.django_db
+def test_backfill_user_activity_counted_once(day, translation_a, user_b, user_c):
+    """
+    A translation reviewed by several users on the same day is counted once,
+    for the first of them.
+    """
+    for user in (user_b, user_c):
+        log("translation:approved", user, translation_a, day)
+        log("translation:rejected", user, translation_a, day)
+
+    activity = backfill(day)
+
+    assert [
+        (activity[user].peer_approved, activity[user].rejected)
+        for user in (user_b, user_c)
+    ] == [(1, 1), (0, 0)]
+    assert [activity[user].translations_reviewed for user in (user_b, user_c)] == [
+        2,
+        2,
+    ]
+
+
+@pytest.mark.django_db
+def test_backfill_user_activity_rerun(day, translation_a, user_a, user_b):
+    """
+    Backfilling a day again replaces its activity.
+    """
+    log("translation:created", user_a, translation_a, day)
+    log("translation:approved", user_b, translation_a, day)
+    backfill(day)
+
+    ActionLog.objects.filter(performed_by=user_b).delete()
+    activity = backfill(day)
+
+    assert set(activity) == {user_a}
+    assert activity[user_a].translations_created == 1
+    assert UserActivity.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_collect_user_activity(day, locale_a, project_a, user_a):
+    """
+    User activity is collected for a year on the first run, and then since the
+    last collected day.
+    """
+    start_of_today = aware_datetime(day.year, day.month, day.day) + relativedelta(
+        days=1
+    )
+
+    with patch("pontoon.insights.tasks.backfill_user_activity") as backfill_mock:
+        collect_user_activity(start_of_today)
+        backfill_mock.assert_called_once_with(
+            (start_of_today - relativedelta(months=12)).date(), start_of_today.date()
+        )
+
+        UserActivity.objects.create(
+            date=day - timedelta(days=3),
+            user=user_a,
+            locale=locale_a,
+            project=project_a,
+        )
+        backfill_mock.reset_mock()
+        collect_user_activity(start_of_today)
+        backfill_mock.assert_called_once_with(
+            day - timedelta(days=2), start_of_today.date()
+        )
+
+
+@pytest.mark.django_db
+def test_active_users(locale_a, project_a):
+    """
+    Users are active in the periods of the Active users panel, in which they
+    translated or reviewed.
+    """
+    start_of_today = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    reviewer = UserFactory.create()
+    contributors = UserFactory.create_batch(5)
+
+    def create_activity(user, months, **kwargs):
+        UserActivity.objects.create(
+            date=(start_of_today - relativedelta(months=months, days=-1)).date(),
+            user=user,
+            locale=locale_a,
+            project=project_a,
+            **kwargs
+        )
+
+    # Active in the last month, 3, 6 and 12 months, and earlier
+    for user, months in zip(contributors, (1, 3, 6, 12, 13)):
+        create_activity(user, months, translations_created=1)
+    create_activity(reviewer, 3, translations_reviewed=1)
+
+    # Only privileged users count as reviewers
+    create_activity(contributors[0], 2, translations_reviewed=1)
+
+    active_users = get_active_users(start_of_today)[locale_a.pk]
+    all_reviewers = {reviewer.pk}
+
+    assert [
+        get_active_users_data(start_of_today, [], active_users, all_reviewers, months)
+        for months in (1, 3, 6, 12)
+    ] == [
+        {"managers": 0, "reviewers": 0, "contributors": 1},
+        {"managers": 0, "reviewers": 1, "contributors": 2},
+        {"managers": 0, "reviewers": 1, "contributors": 3},
+        {"managers": 0, "reviewers": 1, "contributors": 4},
+    ]
+
+
+def test_sum_by_locale_and_project():
+    """
+    Rows are summed up by project and project locale, and rows of public,
+    non-system projects also by locale.
+    """
+    rows = [
+        {
+            "locale": locale,
+            "project": project,
+            "project_system": system,
+            "project_visibility": visibility,
+            "count": count,
+        }
+        for locale, project, system, visibility, count in (
+            (1, 1, False, "public", 1),
+            (2, 1, False, "public", 2),
+            (1, 2, False, "public", 4),
+            (1, 3, True, "public", 8),
+            (1, 4, False, "private", 16),
+        )
+    ]
+
+    locales, projects, project_locales = sum_by_locale_and_project(rows, ("count",))
+
+    assert locales == {1: {"count": 5}, 2: {"count": 2}}
+    assert projects == {
+        1: {"count": 3},
+        2: {"count": 4},
+        3: {"count": 8},
+        4: {"count": 16},
+    }
+    assert project_locales == {
+        (1, 1): {"count": 1},
+        (1, 2): {"count": 2},
+        (2, 1): {"count": 4},
+        (3, 1): {"count": 8},
+        (4, 1): {"count": 16},
+    }
+
+
+@pytest.mark.django_db
+def test_get_entities(resource_a, locale_a, locale_b):
+    """
+    New source strings are counted once per project, and once per locale and
+    project locale they're available in.
+    """
+    start_of_today = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    project = resource_a.project
+    for locale in (locale_a, locale_b):
+        TranslatedResourceFactory.create(resource=resource_a, locale=locale)
+
+    EntityFactory.create_batch(
+        2, resource=resource_a, date_created=start_of_today - timedelta(hours=1)
+    )
+    EntityFactory.create(resource=resource_a, date_created=start_of_today)
+
+    locales, projects, project_locales = get_entities(start_of_today)
+
+    assert projects == {project.pk: {"count": 2}}
+    assert locales == {locale_a.pk: {"count": 2}, locale_b.pk: {"count": 2}}
+    assert project_locales == {
+        (project.pk, locale_a.pk): {"count": 2},
+        (project.pk, locale_b.pk): {"count": 2},
+    }
+
+
+def test_get_activity_data():
+    """
+    Activity data of a key is taken from activity, suggestions and entities,
+    and defaults to no activity.
+    """
+    activity = {1: {"human_translations": 3, "rejected": 1}}
+    suggestions = {1: {"count": 2, "age": timedelta(days=4)}}
+    entities = {1: {"count": 5}}
+
+    assert get_activity_data(activity, suggestions, entities, 1) == {
+        "unreviewed_suggestions_lifespan": timedelta(days=2),
+        "new_source_strings": 5,
+        "human_translations": 3,
+        "machinery_translations": 0,
+        "peer_approved": 0,
+        "self_approved": 0,
+        "rejected": 1,
+        "new_suggestions": 0,
+    }
+
+    assert get_activity_data(activity, suggestions, entities, 2) == {
+        "unreviewed_suggestions_lifespan": timedelta(),
+        "new_source_strings": 0,
+        "human_translations": 0,
+        "machinery_translations": 0,
+        "peer_approved": 0,
+        "self_approved": 0,
+        "rejected": 0,
+        "new_suggestions": 0,
+    }
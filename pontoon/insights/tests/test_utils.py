@@ -0,0 +1,70 @@
+from datetime import timedelta
+
+import pytest
+
+from django.utils import timezone
+
+from pontoon.insights.models import (
+    LocaleInsightsSnapshot,
+    ProjectInsightsSnapshot,
+    ProjectLocaleInsightsSnapshot,
+    active_users_default,
+)
+from pontoon.insights.utils import get_insights, get_insights_snapshots
+
+
+@pytest.fixture
+def snapshots(locale_a, project_a, project_locale_a):
+    """One snapshot of each kind, with distinct human translation counts."""
+    fields = {
+        "created_at": timezone.now(),
+        "unreviewed_suggestions_lifespan": timedelta(days=1),
+        "completion": 50.0,
+    }
+    return {
+        "locale": LocaleInsightsSnapshot.objects.create(
+            locale=locale_a, human_translations=1, total_managers=2, **fields
+        ),
+        "project": ProjectInsightsSnapshot.objects.create(
+            project=project_a, human_translations=2, **fields
+        ),
+        "project_locale": ProjectLocaleInsightsSnapshot.objects.create(
+            project_locale=project_locale_a, human_translations=3, **fields
+        ),
+    }
+
+
+@pytest.mark.django_db
+def test_get_insights_snapshots(snapshots, locale_a, project_a):
+    assert list(get_insights_snapshots()) == [snapshots["locale"]]
+    assert list(get_insights_snapshots(locale=locale_a)) == [snapshots["locale"]]
+    assert list(get_insights_snapshots(project=project_a)) == [snapshots["project"]]
+    assert list(get_insights_snapshots(locale=locale_a, project=project_a)) == [
+        snapshots["project_locale"]
+    ]
+
+
+@pytest.mark.django_db
+def test_get_insights_locale(snapshots, locale_a):
+    insights = get_insights(locale=locale_a)
+
+    assert insights["translation_activity"]["human_translations"] == [1]
+    assert insights["total_users"]["managers"] == 2
+
+
+@pytest.mark.django_db
+def test_get_insights_project(snapshots, project_a):
+    """Active users are only collected for locales."""
+    insights = get_insights(project=project_a)
+
+    assert insights["translation_activity"]["human_translations"] == [2]
+    assert insights["total_users"] == active_users_default()
+    assert insights["active_users_last_month"] == active_users_default()
+
+
+@pytest.mark.django_db
+def test_get_insights_project_locale(snapshots, locale_a, project_a):
+    insights = get_insights(locale=locale_a, project=project_a)
+
+    assert insights["translation_activity"]["human_translations"] == [3]
+    assert insights["total_users"] == active_users_default()
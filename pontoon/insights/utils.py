@@ -2,22 +2,43 @@ from django.db.models.functions import TruncMonth
 from django.db.models import Avg, Sum
 
 from pontoon.base.utils import aware_datetime, convert_to_unix_time, get_last_months
-from pontoon.insights.models import LocaleInsightsSnapshot, active_users_default
+from pontoon.insights.models import (
+    LocaleInsightsSnapshot,
+    ProjectInsightsSnapshot,
+    ProjectLocaleInsightsSnapshot,
+    active_users_default,
+)
 
 
-def get_insights(query_filters=None):
+def get_insights_snapshots(locale=None, project=None):
+    """
+    Get insights snapshots of the given locale, project or project locale, or
+    of all locales if neither is given.
+    """
+    if locale is not None and project is not None:
+        return ProjectLocaleInsightsSnapshot.objects.filter(
+            project_locale__locale=locale, project_locale__project=project
+        )
+    if project is not None:
+        return ProjectInsightsSnapshot.objects.filter(project=project)
+    if locale is not None:
+        return LocaleInsightsSnapshot.objects.filter(locale=locale)
+    return LocaleInsightsSnapshot.objects.all()
+
+
+def get_insights(locale=None, project=None):
     """Get data required by the Insights tab.
 
-    :param django.db.models.Q query_filters: filters insights by given query_filters.
+    :param Locale locale: filters insights by given locale.
+    :param Project project: filters insights by given project.
     """
     months = sorted(
         [aware_datetime(year, month, 1) for year, month in get_last_months(12)]
     )
 
-    snapshots = LocaleInsightsSnapshot.objects.filter(created_at__gte=months[0])
-
-    if query_filters:
-        snapshots = snapshots.filter(query_filters)
+    snapshots = get_insights_snapshots(locale, project).filter(
+        created_at__gte=months[0]
+    )
 
     insights = (
         snapshots
@@ -54,7 +75,11 @@ def get_insights(query_filters=None):
     )
 
     output = {}
-    latest = snapshots.latest("created_at") if snapshots else None
+    # Active users are only collected for locales
+    if snapshots.model is LocaleInsightsSnapshot:
+        latest = snapshots.order_by("created_at").last()
+    else:
+        latest = None
 
     if latest:
         output.update(
@@ -0,0 +1,27 @@
+import pytest
+
+from pontoon.machinery.utils import get_translation_memory_matches
+from pontoon.test.factories import TranslationMemoryFactory
+
+
+@pytest.mark.django_db
+def test_get_translation_memory_matches(locale_a):
+    """
+    Exact matches of all texts are returned at once, grouped by target and
+    ordered by the number of occurrences.
+    """
+    for target in ["ccc", "ddd", "ddd"]:
+        TranslationMemoryFactory.create(source="aaa", target=target, locale=locale_a)
+    TranslationMemoryFactory.create(source="bbbb", target="eee", locale=locale_a)
+
+    matches = get_translation_memory_matches(["aaa", "aaa", "bbb"], locale_a)
+    assert matches == {
+        "aaa": [
+            {"source": "aaa", "target": "ddd", "quality": 100, "count": 2},
+            {"source": "aaa", "target": "ccc", "quality": 100, "count": 1},
+        ],
+    }
+
+    matches = get_translation_memory_matches(["aaa", "bbb"], locale_a, fuzzy=True)
+    assert [m["target"] for m in matches["bbb"]] == ["eee"]
+    assert int(matches["bbb"][0]["quality"]) == 71
@@ -116,3 +116,53 @@ def get_translation_memory_data(text, locale, pk=None):
     return sorted(
         entries_merged.values(), key=lambda e: (e["quality"], e["count"]), reverse=True,
     )[:MAX_RESULTS]
+
+
+def get_translation_memory_matches(texts, locale, fuzzy=False, chunk_size=5000):
+    """
+    Return Translation Memory matches of many texts at once, e.g. of all strings
+    of a locale to pretranslate.
+
+    Identical texts are looked up only once. Exact matches are fetched in bulk,
+    one query per `chunk_size` texts. Fuzzy matches of texts without an exact
+    match are only fetched if requested, one text at a time.
+
+    :arg list texts: source strings to look up.
+    :arg Locale locale: locale of the Translation Memory entries.
+    :arg bool fuzzy: also look up fuzzy matches of texts without an exact match.
+    :returns: a dict of texts and their matches in the format returned by
+        get_translation_memory_data(), best match first.
+    """
+    texts = list(set(texts))
+    matches = {}
+
+    for i in range(0, len(texts), chunk_size):
+        entries = (
+            base.models.TranslationMemoryEntry.objects.filter(
+                locale=locale, source__in=texts[i : i + chunk_size],
+            )
+            .exclude(translation__approved=False, translation__fuzzy=False)
+            .values_list("source", "target")
+        )
+
+        # Group entries with the same source and target and count them
+        target_counts = defaultdict(lambda: defaultdict(int))
+        for source, target in entries:
+            target_counts[source][target] += 1
+
+        for source, counts in target_counts.items():
+            matches[source] = sorted(
+                (
+                    {"source": source, "target": target, "quality": 100, "count": count}
+                    for target, count in counts.items()
+                ),
+                key=lambda e: e["count"],
+                reverse=True,
+            )[:MAX_RESULTS]
+
+    if fuzzy:
+        for text in texts:
+            if text not in matches:
+                matches[text] = get_translation_memory_data(text, locale)
+
+    return matches
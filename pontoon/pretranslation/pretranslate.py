@@ -11,26 +11,44 @@ from pontoon.machinery.utils import (
 )
 
 
-def get_translations(entity, locale):
+def get_pretranslation_users():
+    """
+    Return users pretranslations from Translation Memory and Google Translate
+    are attributed to.
+    """
+    return (
+        User.objects.get(email="pontoon-tm@example.com"),
+        User.objects.get(email="pontoon-gt@example.com"),
+    )
+
+
+def get_translations(entity, locale, tm_matches=None, users=None):
     """
     Get pretranslations for the entity-locale pair
 
     :arg Entity entity: the Entity object
     :arg Locale locale: the Locale object
+    :arg dict tm_matches: Translation Memory matches of entity strings, as
+        returned by get_translation_memory_matches(). Looked up for the entity
+        if not given.
+    :arg tuple users: tm_user and gt_user, as returned by
+        get_pretranslation_users(). Fetched if not given.
 
     :returns: a list of tuple with:
         - a pretranslation of the entity
         - plural form
         - user - tm_user/gt_user
     """
-    tm_user = User.objects.get(email="pontoon-tm@example.com")
-    gt_user = User.objects.get(email="pontoon-gt@example.com")
+    tm_user, gt_user = users or get_pretranslation_users()
 
     strings = []
     plural_forms = range(0, locale.nplurals or 1)
 
     # Try to get matches from translation_memory
-    tm_response = get_translation_memory_data(text=entity.string, locale=locale,)
+    if tm_matches is None:
+        tm_response = get_translation_memory_data(text=entity.string, locale=locale,)
+    else:
+        tm_response = tm_matches.get(entity.string, [])
 
     tm_response = [t for t in tm_response if int(t["quality"]) == 100]
 
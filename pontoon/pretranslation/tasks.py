@@ -10,7 +10,9 @@ from pontoon.base.models import (
     Translation,
     ChangedEntityLocale,
 )
+from pontoon.machinery.utils import get_translation_memory_matches
 from pontoon.pretranslation.pretranslate import (
+    get_pretranslation_users,
     get_translations,
     update_changed_instances,
 )
@@ -56,7 +58,7 @@ def pretranslate(self, project_pk, locales=None, entities=None):
         ).prefetch_related("resource")
 
     # get available TranslatedResource pairs
-    tr_pairs = (
+    tr_pairs = set(
         TranslatedResource.objects.filter(
             resource__project=project, locale__in=locales,
         )
@@ -81,7 +83,7 @@ def pretranslate(self, project_pk, locales=None, entities=None):
         .distinct()
     )
 
-    translated_entities = list(translated_entities)
+    translated_entities = set(translated_entities)
 
     translations = []
 
@@ -91,15 +93,27 @@ def pretranslate(self, project_pk, locales=None, entities=None):
     tr_filter = []
     index = -1
 
+    users = get_pretranslation_users()
+
     for locale in locales:
         log.info("Fetching pretranslations for locale {} started".format(locale.code))
-        for entity in entities:
-            locale_entity = "{}-{}".format(locale.id, entity.id)
+
+        locale_entities = [
+            entity
+            for entity in entities
+            if "{}-{}".format(locale.id, entity.id) not in translated_entities
+            and "{}-{}".format(locale.id, entity.resource.id) in tr_pairs
+        ]
+
+        # Look up Translation Memory matches of all strings of the locale at once
+        tm_matches = get_translation_memory_matches(
+            [entity.string for entity in locale_entities], locale
+        )
+
+        for entity in locale_entities:
             locale_resource = "{}-{}".format(locale.id, entity.resource.id)
-            if locale_entity in translated_entities or locale_resource not in tr_pairs:
-                continue
 
-            strings = get_translations(entity, locale)
+            strings = get_translations(entity, locale, tm_matches, users)
 
             if not strings:
                 continue
@@ -142,16 +156,9 @@ def pretranslate(self, project_pk, locales=None, entities=None):
     bulk_run_checks(Translation.objects.for_checks().filter(pk__in=translation_pks))
 
     # Mark translations as changed
-    changed_entities = {}
-    existing = ChangedEntityLocale.objects.values_list("entity", "locale").distinct()
-    for t in translations:
-        key = (t.entity.pk, t.locale.pk)
-        # Remove duplicate changes to prevent unique constraint violation
-        if key not in existing:
-            changed_entities[key] = ChangedEntityLocale(
-                entity=t.entity, locale=t.locale
-            )
-    ChangedEntityLocale.objects.bulk_create(changed_entities.values())
+    ChangedEntityLocale.objects.bulk_mark_changed(
+        (t.entity_id, t.locale_id) for t in translations
+    )
 
     # Update latest activity and stats for changed instances.
     update_changed_instances(tr_filter, tr_dict, translations)
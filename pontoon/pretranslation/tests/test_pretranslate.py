@@ -3,7 +3,11 @@ from unittest.mock import patch
 import pytest
 
 from pontoon.base.models import User
-from pontoon.pretranslation.pretranslate import get_translations
+from pontoon.machinery.utils import get_translation_memory_matches
+from pontoon.pretranslation.pretranslate import (
+    get_pretranslation_users,
+    get_translations,
+)
 from pontoon.test.factories import (
     EntityFactory,
     TranslationMemoryFactory,
@@ -71,3 +75,30 @@ def test_get_translations(gt_mock, locale_b, resource_a, google_translate_locale
         ("gt_translation", 0, gt_user),
         ("gt_translation", 1, gt_user),
     ]
+
+
+@pytest.mark.django_db
+def test_get_translations_tm_matches(locale_b, resource_a):
+    """
+    Use Translation Memory matches looked up in bulk, if given.
+    """
+    entities = [
+        EntityFactory(resource=resource_a, string=x, order=i)
+        for i, x in enumerate(["abaa", "abac"])
+    ]
+    TranslationMemoryFactory.create(
+        entity=entities[0], source="abaa", target="tm_translation", locale=locale_b,
+    )
+
+    tm_matches = get_translation_memory_matches(["abaa", "abac"], locale_b)
+    users = get_pretranslation_users()
+    tm_user = users[0]
+
+    with patch(
+        "pontoon.pretranslation.pretranslate.get_translation_memory_data"
+    ) as tm_mock:
+        assert get_translations(entities[0], locale_b, tm_matches, users) == [
+            ("tm_translation", None, tm_user)
+        ]
+        assert get_translations(entities[1], locale_b, tm_matches, users) == []
+        assert not tm_mock.called
@@ -499,6 +499,12 @@ else:
         }
     }
 
+# Pages/paths with stats of localization dashboards are cached for this many
+# seconds, unless stats or resources of the project locale change earlier.
+PARTS_STATS_CACHE_TIMEOUT = int(
+    os.environ.get("PARTS_STATS_CACHE_TIMEOUT", 60 * 60 * 24)
+)
+
 # Site ID is used by Django's Sites framework.
 SITE_ID = 1
 
@@ -513,6 +519,12 @@ MEDIA_ROOT = path("media")
 # Examples: "http://media.lawrence.com", "http://example.com/media/"
 MEDIA_URL = "/media/"
 
+# Directory of precomputed TMX files of all projects, one per locale, built by
+# the build_translation_memory_files management command. Files older than
+# TMX_FILE_MAX_AGE (in seconds) are ignored and TMX files are built on request.
+TMX_FILES_ROOT = os.environ.get("TMX_FILES_ROOT", os.path.join(MEDIA_ROOT, "tmx"))
+TMX_FILE_MAX_AGE = int(os.environ.get("TMX_FILE_MAX_AGE", 60 * 60 * 25))
+
 # URL prefix for static files.
 # Example: "http://media.lawrence.com/static/"
 STATIC_URL = STATIC_HOST + "/static/"
@@ -741,6 +753,33 @@ except ValueError:
 
 SYNC_LOG_RETENTION = 90  # days
 
+# Parsed resource files are cached by their paths, modification times and
+# sizes, so that unchanged files aren't parsed again within a sync.
+# SYNC_PARSE_CACHE_SIZE limits the number of resources kept in memory of each
+# worker. If SYNC_PARSE_CACHE_TIMEOUT (in seconds) is set, parsed resources are
+# also stored in the cache backend to be reused across sync runs.
+SYNC_PARSE_CACHE_SIZE = int(os.environ.get("SYNC_PARSE_CACHE_SIZE", "1000"))
+SYNC_PARSE_CACHE_TIMEOUT = int(os.environ.get("SYNC_PARSE_CACHE_TIMEOUT", "0"))
+
+# Number of threads resource files of a project are parsed in during sync.
+# Threads overlap file reads and parsers that release the GIL (e.g. lxml), they
+# don't spread parsers written in Python across CPUs.
+SYNC_PARSE_THREADS = int(os.environ.get("SYNC_PARSE_THREADS", os.cpu_count() or 1))
+
+# Number of threads repositories of a multi-locale project are pulled in during
+# sync, and the longest time (in seconds) a single VCS command of a pull may
+# take before it's aborted. Set SYNC_PULL_TIMEOUT to 0 to never abort pulls.
+SYNC_PULL_THREADS = int(os.environ.get("SYNC_PULL_THREADS", "8"))
+SYNC_PULL_TIMEOUT = int(os.environ.get("SYNC_PULL_TIMEOUT", "1800"))
+
+# Latest commit hashes of locales are fetched from repository APIs before sync,
+# in SYNC_COMMIT_HASH_THREADS threads. SYNC_COMMIT_HASH_TIMEOUT (in seconds)
+# limits how long to wait for a response, SYNC_COMMIT_HASH_RATE limits the
+# number of requests per second (0 means no limit).
+SYNC_COMMIT_HASH_THREADS = int(os.environ.get("SYNC_COMMIT_HASH_THREADS", "16"))
+SYNC_COMMIT_HASH_TIMEOUT = int(os.environ.get("SYNC_COMMIT_HASH_TIMEOUT", "10"))
+SYNC_COMMIT_HASH_RATE = int(os.environ.get("SYNC_COMMIT_HASH_RATE", "0"))
+
 MANUAL_SYNC = os.environ.get("MANUAL_SYNC", "True") != "False"
 
 # Celery
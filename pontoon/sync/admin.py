@@ -45,7 +45,7 @@ class ProjectSyncLogAdmin(admin.ModelAdmin):
 
 
 class RepositorySyncLogAdmin(admin.ModelAdmin):
-    list_display = ("repository_url",) + TIMES
+    list_display = ("repository_url",) + TIMES + ("pull_duration",)
 
     def repository_url(self, obj):
         return obj.repository.url
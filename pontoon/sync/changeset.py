@@ -10,12 +10,16 @@ from notifications.signals import notify
 from pontoon.actionlog.models import ActionLog
 from pontoon.base.models import (
     Entity,
+    EntityLocaleStatus,
+    get_word_count,
     Locale,
     Translation,
     TranslationMemoryEntry,
 )
 from pontoon.base.utils import match_attr
+from pontoon.checks import DB_FORMATS
 from pontoon.checks.utils import bulk_run_checks
+from pontoon.sync.utils import QueryCounter
 
 log = logging.getLogger(__name__)
 
@@ -118,6 +122,7 @@ class ChangeSet(object):
         self.bulk_log_actions()
 
         # Clean up any duplicate approvals
+        deduplicated_entity_pks = set()
         if self.locale:
             with connection.cursor() as cursor:
                 cursor.execute(
@@ -136,10 +141,17 @@ class ChangeSet(object):
                             FROM base_translation
                             WHERE entity_id = b.entity_id
                             AND locale_id = b.locale_id
-                            AND (plural_form = b.plural_form OR plural_form IS NULL));
+                            AND (plural_form = b.plural_form OR plural_form IS NULL))
+                    RETURNING b.entity_id;
                 """,
                     {"locale_id": self.locale.id, "project_id": self.db_project.id},
                 )
+                deduplicated_entity_pks = {row[0] for row in cursor.fetchall()}
+
+            if deduplicated_entity_pks:
+                EntityLocaleStatus.objects.refresh(
+                    deduplicated_entity_pks, [self.locale]
+                )
 
         if self.changed_translations:
             # Update 'active' status of all changed translations and their siblings,
@@ -155,21 +167,67 @@ class ChangeSet(object):
             valid_translations = self.bulk_check_translations()
             self.bulk_create_translation_memory_entries(valid_translations)
 
+    def prefetch_entity_approved_translations(self):
+        """
+        Fetch entities changed in the update-VCS phase together with their
+        approved translations and authors, in one query per locale.
+
+        :return: dict of {locale_code: {entity_pk: entity}}, where each entity
+            has its approved translations stored in `db_approved_translations`.
+        """
+        prefetched_entities = {}
+
+        locale_entities = {}
+        for locale_code, db_entity, vcs_entity in self.changes["update_vcs"]:
+            locale_entities.setdefault(locale_code, []).append(db_entity.pk)
+
+        for locale in locale_entities.keys():
+            entities_qs = (
+                Entity.objects.filter(pk__in=locale_entities[locale],)
+                .select_related("resource")
+                .prefetch_related(
+                    Prefetch(
+                        "translation_set",
+                        queryset=Translation.objects.filter(
+                            locale__code=locale, approved=True
+                        ).select_related("user"),
+                        to_attr="db_approved_translations",
+                    )
+                )
+            )
+            prefetched_entities[locale] = {entity.id: entity for entity in entities_qs}
+
+        return prefetched_entities
+
     def execute_update_vcs(self):
         resources = self.vcs_project.resources
         changed_resources = set()
 
-        for locale_code, db_entity, vcs_entity in self.changes["update_vcs"]:
-            changed_resources.add(resources[db_entity.resource.path])
-            vcs_translation = vcs_entity.translations[locale_code]
-            db_translations = db_entity.translation_set.filter(
-                approved=True, locale__code=locale_code
-            )
-            vcs_translation.update_from_db(db_translations)
+        with QueryCounter() as queries:
+            entities_with_translations = self.prefetch_entity_approved_translations()
+
+            for locale_code, db_entity, vcs_entity in self.changes["update_vcs"]:
+                prefetched_entity = entities_with_translations[locale_code][
+                    db_entity.pk
+                ]
+                changed_resources.add(resources[prefetched_entity.resource.path])
+                vcs_translation = vcs_entity.translations[locale_code]
+                db_translations = prefetched_entity.db_approved_translations
+                vcs_translation.update_from_db(db_translations)
+
+                # Track which translators were involved.
+                self.commit_authors_per_locale[locale_code].extend(
+                    [t.user for t in db_translations if t.user]
+                )
 
-            # Track which translators were involved.
-            self.commit_authors_per_locale[locale_code].extend(
-                [t.user for t in db_translations if t.user]
+        if self.changes["update_vcs"]:
+            log.info(
+                "Fetched translations of {count} changed entities for project {project} "
+                "in {queries} queries.".format(
+                    count=len(self.changes["update_vcs"]),
+                    project=self.db_project.slug,
+                    queries=queries.count,
+                )
             )
 
         for resource in changed_resources:
@@ -220,17 +278,43 @@ class ChangeSet(object):
             )
 
     def execute_create_db(self):
+        if not self.changes["create_db"]:
+            return
+
+        # Entities created at the time of this sync with the same data are reused
+        # instead of duplicated, e.g. if the same sync is re-run after a failure.
+        existing_entities = defaultdict(list)
+        for entity in Entity.objects.filter(
+            resource__in={
+                self.resources[vcs_entity.resource.path]
+                for vcs_entity in self.changes["create_db"]
+            },
+            date_created=self.now,
+        ).select_related("resource"):
+            existing_entities[entity.resource_id, entity.key].append(entity)
+
+        entities = []
         new_entities = []
-
         for vcs_entity in self.changes["create_db"]:
-            # We can't use bulk_create since we need a PK
-            entity, created = Entity.objects.get_or_create(
-                **self.get_entity_updates(vcs_entity)
-            )
-
-            if created:
+            entity_updates = self.get_entity_updates(vcs_entity)
+            entity_candidates = existing_entities[
+                entity_updates["resource"].pk, entity_updates["key"]
+            ]
+            entity = match_attr(entity_candidates, **entity_updates)
+
+            if entity is None:
+                entity = Entity(**entity_updates)
+                # Entity.save() isn't called by bulk_create()
+                entity.word_count = get_word_count(entity.string)
+                entity_candidates.append(entity)
                 new_entities.append(entity)
 
+            entities.append((vcs_entity, entity))
+
+        # Primary keys of created entities are set by bulk_create() on PostgreSQL
+        Entity.objects.bulk_create(new_entities, batch_size=1000)
+
+        for vcs_entity, entity in entities:
             for locale_code, vcs_translation in vcs_entity.translations.items():
                 for plural_form, string in vcs_translation.strings.items():
                     self.translations_to_create.append(
@@ -525,7 +609,8 @@ class ChangeSet(object):
 
     def bulk_check_translations(self):
         """
-        Run checks on all changed translations from supported resources
+        Run checks on all changed translations from supported resources and
+        refresh statuses of their entities.
 
         :return: primary keys of translations without warnings and errors.
         """
@@ -533,6 +618,18 @@ class ChangeSet(object):
 
         bulk_run_checks(Translation.objects.for_checks().filter(pk__in=changed_pks))
 
+        # Checks refresh statuses of checked translations only
+        unchecked_translations = Translation.objects.filter(pk__in=changed_pks).exclude(
+            entity__resource__format__in=DB_FORMATS
+        )
+
+        for locale in Locale.objects.filter(
+            pk__in=unchecked_translations.values("locale")
+        ):
+            EntityLocaleStatus.objects.refresh(
+                unchecked_translations.filter(locale=locale).values("entity"), [locale]
+            )
+
         valid_translations = set(
             Translation.objects.filter(pk__in=changed_pks, errors__isnull=True,)
             .values_list("pk", flat=True)
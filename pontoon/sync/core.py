@@ -1,6 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from functools import wraps
 import logging
 import requests
+import threading
+import time
 
 from celery import shared_task
 from collections import Counter
@@ -19,6 +23,7 @@ from pontoon.base.models import (
 )
 from pontoon.sync.changeset import ChangeSet
 from pontoon.sync.vcs.models import VCSProject
+from pontoon.sync.vcs.repositories import CommitToRepositoryException
 
 
 log = logging.getLogger(__name__)
@@ -75,6 +80,38 @@ def serial_task(timeout, lock_key="", on_error=None, **celery_args):
     return wrapper
 
 
+@contextmanager
+def repository_lock(repo, timeout=None, poll_interval=1, wait_timeout=None):
+    """
+    Block until no other task works with the given repository checkout, e.g.
+    when locales of a project are synced in parallel and committed to the same
+    repository.
+    :param timeout: time after which lock is released, defaults to the sync task
+        timeout.
+    :param poll_interval: seconds between attempts to acquire the lock.
+    :param wait_timeout: seconds after which waiting for the lock fails with
+        CommitToRepositoryException, defaults to the lock timeout.
+    """
+    lock_name = "repository_lock[repo={}]".format(repo.pk)
+    timeout = timeout or settings.SYNC_TASK_TIMEOUT
+    deadline = time.monotonic() + (
+        wait_timeout if wait_timeout is not None else timeout
+    )
+
+    while not cache.add(lock_name, True, timeout=timeout):
+        if time.monotonic() >= deadline:
+            raise CommitToRepositoryException(
+                "Timed out waiting for the lock of repository {}.".format(repo.url)
+            )
+
+        time.sleep(poll_interval)
+
+    try:
+        yield
+    finally:
+        cache.delete(lock_name)
+
+
 def collect_entities(db_project, vcs_project, changed_resources):
     """
     Find all the entities in the database and on the filesystem and
@@ -361,7 +398,57 @@ def commit_changes(db_project, vcs_project, changeset, locale):
 
     locale_path = vcs_project.locale_directory_paths[locale.code]
     repo = db_project.repository_for_path(locale_path)
-    repo.commit(commit_message, commit_author, locale_path)
+
+    with repository_lock(repo):
+        repo.commit(commit_message, commit_author, locale_path)
+
+
+def get_latest_commit_ids(repo, locales, session):
+    """
+    Fetch latest commit hashes of the given locales from the repository API.
+
+    Requests are sent concurrently in a pool of SYNC_COMMIT_HASH_THREADS
+    threads, at most SYNC_COMMIT_HASH_RATE per second if set.
+
+    :return: dict mapping locale codes to their latest commit hash, or to None
+        if it couldn't be fetched.
+    """
+    endpoint = repo.api_config["endpoint"]
+    get_key = repo.api_config["get_key"]
+
+    interval = (
+        1 / settings.SYNC_COMMIT_HASH_RATE if settings.SYNC_COMMIT_HASH_RATE else 0
+    )
+    lock = threading.Lock()
+    next_request = [time.monotonic()]
+
+    def fetch(locale_code):
+        # Space out requests evenly to respect the rate limit
+        with lock:
+            now = time.monotonic()
+            wait = next_request[0] - now
+            next_request[0] = max(now, next_request[0]) + interval
+        if wait > 0:
+            time.sleep(wait)
+
+        try:
+            response = session.get(
+                endpoint.format(locale_code=locale_code),
+                timeout=settings.SYNC_COMMIT_HASH_TIMEOUT,
+            )
+
+            # Raise exception on 4XX client error or 5XX server error response
+            response.raise_for_status()
+
+            return get_key(response.json())
+
+        # Errors and exceptions can mean locale is in a different repository or indicate
+        # an actual network problem.
+        except (requests.exceptions.RequestException, ValueError, KeyError):
+            return None
+
+    with ThreadPoolExecutor(max_workers=settings.SYNC_COMMIT_HASH_THREADS) as pool:
+        return dict(zip(locales, pool.map(fetch, locales)))
 
 
 def get_changed_locales(db_project, locales, now):
@@ -382,61 +469,58 @@ def get_changed_locales(db_project, locales, now):
     )
 
     # If locale has changed in the DB, we need to sync it.
-    changed_locale_pks = list(
+    changed_locale_pks = set(
         locales.filter(
             changedentitylocale__entity__resource__project=db_project,
             changedentitylocale__when__lte=now,
         ).values_list("pk", flat=True)
     )
 
-    unchanged_locale_pks = []
-    error_locale_pks = set()
+    pending_locales = {
+        locale.code: locale.pk
+        for locale in locales
+        if locale.pk not in changed_locale_pks
+    }
 
-    for repo in repos:
-        for locale in locales:
-            # If we already processed the locale, we can move on.
-            if locale.pk in changed_locale_pks + unchanged_locale_pks:
-                continue
+    with requests.Session() as session:
+        # Keep a connection per thread alive
+        adapter = requests.adapters.HTTPAdapter(
+            pool_maxsize=settings.SYNC_COMMIT_HASH_THREADS
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
 
-            try:
-                locale_api_endpoint = repo.api_config["endpoint"].format(
-                    locale_code=locale.code
-                )
-                response = requests.get(locale_api_endpoint)
+        for repo in repos:
+            if not pending_locales:
+                break
 
-                # Raise exception on 4XX client error or 5XX server error response
-                response.raise_for_status()
+            commit_ids = get_latest_commit_ids(repo, list(pending_locales), session)
 
-                # If locale has not synced yet, we need to sync it.
-                last_synced_commit_id = repo.get_last_synced_revisions(locale.code)
-                if not last_synced_commit_id:
-                    changed_locale_pks.append(locale.pk)
+            for locale_code, latest_commit_id in commit_ids.items():
+                # Locale might be in a different repository, try the next one.
+                if latest_commit_id is None:
                     continue
 
-                # If locale has changed in the VCS, we need to sync it.
-                latest_commit_id = repo.api_config["get_key"](response.json())
-                if not latest_commit_id.startswith(last_synced_commit_id):
-                    changed_locale_pks.append(locale.pk)
-
-                # If locale hasn't changed in the VCS, we don't need to sync it.
-                else:
-                    unchanged_locale_pks.append(locale.pk)
-
-            # Errors and exceptions can mean locale is in a different repository or indicate
-            # an actual network problem.
-            except requests.exceptions.RequestException:
-                error_locale_pks.add(locale.pk)
-
-    # Check if any locale for which the exception was raised hasn't been processed yet.
-    # For those locales we can't be sure if a change happened, so we assume it did.
-    for l in error_locale_pks:
-        if l not in changed_locale_pks + unchanged_locale_pks:
-            log.error(
-                "Unable to fetch latest commit hash for locale {locale} in project {project}".format(
-                    locale=Locale.objects.get(pk=l), project=db_project.slug
-                )
+                locale_pk = pending_locales.pop(locale_code)
+
+                # If locale has not synced yet, or has changed in the VCS, we need to sync
+                # it. Otherwise, we don't need to sync it.
+                last_synced_commit_id = repo.get_last_synced_revisions(locale_code)
+                if not last_synced_commit_id or not latest_commit_id.startswith(
+                    last_synced_commit_id
+                ):
+                    changed_locale_pks.add(locale_pk)
+
+    # Check if any locale for which the commit hash couldn't be fetched hasn't been
+    # processed yet. For those locales we can't be sure if a change happened, so we
+    # assume it did.
+    for locale_code, locale_pk in pending_locales.items():
+        log.error(
+            "Unable to fetch latest commit hash for locale {locale} in project {project}".format(
+                locale=locale_code, project=db_project.slug
             )
-            changed_locale_pks.append(locale.pk)
+        )
+        changed_locale_pks.add(locale_pk)
 
     changed_locales = db_project.locales.filter(pk__in=changed_locale_pks)
 
@@ -3,7 +3,16 @@ Parsing resource files.
 
 See base.py for the ParsedResource base class.
 """
+import hashlib
+import logging
 import os.path
+import pickle
+import threading
+
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
 
 from pontoon.sync.formats import (
     compare_locales,
@@ -15,6 +24,8 @@ from pontoon.sync.formats import (
     xliff,
 )
 
+log = logging.getLogger(__name__)
+
 # To add support for a new resource format, add an entry to this dict
 # where the key is the extension you're parsing and the value is a
 # callable returning an instance of a ParsedResource subclass.
@@ -50,11 +61,124 @@ def are_compatible_formats(extension_a, extension_b):
         return False
 
 
-def parse(path, source_path=None, locale=None):
+def _parse(path, source_path=None, locale=None):
+    root, extension = os.path.splitext(path)
+    if extension in SUPPORTED_FORMAT_PARSERS:
+        return SUPPORTED_FORMAT_PARSERS[extension](
+            path, source_path=source_path, locale=locale
+        )
+    else:
+        raise ValueError("Translation format {0} is not supported.".format(extension))
+
+
+def _file_stat(path):
+    """
+    Return modification time and size of the given file, or None if it's
+    missing.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return "{}:{}".format(stat.st_mtime_ns, stat.st_size)
+
+
+class ParsedResourceCache(object):
+    """
+    LRU cache of ParsedResources, keyed by paths, modification times and sizes
+    of the parsed files.
+
+    ParsedResources are modified when translations are updated from the
+    database, so they're stored pickled and every hit returns a new copy.
+    Unpickling is considerably cheaper than parsing, and unlike deep copies,
+    FTL resources keep sharing their source resource. Resources that can't be
+    pickled, e.g. XLIFF files, aren't cached.
+    """
+
+    def __init__(self, max_size, timeout=0):
+        """
+        :param int max_size: maximum number of resources kept in memory.
+        :param int timeout: if set, resources are also stored in the cache
+            backend for this many seconds, to be reused across processes.
+        """
+        self.max_size = max_size
+        self.timeout = timeout
+        self.resources = OrderedDict()
+        self.lock = threading.Lock()
+
+    def key(self, path, source_path=None, locale=None):
+        """
+        Parsed resources keep paths they're saved to, so paths are a part of
+        the key in addition to modification times and sizes of the files.
+        """
+        key = "|".join(
+            [
+                path,
+                source_path or "",
+                locale.code if locale else "",
+                _file_stat(path) or "",
+                (_file_stat(source_path) if source_path else None) or "",
+            ]
+        )
+        return "parsed_resource:{}".format(hashlib.sha1(key.encode()).hexdigest())
+
+    def get(self, key):
+        with self.lock:
+            data = self.resources.get(key)
+            if data is not None:
+                self.resources.move_to_end(key)
+
+        if data is None and self.timeout:
+            data = cache.get(key)
+            if data is not None:
+                self.store(key, data)
+
+        return pickle.loads(data) if data is not None else None
+
+    def add(self, key, resource):
+        try:
+            data = pickle.dumps(resource, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            log.debug("Cannot cache parsed resource: {}".format(e))
+            return
+
+        self.store(key, data)
+
+        if self.timeout:
+            try:
+                cache.set(key, data, timeout=self.timeout)
+            except Exception as e:
+                # Storing is best-effort, backends raise their own errors,
+                # e.g. for items exceeding the memcached item size limit
+                log.warning("Cannot store parsed resource in cache: {}".format(e))
+
+    def store(self, key, data):
+        with self.lock:
+            self.resources[key] = data
+            self.resources.move_to_end(key)
+            while len(self.resources) > self.max_size:
+                self.resources.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.resources.clear()
+
+
+parsed_resource_cache = ParsedResourceCache(
+    settings.SYNC_PARSE_CACHE_SIZE, settings.SYNC_PARSE_CACHE_TIMEOUT
+)
+
+
+def parse(path, source_path=None, locale=None, cache=True):
     """
     Parse the resource file at the given path and return a
     ParsedResource with its translations.
 
+    Unchanged files parsed before are returned from parsed_resource_cache.
+    Files are matched by their paths, so temporary files, e.g. the downloaded
+    files of get_download_content(), should be parsed with `cache` disabled,
+    rather than filling the cache with resources that are never parsed again.
+
     :param path:
         Path to the resource file to parse.
     :param source_path:
@@ -64,11 +188,17 @@ def parse(path, source_path=None, locale=None):
     :param locale:
         Object which describes information about currently processed locale.
         Some of the formats require information about things like e.g. plural form.
+    :param cache:
+        Whether to use parsed_resource_cache. Defaults to True.
     """
-    root, extension = os.path.splitext(path)
-    if extension in SUPPORTED_FORMAT_PARSERS:
-        return SUPPORTED_FORMAT_PARSERS[extension](
-            path, source_path=source_path, locale=locale
-        )
-    else:
-        raise ValueError("Translation format {0} is not supported.".format(extension))
+    if not cache or not parsed_resource_cache.max_size:
+        return _parse(path, source_path, locale)
+
+    key = parsed_resource_cache.key(path, source_path, locale)
+    resource = parsed_resource_cache.get(key)
+
+    if resource is None:
+        resource = _parse(path, source_path, locale)
+        parsed_resource_cache.add(key, resource)
+
+    return resource
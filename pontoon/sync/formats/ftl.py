@@ -1,6 +1,9 @@
 import codecs
 import copy
 import logging
+import os
+
+from functools import lru_cache
 
 from fluent.syntax import ast, FluentParser, FluentSerializer
 
@@ -89,9 +92,12 @@ class FTLResource(ParsedResource):
                 key = get_key(obj)
                 comment = [obj.comment.content] if obj.comment else []
 
-                # Do not store comments in the string column
+                # Do not store comments in the string column, but keep them in
+                # the structure, which is reused when saving translations
+                entry_comment = obj.comment
                 obj.comment = None
                 translation = serializer.serialize_entry(obj)
+                obj.comment = entry_comment
 
                 self.entities[key] = FTLEntity(
                     key,
@@ -111,6 +117,20 @@ class FTLResource(ParsedResource):
             elif isinstance(obj, ast.ResourceComment):
                 resource_comment += [obj.content]
 
+    def __getstate__(self):
+        # Shared source resources are pickled and copied as a reference, so
+        # that copies of resources keep sharing them
+        state = self.__dict__.copy()
+        source_key = getattr(self.source_resource, "source_key", None)
+        if source_key is not None:
+            state["source_resource"] = source_key
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if isinstance(self.source_resource, tuple):
+            self.source_resource = _parse_source(*self.source_resource)
+
     @property
     def translations(self):
         return sorted(self.entities.values(), key=lambda e: e.order)
@@ -128,24 +148,21 @@ class FTLResource(ParsedResource):
                 )
             )
 
-        with codecs.open(self.source_resource.path, "r", "utf-8") as resource:
-            structure = parser.parse(resource.read())
-
-        entities = structure.body
-
-        # Use list() to iterate over a copy, leaving original free to modify
-        for obj in list(entities):
+        # Build a new body in a single pass over the source structure, which is
+        # shared with resources of other locales and must not be modified
+        body = []
+        for obj in self.source_resource.structure.body:
             if isinstance(obj, localizable_entries):
-                index = entities.index(obj)
-                key = get_key(obj)
-                entity = self.entities[key]
+                entity = self.entities[get_key(obj)]
 
                 if entity.strings:
                     message = parser.parse_entry(entity.strings[None])
                     message.comment = obj.comment
-                    entities[index] = message
-                else:
-                    del entities[index]
+                    body.append(message)
+            else:
+                body.append(obj)
+
+        structure = ast.Resource(body)
 
         create_parent_directory(self.path)
 
@@ -167,9 +184,22 @@ def get_key(obj):
     return key
 
 
+@lru_cache(maxsize=128)
+def _parse_source(path, mtime, size):
+    """
+    Parse the source resource, which is the same for all locales. Modification
+    time and size of the file are a part of the cache key, so that changes
+    pulled from VCS are picked up.
+    """
+    resource = FTLResource(path, None)
+    resource.source_key = (path, mtime, size)
+    return resource
+
+
 def parse(path, source_path=None, locale=None):
     if source_path is not None:
-        source_resource = FTLResource(source_path, locale)
+        stat = os.stat(source_path)
+        source_resource = _parse_source(source_path, stat.st_mtime_ns, stat.st_size)
     else:
         source_resource = None
     return FTLResource(path, locale, source_resource)
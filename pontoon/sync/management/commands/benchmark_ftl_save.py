@@ -0,0 +1,111 @@
+import os
+import shutil
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand
+
+from pontoon.sync import formats
+
+
+class Command(BaseCommand):
+    help = """
+        Measure parsing and saving of a generated FTL resource with the given
+        number of messages, translated into the given number of locales.
+
+        Resources are parsed the way sync parses them, through the parsed
+        resource cache: once with an empty cache, once from the cache.
+
+        Meant to compare sync performance of large FTL files before and after
+        changes to the FTL format support.
+        """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--messages",
+            action="store",
+            dest="messages",
+            type=int,
+            default=5000,
+            help="Number of messages in the FTL resource",
+        )
+
+        parser.add_argument(
+            "--locales",
+            action="store",
+            dest="locales",
+            type=int,
+            default=100,
+            help="Number of locales to save the FTL resource for",
+        )
+
+    def handle(self, *args, **options):
+        root = tempfile.mkdtemp()
+
+        try:
+            self.benchmark(root, options["messages"], options["locales"])
+        finally:
+            shutil.rmtree(root)
+
+    def write(self, path, messages, suffix):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, "w") as f:
+            for i in range(messages):
+                f.write(
+                    "# Comment of message {i}\n"
+                    "message-{i} = Message {i}{suffix}\n"
+                    "    .title = Title {i}{suffix}\n\n".format(i=i, suffix=suffix)
+                )
+
+    def benchmark(self, root, messages, locales):
+        source_path = os.path.join(root, "templates", "messages.ftl")
+        self.write(source_path, messages, "")
+
+        locale_paths = []
+        for i in range(locales):
+            path = os.path.join(root, "locale-{}".format(i), "messages.ftl")
+            self.write(path, messages, " (locale {})".format(i))
+            locale_paths.append(path)
+
+        formats.parsed_resource_cache.clear()
+
+        parse_duration = 0
+        for path in locale_paths:
+            start = time.time()
+            formats.parse(path, source_path=source_path)
+            parse_duration += time.time() - start
+
+        cached_parse_duration = 0
+        save_duration = 0
+
+        for path in locale_paths:
+            start = time.time()
+            resource = formats.parse(path, source_path=source_path)
+            cached_parse_duration += time.time() - start
+
+            # Change every other translation, remove every tenth
+            for translation in resource.translations[::2]:
+                translation.strings = {
+                    None: "{} = Changed".format(translation.key),
+                }
+            for translation in resource.translations[::10]:
+                translation.strings = {}
+
+            start = time.time()
+            resource.save(None)
+            save_duration += time.time() - start
+
+        formats.parsed_resource_cache.clear()
+
+        self.stdout.write(
+            "FTL resource with {messages} messages in {locales} locales: "
+            "parsed in {parse:.2f}s, parsed from cache in {cached_parse:.2f}s, "
+            "saved in {save:.2f}s".format(
+                messages=messages,
+                locales=locales,
+                parse=parse_duration,
+                cached_parse=cached_parse_duration,
+                save=save_duration,
+            )
+        )
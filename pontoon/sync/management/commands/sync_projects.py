@@ -42,6 +42,15 @@ class Command(BaseCommand):
             help="Always sync even if there are no changes",
         )
 
+        parser.add_argument(
+            "--locales-per-task",
+            action="store",
+            dest="locales_per_task",
+            type=int,
+            default=0,
+            help="Sync translations in parallel tasks of this many locales each",
+        )
+
     def handle(self, *args, **options):
         """
         Collect the projects we want to sync and trigger worker jobs to
@@ -92,4 +101,5 @@ class Command(BaseCommand):
                     no_pull=options["no_pull"],
                     no_commit=options["no_commit"],
                     force=options["force"],
+                    locales_per_task=options["locales_per_task"],
                 )
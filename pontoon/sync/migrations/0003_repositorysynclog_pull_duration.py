@@ -0,0 +1,18 @@
+# Generated by Django 3.1.3 on 2026-10-18 04:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("sync", "0002_change_pontoon_sync_email"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="repositorysynclog",
+            name="pull_duration",
+            field=models.DurationField(blank=True, default=None, null=True),
+        ),
+    ]
@@ -77,6 +77,9 @@ class SyncLog(BaseLog):
         TranslatedResource.objects.bulk_update(
             translated_resources, fields=["total_strings"]
         )
+        ProjectLocale.invalidate_parts_stats(
+            {(t.resource.project_id, t.locale_id) for t in translated_resources}
+        )
 
         # total_strings missmatch in ProjectLocales within the same project
         for p in Project.objects.available():
@@ -180,6 +183,9 @@ class RepositorySyncLog(BaseLog):
     start_time = models.DateTimeField(default=timezone.now)
     end_time = models.DateTimeField(default=None, blank=True, null=True)
 
+    #: Time spent pulling the repository, or its locale repositories.
+    pull_duration = models.DurationField(default=None, blank=True, null=True)
+
     @cached_property
     def finished(self):
         return self.end_time is not None
@@ -1,11 +1,15 @@
 import logging
 
+from celery import shared_task
+
 from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
 from django.utils import timezone
 
 from pontoon.base.models import (
     ChangedEntityLocale,
+    Entity,
     Project,
     Locale,
 )
@@ -61,7 +65,13 @@ def update_locale_project_locale_stats(locale, project):
     on_error=sync_project_error,
 )
 def sync_project(
-    self, project_pk, sync_log_pk, no_pull=False, no_commit=False, force=False,
+    self,
+    project_pk,
+    sync_log_pk,
+    no_pull=False,
+    no_commit=False,
+    force=False,
+    locales_per_task=0,
 ):
     """Fetch the project with the given PK and perform sync on it."""
     db_project = get_or_fail(
@@ -88,6 +98,15 @@ def sync_project(
         sync_log=sync_log, project=db_project, start_time=now
     )
 
+    # Translations might still be synced by tasks of the previous sync
+    if cache.get(sync_translations_lock_key(project_pk)):
+        log.info(
+            "Skipping project {0}, translations of the previous sync are still "
+            "being synced.".format(db_project.slug)
+        )
+        project_sync_log.skip()
+        return
+
     log.info("Syncing project {0}.".format(db_project.slug))
 
     source_changes = sync_sources(db_project, now, force, no_pull)
@@ -110,6 +129,8 @@ def sync_project(
         no_pull=no_pull,
         no_commit=no_commit,
         force=force,
+        locales_per_task=locales_per_task,
+        source_pull_duration=source_changes.get("pull_duration"),
     )
 
 
@@ -117,11 +138,14 @@ def sync_sources(db_project, now, force, no_pull):
     # Pull from source repository
     if no_pull:
         has_source_repo_changed = True
+        pull_duration = None
     else:
         log.info(
             "Pulling source changes for project {0} started.".format(db_project.slug)
         )
+        start = timezone.now()
         has_source_repo_changed = pull_source_repo_changes(db_project)
+        pull_duration = timezone.now() - start
         log.info(
             "Pulling source changes for project {0} complete.".format(db_project.slug)
         )
@@ -162,6 +186,7 @@ def sync_sources(db_project, now, force, no_pull):
         "removed_paths": removed_paths,
         "changed_paths": changed_paths,
         "new_entities": new_entities,
+        "pull_duration": pull_duration,
     }
 
 
@@ -177,6 +202,8 @@ def sync_translations(
     no_pull=False,
     no_commit=False,
     force=False,
+    locales_per_task=0,
+    source_pull_duration=None,
 ):
     repo = db_project.translation_repositories()[0]
 
@@ -227,9 +254,11 @@ def sync_translations(
             log.info(
                 "Pulling locale repos for project {0} started.".format(db_project.slug)
             )
+            start = timezone.now()
             have_locale_repos_changed, pulled_repo_locales = pull_locale_repo_changes(
                 db_project, locales
             )
+            repo_sync_log.pull_duration = timezone.now() - start
             log.info(
                 "Pulling locale repos for project {0} complete.".format(db_project.slug)
             )
@@ -237,6 +266,12 @@ def sync_translations(
             have_repos_changed |= have_locale_repos_changed
             repo_locales.update(pulled_repo_locales)
 
+        # Translations of single repo projects are pulled with sources
+        else:
+            repo_sync_log.pull_duration = source_pull_duration
+
+        repo_sync_log.save(update_fields=["pull_duration"])
+
     # If none of the repos has changed since the last sync and there are
     # no Pontoon-side changes for this project, quit early.
     if (
@@ -249,6 +284,23 @@ def sync_translations(
         repo_sync_log.end()
         return
 
+    if locales_per_task and len(locales) > locales_per_task:
+        sync_translations_in_parallel(
+            db_project,
+            repo_sync_log,
+            now,
+            locales,
+            repo_locales,
+            added_paths,
+            removed_paths,
+            changed_paths,
+            new_entities,
+            no_commit,
+            force,
+            locales_per_task,
+        )
+        return
+
     vcs_project = VCSProject(
         db_project,
         now,
@@ -259,6 +311,36 @@ def sync_translations(
         force=force,
     )
 
+    synced_locales, failed_locales, new_locales = sync_locales(
+        db_project, vcs_project, locales, now, no_commit
+    )
+
+    finish_sync_translations(
+        db_project,
+        repo_sync_log,
+        vcs_project,
+        locales,
+        repo_locales,
+        synced_locales,
+        failed_locales,
+        new_locales,
+        added_paths,
+        removed_paths,
+        changed_paths,
+        new_entities,
+    )
+
+
+def sync_locales(db_project, vcs_project, locales, now, no_commit=False):
+    """
+    Sync translations of the given locales between the database and VCS, each
+    locale in its own transaction.
+
+    :returns: a tuple of (synced locale codes, failed locale codes, pks of
+        locales with newly created translated resources).
+    """
+    readonly_locales = db_project.locales.filter(project_locale__readonly=True)
+
     synced_locales = set()
     failed_locales = set()
 
@@ -330,8 +412,33 @@ def sync_translations(
 
             failed_locales.add(locale.code)
 
+    return synced_locales, failed_locales, new_locales
+
+
+def finish_sync_translations(
+    db_project,
+    repo_sync_log,
+    vcs_project,
+    locales,
+    repo_locales,
+    synced_locales,
+    failed_locales,
+    new_locales,
+    added_paths=None,
+    removed_paths=None,
+    changed_paths=None,
+    new_entities=None,
+):
+    """
+    Update stats affected by source changes, store synced revisions and
+    pretranslate, once translations of all locales have been synced.
+    """
     # If sources have changed, update stats for all locales.
     if added_paths or removed_paths or changed_paths:
+        added_and_changed_resources = db_project.resources.filter(
+            path__in=list(added_paths or []) + list(changed_paths or [])
+        ).distinct()
+
         for locale in db_project.locales.all():
             # Already synced.
             if locale.code in synced_locales:
@@ -341,7 +448,7 @@ def sync_translations(
             if locale in locales:
                 created = update_translated_resources(db_project, vcs_project, locale)
                 if created:
-                    new_locales.append[locale.pk]
+                    new_locales.append(locale.pk)
 
             # We don't have files: we can still update asymmetric translated resources.
             else:
@@ -400,3 +507,238 @@ def sync_translations(
         if new_entities and locales:
             new_entities = list(set(new_entities))
             pretranslate(db_project.pk, locales=locales, entities=new_entities)
+
+
+def sync_translations_lock_key(project_pk):
+    """
+    Cache key marking that translations of the given project are being synced
+    by parallel sync_locales_task subtasks.
+    """
+    return "sync_translations[project={}]".format(project_pk)
+
+
+def sync_translations_pending_key(repo_sync_log_pk):
+    """
+    Cache key counting sync_locales_task subtasks of the given repository sync
+    that haven't finished yet.
+    """
+    return "sync_translations[repo_sync_log={}]:pending".format(repo_sync_log_pk)
+
+
+def sync_translations_result_key(repo_sync_log_pk, task_index):
+    """Cache key storing the outcome of the given sync_locales_task subtask."""
+    return "sync_translations[repo_sync_log={}]:result={}".format(
+        repo_sync_log_pk, task_index
+    )
+
+
+def sync_translations_finished_key(repo_sync_log_pk):
+    """
+    Cache key marking that a sync_locales_task subtask has started to complete
+    the given repository sync.
+    """
+    return "sync_translations[repo_sync_log={}]:finished".format(repo_sync_log_pk)
+
+
+def count_down_sync_locales_tasks(repo_sync_log_pk, task_count):
+    """
+    Count down sync_locales_task subtasks of the given repository sync that
+    haven't finished yet.
+
+    :return: True if the calling subtask is the last one to finish and should
+        complete the sync.
+    """
+    try:
+        pending = cache.decr(sync_translations_pending_key(repo_sync_log_pk))
+    except ValueError:
+        # The counter expired or got evicted, count stored results instead
+        results = cache.get_many(
+            [
+                sync_translations_result_key(repo_sync_log_pk, i)
+                for i in range(task_count)
+            ]
+        )
+        pending = task_count - len(results)
+
+        log.warning(
+            "Counter of pending tasks of repository sync {pk} not found, "
+            "{pending} of {count} tasks haven't stored their results.".format(
+                pk=repo_sync_log_pk, pending=pending, count=task_count,
+            )
+        )
+
+    # Only one of the subtasks that see no pending subtasks completes the sync
+    return pending <= 0 and cache.add(
+        sync_translations_finished_key(repo_sync_log_pk),
+        True,
+        timeout=settings.SYNC_TASK_TIMEOUT,
+    )
+
+
+def sync_translations_in_parallel(
+    db_project,
+    repo_sync_log,
+    now,
+    locales,
+    repo_locales,
+    added_paths,
+    removed_paths,
+    changed_paths,
+    new_entities,
+    no_commit,
+    force,
+    locales_per_task,
+):
+    """
+    Dispatch translations of each group of `locales_per_task` locales to be
+    synced in its own sync_locales_task subtask.
+
+    Celery doesn't store task results, so chords aren't available. Instead,
+    subtasks count down a counter in the cache and the last one to finish
+    completes the sync with finish_sync_translations(). If the counter gets
+    lost, subtasks count stored results instead.
+    """
+    locale_pks = [l.pk for l in locales]
+    locale_groups = [
+        locale_pks[i : i + locales_per_task]
+        for i in range(0, len(locale_pks), locales_per_task)
+    ]
+
+    cache.set(
+        sync_translations_lock_key(db_project.pk),
+        True,
+        timeout=settings.SYNC_TASK_TIMEOUT,
+    )
+    cache.set(
+        sync_translations_pending_key(repo_sync_log.pk),
+        len(locale_groups),
+        timeout=settings.SYNC_TASK_TIMEOUT,
+    )
+
+    log.info(
+        "Syncing translations for project {project} in {count} tasks.".format(
+            project=db_project.slug, count=len(locale_groups),
+        )
+    )
+
+    # Querysets of pulled locales are evaluated per task
+    repo_locale_pks = (
+        {
+            repo_pk: [l.pk for l in repo_locales[repo_pk]]
+            for repo_pk in repo_locales.keys()
+        }
+        if repo_locales is not None
+        else None
+    )
+
+    for task_index, group_locale_pks in enumerate(locale_groups):
+        sync_locales_task.delay(
+            db_project.pk,
+            repo_sync_log.pk,
+            task_index,
+            len(locale_groups),
+            group_locale_pks,
+            locale_pks,
+            repo_locale_pks,
+            now,
+            added_paths=added_paths,
+            removed_paths=removed_paths,
+            changed_paths=changed_paths,
+            new_entity_pks=[e.pk for e in new_entities or []],
+            no_commit=no_commit,
+            force=force,
+        )
+
+
+@shared_task(base=PontoonTask)
+def sync_locales_task(
+    project_pk,
+    repo_sync_log_pk,
+    task_index,
+    task_count,
+    group_locale_pks,
+    locale_pks,
+    repo_locale_pks,
+    now,
+    added_paths=None,
+    removed_paths=None,
+    changed_paths=None,
+    new_entity_pks=None,
+    no_commit=False,
+    force=False,
+):
+    """
+    Sync translations of a group of locales of the project, dispatched by
+    sync_translations_in_parallel(). The last task to finish completes the
+    sync of the project.
+    """
+    db_project = Project.objects.get(pk=project_pk)
+    repo_locales = (
+        {
+            repo_pk: Locale.objects.filter(pk__in=pks)
+            for repo_pk, pks in repo_locale_pks.items()
+        }
+        if repo_locale_pks is not None
+        else None
+    )
+
+    def get_vcs_project(locales):
+        return VCSProject(
+            db_project,
+            now,
+            locales=locales,
+            repo_locales=repo_locales,
+            added_paths=added_paths,
+            changed_paths=changed_paths,
+            force=force,
+        )
+
+    group_locales = db_project.locales.filter(pk__in=group_locale_pks)
+    result = (set(), set(l.code for l in group_locales), [])
+
+    try:
+        result = sync_locales(
+            db_project, get_vcs_project(group_locales), group_locales, now, no_commit
+        )
+    finally:
+        cache.set(
+            sync_translations_result_key(repo_sync_log_pk, task_index),
+            result,
+            timeout=settings.SYNC_TASK_TIMEOUT,
+        )
+
+        # The last task to finish completes the sync, even if this one failed
+        if count_down_sync_locales_tasks(repo_sync_log_pk, task_count):
+            try:
+                synced_locales, failed_locales, new_locales = set(), set(), []
+                results = cache.get_many(
+                    [
+                        sync_translations_result_key(repo_sync_log_pk, i)
+                        for i in range(task_count)
+                    ]
+                )
+                for synced, failed, new in results.values():
+                    synced_locales |= synced
+                    failed_locales |= failed
+                    new_locales += new
+
+                locales = db_project.locales.filter(pk__in=locale_pks)
+
+                # Only resources of locales that haven't been synced by any of
+                # the tasks are needed to finish the sync
+                finish_sync_translations(
+                    db_project,
+                    RepositorySyncLog.objects.get(pk=repo_sync_log_pk),
+                    get_vcs_project(locales.exclude(code__in=synced_locales)),
+                    locales,
+                    repo_locales,
+                    synced_locales,
+                    failed_locales,
+                    new_locales,
+                    added_paths,
+                    removed_paths,
+                    changed_paths,
+                    list(Entity.objects.filter(pk__in=new_entity_pks or [])),
+                )
+            finally:
+                cache.delete(sync_translations_lock_key(project_pk))
@@ -1,5 +1,20 @@
-from pontoon.base.tests import TestCase
-from pontoon.sync.formats import are_compatible_formats
+import os
+import shutil
+import tempfile
+import threading
+
+from unittest.mock import Mock, patch
+
+from pontoon.base.tests import create_tempfile, TestCase
+from pontoon.sync.formats import (
+    are_compatible_formats,
+    parse,
+    parsed_resource_cache,
+    ParsedResourceCache,
+    SUPPORTED_FORMAT_PARSERS,
+)
+from pontoon.sync.formats.ftl import parse as parse_ftl
+from pontoon.sync.formats.silme import parse_properties
 
 
 class CompareLocalesResourceTests(TestCase):
@@ -20,3 +35,110 @@ class CompareLocalesResourceTests(TestCase):
 
         # Not supported file format
         assert not are_compatible_formats(".something", ".else")
+
+
+class ParsedResourceCacheTests(TestCase):
+    def setUp(self):
+        parsed_resource_cache.clear()
+        self.addCleanup(parsed_resource_cache.clear)
+
+    def test_parse_unchanged_file_once(self):
+        """
+        Parse unchanged files only once, returning a copy of the parsed resource
+        for every call.
+        """
+        path = create_tempfile("key = Value\n")
+        path = shutil.move(path, path + ".properties")
+
+        with patch.dict(
+            SUPPORTED_FORMAT_PARSERS, {".properties": Mock(wraps=parse_properties)}
+        ) as parsers:
+            first = parse(path)
+            second = parse(path)
+            assert parsers[".properties"].call_count == 1
+            assert first is not second
+            assert second.translations[0].strings == {None: "Value"}
+
+            with open(path, "w") as f:
+                f.write("key = Changed value\n")
+
+            third = parse(path)
+            assert parsers[".properties"].call_count == 2
+            assert third.translations[0].strings == {None: "Changed value"}
+
+    def test_parse_without_cache(self):
+        """
+        Files parsed with the cache disabled, e.g. temporary files, are parsed
+        every time and not added to the cache.
+        """
+        path = create_tempfile("key = Value\n")
+        path = shutil.move(path, path + ".properties")
+
+        with patch.dict(
+            SUPPORTED_FORMAT_PARSERS, {".properties": Mock(wraps=parse_properties)}
+        ) as parsers:
+            parse(path, cache=False)
+            parse(path, cache=False)
+            assert parsers[".properties"].call_count == 2
+
+        assert not parsed_resource_cache.resources
+
+    def test_lru_bound(self):
+        """Evict the least recently used resource once the cache is full."""
+        cache = ParsedResourceCache(max_size=2)
+        cache.add("a", ["a"])
+        cache.add("b", ["b"])
+        assert cache.get("a") == ["a"]
+
+        cache.add("c", ["c"])
+        assert cache.get("b") is None
+        assert cache.get("a") == ["a"]
+        assert cache.get("c") == ["c"]
+
+    def test_unpicklable_resource(self):
+        """Resources that can't be pickled aren't cached."""
+        cache = ParsedResourceCache(max_size=2)
+        cache.add("a", threading.Lock())
+        assert cache.get("a") is None
+
+    def test_cache_backend_error(self):
+        """Errors of the cache backend don't prevent parsing."""
+        cache = ParsedResourceCache(max_size=2, timeout=60)
+
+        with patch(
+            "pontoon.sync.formats.cache.set", side_effect=Exception("Too big")
+        ), patch("pontoon.sync.formats.log") as mock_log:
+            cache.add("a", ["a"])
+
+        assert cache.get("a") == ["a"]
+        assert mock_log.warning.called
+
+    def test_shared_ftl_source(self):
+        """
+        FTL resources returned from the cache keep sharing the parsed source
+        resource, instead of getting a copy each.
+        """
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+
+        source_path = os.path.join(root, "source.ftl")
+        with open(source_path, "w") as f:
+            f.write("key = Value\n")
+
+        paths = []
+        for locale_code in ("de", "fr"):
+            path = os.path.join(root, locale_code + ".ftl")
+            with open(path, "w") as f:
+                f.write("key = Value {}\n".format(locale_code))
+            paths.append(path)
+
+        with patch.dict(
+            SUPPORTED_FORMAT_PARSERS, {".ftl": Mock(wraps=parse_ftl)}
+        ) as parsers:
+            resources = [parse(path, source_path) for path in paths]
+            resources += [parse(path, source_path) for path in paths]
+            assert parsers[".ftl"].call_count == 2
+
+        source_resource = resources[0].source_resource
+        assert all(r.source_resource is source_resource for r in resources)
+        assert resources[3].translations[0].strings == {None: "key = Value fr\n"}
@@ -85,6 +85,40 @@ class FTLResourceTests(FormatTestsMixin, TestCase):
         assert obj.source_resource.path == source_path
         assert obj.source_resource.locale is None
 
+    def test_parse_shared_source(self):
+        """
+        The source resource is parsed once and shared by resources of all
+        locales, which don't modify it when saved.
+        """
+        contents = dedent(
+            """
+            # Comment
+            first = First
+            second = Second
+        """
+        )
+        source_path = create_named_tempfile(
+            contents, prefix="strings", suffix=".ftl", directory=self.tempdir,
+        )
+        path_a = os.path.join(self.tempdir, "a", "strings.ftl")
+        path_b = os.path.join(self.tempdir, "b", "strings.ftl")
+
+        resource_a = ftl.parse(path_a, source_path=source_path, locale=None)
+        resource_b = ftl.parse(path_b, source_path=source_path, locale=None)
+        assert resource_a.source_resource is resource_b.source_resource
+
+        resource_a.translations[0].strings = {None: "first = First A"}
+        resource_a.save(None)
+
+        for translation in resource_b.translations:
+            translation.strings = {None: "{key} = {key} B".format(key=translation.key)}
+        resource_b.save(None)
+
+        self.assert_file_content(path_a, "# Comment\nfirst = First A\n")
+        self.assert_file_content(
+            path_b, "# Comment\nfirst = first B\nsecond = second B\n",
+        )
+
     def test_parse_with_no_source_path(self):
         contents = "text = Arise, awake and do not stop until the goal is reached."
         path = create_named_tempfile(
@@ -3,13 +3,14 @@ from unittest.mock import Mock, MagicMock, patch
 import pytest
 
 from pontoon.actionlog.models import ActionLog
-from pontoon.base.models import Entity
+from pontoon.base.models import Entity, EntityLocaleStatus
 from pontoon.base.tests import (
     assert_attributes_equal,
     TranslationFactory,
     UserFactory,
 )
 from pontoon.base.utils import aware_datetime
+from pontoon.sync.changeset import ChangeSet
 from pontoon.sync.tests import FakeCheckoutTestCase
 
 
@@ -144,6 +145,33 @@ class ChangeSetTests(FakeCheckoutTestCase):
             fuzzy=False,
         )
 
+    def test_create_db_bulk(self):
+        """
+        Create new entities in bulk, reusing entities already created by the
+        same sync.
+        """
+        self.main_db_entity.delete()
+
+        self.changeset.create_db_entity(self.main_vcs_entity)
+        self.changeset.execute_create_db()
+        new_entity = Entity.objects.get(
+            resource=self.main_db_resource, string=self.main_vcs_entity.string,
+        )
+        assert self.changeset.new_entities == [new_entity]
+        assert new_entity.word_count == 2
+
+        changeset = ChangeSet(self.db_project, self.vcs_project, self.now)
+        changeset.create_db_entity(self.main_vcs_entity)
+        changeset.execute_create_db()
+        assert changeset.new_entities == []
+        assert changeset.translations_to_create[0].entity == new_entity
+        assert (
+            Entity.objects.filter(
+                resource=self.main_db_resource, string=self.main_vcs_entity.string,
+            ).count()
+            == 1
+        )
+
     def update_main_db_entity(self):
         self.changeset.update_db_entity(
             self.translated_locale, self.main_db_entity, self.main_vcs_entity
@@ -258,6 +286,22 @@ class ChangeSetTests(FakeCheckoutTestCase):
             action_type="translation:created", translation=translation.pk,
         ).exists()
 
+    def test_update_db_unchecked_format_status(self):
+        """
+        Statuses of entities are refreshed also for translations of formats
+        that aren't checked.
+        """
+        self.main_db_resource.format = "po"
+        self.main_db_resource.save()
+        self.main_db_translation.delete()
+        EntityLocaleStatus.objects.all().delete()
+        self.update_main_db_entity()
+
+        status = EntityLocaleStatus.objects.get(
+            entity=self.main_db_entity, locale=self.translated_locale
+        )
+        assert status.approved == 1
+
     def test_update_db_unfuzzy_existing(self):
         """
         Any existing fuzzy translations get unfuzzied.
@@ -611,3 +655,40 @@ class AuthorsTests(FakeCheckoutTestCase):
                 self.changeset.commit_authors_per_locale[self.translated_locale.code]
                 == []
             )
+
+    def test_authors_prefetched(self):
+        """
+        Approved translations and their authors should be fetched in a fixed
+        number of queries, regardless of the number of changed entities.
+        """
+        first_author, second_author = UserFactory.create_batch(2)
+        TranslationFactory.create(
+            locale=self.translated_locale,
+            entity=self.main_db_entity,
+            user=first_author,
+            approved=True,
+        )
+        TranslationFactory.create(
+            locale=self.translated_locale,
+            entity=self.other_db_entity,
+            user=second_author,
+            approved=True,
+        )
+
+        self.changeset.vcs_project.resources = {
+            self.main_db_resource.path: MagicMock(),
+            self.other_db_resource.path: MagicMock(),
+        }
+        self.changeset.update_vcs_entity(
+            self.translated_locale, self.main_db_entity, MagicMock()
+        )
+        self.changeset.update_vcs_entity(
+            self.translated_locale, self.other_db_entity, MagicMock()
+        )
+
+        with self.assertNumQueries(2):
+            self.changeset.execute_update_vcs()
+
+        assert set(
+            self.changeset.commit_authors_per_locale[self.translated_locale.code]
+        ) == {first_author, second_author}
@@ -1,7 +1,13 @@
+import json
 import os.path
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import ANY, Mock, patch, PropertyMock, MagicMock
 
 import pytest
+from django.test import override_settings
+from django.utils import timezone
 
 from pontoon.base.models import (
     Entity,
@@ -11,12 +17,17 @@ from pontoon.base.models import (
 )
 from pontoon.base.tests import (
     CONTAINS,
+    LocaleFactory,
     NOT,
+    ProjectFactory,
+    RepositoryFactory,
+    TestCase,
     UserFactory,
 )
 from pontoon.sync.core import (
     commit_changes,
     entity_key,
+    get_changed_locales,
     pull_locale_repo_changes,
     update_entities,
     update_resources,
@@ -393,3 +404,120 @@ class PullChangesTests(FakeCheckoutTestCase):
             self.db_project, locales=self.db_project.locales.all()
         )
         assert not has_changed
+
+
+class CommitHashHandler(BaseHTTPRequestHandler):
+    """
+    Serve latest commit hashes of locales like the repository APIs do, with
+    a delay to expose concurrent requests.
+    """
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+
+        locale_code = self.path.strip("/")
+        time.sleep(server.delays.get(locale_code, 0.1))
+
+        with server.lock:
+            server.active -= 1
+
+        commit_id = server.commit_ids.get(locale_code)
+        if commit_id is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(json.dumps({"node": commit_id}).encode("utf-8"))
+
+    def log_message(self, *args):
+        pass
+
+
+@override_settings(SYNC_COMMIT_HASH_THREADS=4, SYNC_COMMIT_HASH_TIMEOUT=1)
+class GetChangedLocalesTests(TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), CommitHashHandler)
+        self.server.lock = threading.Lock()
+        self.server.active = 0
+        self.server.max_active = 0
+        self.server.commit_ids = {}
+        self.server.delays = {}
+
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        api_config_patch = patch.object(
+            Repository,
+            "api_config",
+            new_callable=PropertyMock,
+            return_value={
+                "endpoint": "http://127.0.0.1:{port}/{{locale_code}}".format(
+                    port=self.server.server_address[1]
+                ),
+                "get_key": lambda x: x["node"],
+            },
+        )
+        api_config_patch.start()
+        self.addCleanup(api_config_patch.stop)
+
+        self.locales = [LocaleFactory.create(code="locale-%s" % i) for i in range(8)]
+        self.repository = RepositoryFactory.create(
+            url="ssh://hg.mozilla.org/l10n-central/{locale_code}/",
+            last_synced_revisions={
+                locale.code: "synced-%s" % locale.code for locale in self.locales
+            },
+        )
+        self.db_project = ProjectFactory.create(
+            locales=self.locales, repositories=[self.repository],
+        )
+
+    def get_changed_locale_codes(self):
+        locales = self.db_project.locales.all()
+        changed_locales = get_changed_locales(self.db_project, locales, timezone.now())
+        return sorted(changed_locales.values_list("code", flat=True))
+
+    def test_changed_locales(self):
+        """
+        Only locales with a new commit, without a synced revision or
+        without a commit hash are changed.
+        """
+        self.server.commit_ids = {
+            locale.code: "synced-%s" % locale.code for locale in self.locales
+        }
+        self.server.commit_ids["locale-0"] = "new"
+        del self.server.commit_ids["locale-1"]
+        del self.repository.last_synced_revisions["locale-2"]
+        self.repository.save()
+
+        with patch("pontoon.sync.core.log") as mock_log:
+            assert self.get_changed_locale_codes() == [
+                "locale-0",
+                "locale-1",
+                "locale-2",
+            ]
+
+        mock_log.error.assert_called_once_with(CONTAINS("locale-1"))
+
+    def test_concurrent_requests(self):
+        """
+        Commit hashes of locales are fetched concurrently, and slow
+        responses time out.
+        """
+        self.server.commit_ids = {
+            locale.code: "synced-%s" % locale.code for locale in self.locales
+        }
+        self.server.delays["locale-0"] = 2
+
+        start = time.monotonic()
+        assert self.get_changed_locale_codes() == ["locale-0"]
+
+        assert self.server.max_active == 4
+        assert time.monotonic() - start < 2
@@ -31,6 +31,7 @@ class CommandTests(TestCase):
         kwargs.setdefault("no_commit", False)
         kwargs.setdefault("no_pull", False)
         kwargs.setdefault("force", False)
+        kwargs.setdefault("locales_per_task", 0)
 
         self.command.handle(*args, **kwargs)
 
@@ -45,7 +46,12 @@ class CommandTests(TestCase):
 
         self.execute_command()
         self.mock_sync_project.delay.assert_called_with(
-            active_project.pk, ANY, no_pull=False, no_commit=False, force=False,
+            active_project.pk,
+            ANY,
+            no_pull=False,
+            no_commit=False,
+            force=False,
+            locales_per_task=0,
         )
 
     def test_non_repository_projects(self):
@@ -55,7 +61,12 @@ class CommandTests(TestCase):
 
         self.execute_command()
         self.mock_sync_project.delay.assert_called_with(
-            repo_project.pk, ANY, no_pull=False, no_commit=False, force=False,
+            repo_project.pk,
+            ANY,
+            no_pull=False,
+            no_commit=False,
+            force=False,
+            locales_per_task=0,
         )
 
     def test_project_slugs(self):
@@ -67,7 +78,12 @@ class CommandTests(TestCase):
 
         self.execute_command(projects=handle_project.slug)
         self.mock_sync_project.delay.assert_called_with(
-            handle_project.pk, ANY, no_pull=False, no_commit=False, force=False,
+            handle_project.pk,
+            ANY,
+            no_pull=False,
+            no_commit=False,
+            force=False,
+            locales_per_task=0,
         )
 
     def test_no_matching_projects(self):
@@ -87,7 +103,12 @@ class CommandTests(TestCase):
         self.execute_command(projects=handle_project.slug + ",aaa,bbb")
 
         self.mock_sync_project.delay.assert_called_with(
-            handle_project.pk, ANY, no_pull=False, no_commit=False, force=False,
+            handle_project.pk,
+            ANY,
+            no_pull=False,
+            no_commit=False,
+            force=False,
+            locales_per_task=0,
         )
 
         assert (
@@ -111,7 +132,12 @@ class CommandTests(TestCase):
         project = ProjectFactory.create()
         self.execute_command(no_pull=True, no_commit=True)
         self.mock_sync_project.delay.assert_called_with(
-            project.pk, ANY, no_pull=True, no_commit=True, force=False
+            project.pk,
+            ANY,
+            no_pull=True,
+            no_commit=True,
+            force=False,
+            locales_per_task=0,
         )
 
     def test_sync_log(self):
@@ -2,19 +2,29 @@ from unittest.mock import ANY, patch, PropertyMock
 
 import pytest
 
+from django.core.cache import cache
+
 from pontoon.base.models import ChangedEntityLocale, Locale, Project, Repository
 from pontoon.base.tests import (
     ChangedEntityLocaleFactory,
     CONTAINS,
     ProjectFactory,
+    ProjectLocaleFactory,
     RepositoryFactory,
     TestCase,
     TranslationFactory,
 )
 from pontoon.base.utils import aware_datetime
-from pontoon.sync.core import serial_task
+from pontoon.sync.core import repository_lock, serial_task
 from pontoon.sync.models import ProjectSyncLog, RepositorySyncLog, SyncLog
-from pontoon.sync.tasks import sync_project, sync_translations
+from pontoon.sync.tasks import (
+    sync_locales_task,
+    sync_project,
+    sync_translations,
+    sync_translations_lock_key,
+    sync_translations_pending_key,
+)
+from pontoon.sync.vcs.repositories import CommitToRepositoryException
 from pontoon.sync.tests import (
     FAKE_CHECKOUT_PATH,
     FakeCheckoutTestCase,
@@ -242,6 +252,74 @@ class SyncTranslationsTests(FakeCheckoutTestCase):
         assert duplicate_translation.approved
         assert duplicate_translation.approved_date == aware_datetime(1970, 1, 3)
 
+    def test_locales_per_task(self):
+        """
+        Sync groups of locales in parallel tasks, the last of which completes
+        the sync.
+        """
+        ProjectLocaleFactory.create(
+            project=self.db_project, locale=self.inactive_locale
+        )
+        self.mock_pull_locale_repo_changes.return_value = [
+            True,
+            {self.repository.pk: Locale.objects.filter(pk=self.translated_locale.pk)},
+        ]
+        changed = ChangedEntityLocaleFactory.create(
+            locale=self.translated_locale,
+            entity__resource=self.main_db_resource,
+            when=aware_datetime(1970, 1, 1),
+        )
+
+        with patch(
+            "pontoon.sync.tasks.sync_locales_task.delay", side_effect=sync_locales_task,
+        ) as mock_delay:
+            sync_translations(
+                self.db_project,
+                self.project_sync_log,
+                self.now,
+                True,
+                locales_per_task=1,
+            )
+
+        assert mock_delay.call_count == 2
+        with pytest.raises(ChangedEntityLocale.DoesNotExist):
+            changed.refresh_from_db()
+        assert RepositorySyncLog.objects.get(
+            project_sync_log=self.project_sync_log
+        ).finished
+        assert not cache.get(sync_translations_lock_key(self.db_project.pk))
+
+    def test_locales_per_task_missing_counter(self):
+        """
+        Complete the sync even if the counter of pending tasks gets evicted
+        from the cache.
+        """
+        ProjectLocaleFactory.create(
+            project=self.db_project, locale=self.inactive_locale
+        )
+
+        def evicting_sync_locales_task(*args, **kwargs):
+            cache.delete(sync_translations_pending_key(args[1]))
+            return sync_locales_task(*args, **kwargs)
+
+        with patch(
+            "pontoon.sync.tasks.sync_locales_task.delay",
+            side_effect=evicting_sync_locales_task,
+        ):
+            sync_translations(
+                self.db_project,
+                self.project_sync_log,
+                self.now,
+                True,
+                locales_per_task=1,
+                no_pull=True,
+            )
+
+        assert RepositorySyncLog.objects.get(
+            project_sync_log=self.project_sync_log
+        ).finished
+        assert not cache.get(sync_translations_lock_key(self.db_project.pk))
+
     def test_create_repository_log(self):
         assert not RepositorySyncLog.objects.exists()
 
@@ -419,6 +497,22 @@ class SyncExecutionTests(TestCase):
                 CONTAINS("task_lock_key[param=24]"), ANY, timeout=3
             )
 
+    def test_repository_lock_timeout(self):
+        """
+        Waiting for a repository lock held by another task fails after the
+        wait timeout.
+        """
+        repo = RepositoryFactory.create()
+
+        with repository_lock(repo):
+            with pytest.raises(CommitToRepositoryException):
+                with repository_lock(repo, poll_interval=0, wait_timeout=0):
+                    pass
+
+        # The lock is released
+        with repository_lock(repo, poll_interval=0, wait_timeout=0):
+            pass
+
     def test_exception_during_sync(self):
         """
         Any error during performing synchronization should release the lock.
@@ -1,7 +1,19 @@
+import os
+import shutil
+import subprocess
+import tempfile
+
 from textwrap import dedent
+from unittest import skipIf
 from unittest.mock import patch
 
-from pontoon.sync.vcs.repositories import VCSRepository
+from pontoon.sync.vcs.repositories import (
+    execute,
+    get_changed_files,
+    PullFromGit,
+    PullFromHg,
+    VCSRepository,
+)
 from pontoon.base.tests import CONTAINS, TestCase
 
 
@@ -27,6 +39,17 @@ class VCSRepositoryTests(TestCase):
             )
 
 
+class ExecuteTests(TestCase):
+    def test_execute_timeout(self):
+        """
+        Commands running longer than the timeout are killed and reported
+        as failed.
+        """
+        code, output, error = execute(["sleep", "10"], timeout=0.1)
+        assert code == -1
+        assert error == "Command timed out after 0.1 seconds."
+
+
 class VCSChangedFilesTests(object):
     """
     Mixin class that unifies all tests  for changed/removed files between repositories.
@@ -124,3 +147,289 @@ class SVNChangedFilesTest(VCSChangedFilesTests, TestCase):
         D removed_file2.properties
     """
     )
+
+
+class PullFromHgTests(TestCase):
+    def setUp(self):
+        self.target = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.target, ignore_errors=True)
+
+    def pull(self, side_effect):
+        with patch(
+            "pontoon.sync.vcs.repositories.execute", side_effect=side_effect
+        ) as mock_execute:
+            PullFromHg("https://example.com/repo", self.target, None).pull()
+
+        return [call[0][0] for call in mock_execute.call_args_list]
+
+    def test_pull_incremental(self):
+        """
+        Existing checkouts are updated in place, instead of cloned again.
+        """
+        os.mkdir(os.path.join(self.target, ".hg"))
+        commands = self.pull(
+            lambda command, *args, **kwargs: (
+                1 if command[1] == "outgoing" else 0,
+                "",
+                "",
+            )
+        )
+
+        assert [command[:3] for command in commands] == [
+            ["hg", "pull", "https://example.com/repo"],
+            ["hg", "outgoing", "--quiet"],
+            ["hg", "update", "--clean"],
+            ["hg", "--config", "extensions.purge="],
+        ]
+
+    def test_pull_failed_push(self):
+        """
+        Local changesets left behind by failed pushes are stripped.
+        """
+        os.mkdir(os.path.join(self.target, ".hg"))
+        commands = self.pull(
+            lambda command, *args, **kwargs: (
+                0,
+                "abc\ndef\n" if command[1] == "outgoing" else "",
+                "",
+            )
+        )
+
+        assert commands[2] == [
+            "hg",
+            "--config",
+            "extensions.strip=",
+            "strip",
+            "--no-backup",
+            "--force",
+            "--rev",
+            "abc",
+            "--rev",
+            "def",
+        ]
+        assert [command[:2] for command in commands[3:]] == [
+            ["hg", "update"],
+            ["hg", "--config"],
+        ]
+
+    def test_pull_outgoing_error(self):
+        """
+        If local changesets can't be determined, clone the repository again.
+        """
+        os.mkdir(os.path.join(self.target, ".hg"))
+        commands = self.pull(
+            lambda command, *args, **kwargs: (
+                255 if command[1] == "outgoing" else 0,
+                "",
+                "",
+            )
+        )
+
+        assert [command[:2] for command in commands] == [
+            ["hg", "pull"],
+            ["hg", "outgoing"],
+            ["rm", "-rf"],
+            ["hg", "clone"],
+        ]
+
+    def test_pull_corrupt_checkout(self):
+        """
+        If updating the checkout fails, clone the repository again.
+        """
+        os.mkdir(os.path.join(self.target, ".hg"))
+        commands = self.pull(
+            lambda command, *args, **kwargs: (1 if command[1] == "pull" else 0, "", "")
+        )
+
+        assert [command[:2] for command in commands] == [
+            ["hg", "pull"],
+            ["rm", "-rf"],
+            ["hg", "clone"],
+        ]
+
+    def test_pull_missing_checkout(self):
+        commands = self.pull(lambda *args, **kwargs: (0, "", ""))
+
+        assert [command[:2] for command in commands] == [
+            ["rm", "-rf"],
+            ["hg", "clone"],
+        ]
+
+
+@skipIf(shutil.which("hg") is None, "Mercurial is not installed")
+class PullFromHgRepositoryTests(TestCase):
+    """
+    Pull from a local Mercurial repository.
+    """
+
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+
+        self.source = os.path.join(root, "source")
+        self.target = os.path.join(root, "target")
+
+        self.hg("init", self.source)
+        self.commit("a.ftl", "a = A")
+
+    def hg(self, *args, cwd=None):
+        subprocess.run(["hg"] + list(args), cwd=cwd, check=True, capture_output=True)
+
+    def commit(self, filename, content):
+        with open(os.path.join(self.source, filename), "w") as f:
+            f.write(content)
+
+        self.hg("commit", "-A", "-m", filename, "-u", "test", cwd=self.source)
+
+    def read(self, filename):
+        with open(os.path.join(self.target, filename)) as f:
+            return f.read()
+
+    def test_pull(self):
+        PullFromHg(self.source, self.target, None).pull()
+        assert self.read("a.ftl") == "a = A"
+
+        # Local changes are undone
+        with open(os.path.join(self.target, "a.ftl"), "w") as f:
+            f.write("a = Changed")
+        with open(os.path.join(self.target, "untracked.ftl"), "w") as f:
+            f.write("untracked = Untracked")
+
+        self.commit("b.ftl", "b = B")
+
+        with patch("pontoon.sync.vcs.repositories.log") as mock_log:
+            PullFromHg(self.source, self.target, None).pull()
+            assert not any(
+                "Clone instead" in call[0][0] for call in mock_log.debug.call_args_list
+            )
+
+        assert self.read("a.ftl") == "a = A"
+        assert self.read("b.ftl") == "b = B"
+        assert not os.path.exists(os.path.join(self.target, "untracked.ftl"))
+
+    def test_pull_failed_push(self):
+        """
+        Changesets committed to the checkout, but not pushed, are discarded.
+        """
+        PullFromHg(self.source, self.target, None).pull()
+
+        with open(os.path.join(self.target, "a.ftl"), "w") as f:
+            f.write("a = Unpushed")
+        self.hg("commit", "-m", "Unpushed", "-u", "test", cwd=self.target)
+
+        self.commit("b.ftl", "b = B")
+        PullFromHg(self.source, self.target, None).pull()
+
+        assert self.read("a.ftl") == "a = A"
+        assert self.read("b.ftl") == "b = B"
+
+        heads = subprocess.run(
+            ["hg", "heads", "--template", "{node}\n"],
+            cwd=self.target,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        assert len(heads) == 1
+
+
+class PullFromGitRepositoryTests(TestCase):
+    """
+    Pull from a local Git repository.
+    """
+
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+
+        self.source = os.path.join(root, "source")
+        self.target = os.path.join(root, "target")
+
+        os.mkdir(self.source)
+        self.git("init", "-q", cwd=self.source)
+        self.git("checkout", "-q", "-b", "main", cwd=self.source)
+        self.first_revision = self.commit("a.ftl", "a = A")
+
+        # Other branches aren't fetched
+        self.git("checkout", "-q", "-b", "other", cwd=self.source)
+        self.commit("other.ftl", "other = Other")
+        self.git("checkout", "-q", "main", cwd=self.source)
+
+        self.commit("b.ftl", "b = B")
+
+    def git(self, *args, cwd=None):
+        return subprocess.run(
+            ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+            + list(args),
+            cwd=cwd,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+
+    def commit(self, filename, content):
+        with open(os.path.join(self.source, filename), "w") as f:
+            f.write(content)
+
+        self.git("add", filename, cwd=self.source)
+        self.git("commit", "-q", "-m", filename, cwd=self.source)
+        return self.git("rev-parse", "HEAD", cwd=self.source)
+
+    def pull(self, git_clone):
+        # Shallow and partial clones are only supported for non-local URLs
+        source = "file://" + self.source
+        PullFromGit(source, self.target, "main", git_clone=git_clone).pull()
+
+    def commit_count(self):
+        return int(self.git("rev-list", "--count", "--all", cwd=self.target))
+
+    def test_pull_shallow(self):
+        self.pull("shallow")
+        assert self.commit_count() == 1
+        assert "other" not in self.git("branch", "-r", cwd=self.target)
+
+        # Local changes are undone
+        with open(os.path.join(self.target, "a.ftl"), "w") as f:
+            f.write("a = Changed")
+
+        self.commit("c.ftl", "c = C")
+        self.pull("shallow")
+
+        assert self.commit_count() == 2
+        assert self.git("status", "--porcelain", cwd=self.target) == ""
+        assert os.path.exists(os.path.join(self.target, "c.ftl"))
+
+    def test_pull_blobless(self):
+        self.pull("blobless")
+        assert self.commit_count() == 2
+        assert "other" not in self.git("branch", "-r", cwd=self.target)
+
+        self.commit("c.ftl", "c = C")
+        self.pull("blobless")
+        assert os.path.exists(os.path.join(self.target, "c.ftl"))
+
+    def test_changed_files_shallow(self):
+        """
+        Changes since revisions older than the shallow clone are available,
+        because the missing revisions are fetched on demand.
+        """
+        self.pull("shallow")
+        self.git("config", "uploadpack.allowAnySHA1InWant", "true", cwd=self.source)
+
+        assert get_changed_files("git", self.target, self.first_revision) == (
+            ["b.ftl"],
+            [],
+        )
+
+    def test_changed_files_full(self):
+        """
+        Missing revisions aren't fetched into full clones.
+        """
+        self.pull("full")
+
+        repo = VCSRepository.for_type("git", self.target)
+        with patch.object(repo, "execute", wraps=repo.execute) as mock_execute:
+            repo.fetch_revision("0" * 40)
+
+        commands = [c[0][0][:2] for c in mock_execute.call_args_list]
+        assert ["git", "fetch"] not in commands
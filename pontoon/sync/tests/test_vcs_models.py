@@ -7,6 +7,8 @@ from unittest.mock import Mock, patch, PropertyMock, MagicMock
 
 import scandir
 
+from django.test import override_settings
+
 from pontoon.base.models import (
     Locale,
     Project,
@@ -232,6 +234,7 @@ class VCSProjectTests(VCSTestCase):
             checkout_path, "en"
         )  # en has pot files in it
 
+    @override_settings(SYNC_PARSE_THREADS=1)
     def test_resources_parse_error(self):
         """
         If VCSResource() raises a ParseError while loading, log an error
@@ -262,6 +265,73 @@ class VCSProjectTests(VCSTestCase):
             assert self.vcs_project.resources == {"success": "successful resource"}
             mock_log.error.assert_called_with(CONTAINS("failure", "error message"))
 
+    @override_settings(SYNC_PARSE_THREADS=4)
+    def test_resources_parse_in_threads(self):
+        """
+        Parse resources in a pool of threads, keeping their order and skipping
+        resources that raise a ParseError.
+        """
+        paths = ["first", "failure", "second", "third"]
+        self.vcs_project.relative_resource_paths = Mock(return_value=paths)
+
+        def vcs_resource_constructor(project, path, locales=None):
+            if path == "failure":
+                raise ParseError("error message")
+            else:
+                return "resource " + path
+
+        with patch("pontoon.sync.vcs.models.VCSResource") as MockVCSResource, patch(
+            "pontoon.sync.vcs.models.log"
+        ) as mock_log, patch.object(
+            VCSProject,
+            "changed_files",
+            new_callable=PropertyMock,
+            return_value={path: [] for path in paths},
+        ), patch.object(
+            VCSProject,
+            "locale_directory_paths",
+            new_callable=PropertyMock,
+            return_value={},
+        ):
+            MockVCSResource.side_effect = vcs_resource_constructor
+
+            assert list(self.vcs_project.resources.items()) == [
+                ("first", "resource first"),
+                ("second", "resource second"),
+                ("third", "resource third"),
+            ]
+            mock_log.error.assert_called_with(CONTAINS("failure", "error message"))
+
+    @override_settings(SYNC_PARSE_THREADS=4)
+    def test_load_resources_configuration_before_threads(self):
+        """
+        Project files of the configuration are set up for all locales before
+        threads start looking up resource paths in them.
+        """
+        self.vcs_project.configuration = Mock()
+
+        def vcs_resource_constructor(project, path, locales=None):
+            assert project.configuration.get_or_set_project_files.call_count == 1
+            return "resource " + path
+
+        with patch(
+            "pontoon.sync.vcs.models.VCSResource"
+        ) as MockVCSResource, patch.object(
+            VCSProject,
+            "locale_directory_paths",
+            new_callable=PropertyMock,
+            return_value={},
+        ):
+            MockVCSResource.side_effect = vcs_resource_constructor
+
+            assert self.vcs_project.load_resources(
+                {"first": {self.locale}, "second": {self.locale}}
+            ) == [("first", "resource first"), ("second", "resource second")]
+
+        self.vcs_project.configuration.get_or_set_project_files.assert_called_once_with(
+            self.locale.code
+        )
+
     @patch.object(Repository, "checkout_path", new_callable=PropertyMock)
     def test_resource_paths_with_config(self, checkout_path_mock):
         """
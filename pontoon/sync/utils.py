@@ -2,6 +2,8 @@ import errno
 import os
 import scandir
 
+from django.db import connection
+
 from pontoon.base.models import Resource
 from pontoon.base.utils import extension_in, first
 
@@ -164,3 +166,26 @@ def create_parent_directory(path):
             pass
         else:
             raise
+
+
+class QueryCounter(object):
+    """
+    Context manager counting queries executed on the default database
+    connection within its block, available as the `count` attribute.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.wrapper = None
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+    def __enter__(self):
+        self.wrapper = connection.execute_wrapper(self)
+        self.wrapper.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.wrapper.__exit__(*exc_info)
@@ -8,6 +8,7 @@ import shutil
 
 import requests
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from itertools import chain
 from pathlib import Path
@@ -17,6 +18,8 @@ from compare_locales.paths import (
     ProjectFiles,
     TOMLParser,
 )
+from django.conf import settings
+from django.db import connection
 from django.utils import timezone
 from django.utils.functional import cached_property
 
@@ -436,6 +439,7 @@ class VCSProject(object):
         with less mocking.
         """
         resources = {}
+        resource_locales = {}
 
         log.info(
             "Changed files in {} repository and Pontoon, relevant for enabled locales: {}".format(
@@ -484,14 +488,17 @@ class VCSProject(object):
                 )
             )
 
-            try:
-                resources[path] = VCSResource(self, path, locales=locales)
-            except ParseError as err:
+            resource_locales[path] = locales
+
+        for path, resource in self.load_resources(resource_locales):
+            if isinstance(resource, ParseError):
                 log.error(
                     u"Skipping resource {path} due to ParseError: {err}".format(
-                        path=path, err=err
+                        path=path, err=resource
                     )
                 )
+            else:
+                resources[path] = resource
 
         log.info(
             "Relative paths in {} that need to be synced: {}".format(
@@ -501,6 +508,51 @@ class VCSProject(object):
 
         return resources
 
+    def load_resources(self, resource_locales):
+        """
+        Parse resources in a pool of SYNC_PARSE_THREADS threads.
+
+        Threads overlap reading of files and parsers that release the GIL,
+        e.g. lxml for XLIFF. Parsers written in Python are still limited to a
+        single CPU by the GIL.
+
+        :param dict resource_locales: a map of relative resource paths and
+            locales to load them for.
+        :returns: a list of (path, VCSResource) pairs in the given order, with a
+            ParseError in place of resources that failed to parse.
+        """
+
+        def load(path):
+            try:
+                return VCSResource(self, path, locales=resource_locales[path])
+            except ParseError as err:
+                return err
+
+        if settings.SYNC_PARSE_THREADS <= 1 or len(resource_locales) <= 1:
+            return [(path, load(path)) for path in resource_locales]
+
+        # Lazy properties are evaluated once, before threads start using them
+        self.source_locale
+        self.source_directory_path
+        locales = set().union(*resource_locales.values())
+        if locales:
+            self.locale_directory_paths
+        if self.configuration:
+            for locale in locales:
+                self.configuration.get_or_set_project_files(locale.code)
+
+        def load_in_thread(path):
+            try:
+                return load(path)
+            finally:
+                # Close the database connection of this thread, if any
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=settings.SYNC_PARSE_THREADS) as executor:
+            return list(
+                zip(resource_locales, executor.map(load_in_thread, resource_locales))
+            )
+
     @property
     def entities(self):
         return chain.from_iterable(
@@ -511,6 +563,13 @@ class VCSProject(object):
     def checkout_path(self):
         return self.db_project.checkout_path
 
+    @cached_property
+    def source_locale(self):
+        """Locale of source resources."""
+        from pontoon.base.models import Locale
+
+        return Locale.objects.get(code="en-US")
+
     @cached_property
     def source_directory_path(self):
         """
@@ -738,7 +797,6 @@ class VCSResource(object):
         Load the resource file for each enabled locale and store its
         translations in VCSEntity instances.
         """
-        from pontoon.base.models import Locale
         from pontoon.sync import formats  # Avoid circular import.
 
         self.vcs_project = vcs_project
@@ -753,7 +811,7 @@ class VCSResource(object):
         )
         source_resource_path = locale_to_source_path(source_resource_path)
         source_resource_file = formats.parse(
-            source_resource_path, locale=Locale.objects.get(code="en-US")
+            source_resource_path, locale=vcs_project.source_locale
         )
 
         for index, translation in enumerate(source_resource_file.translations):
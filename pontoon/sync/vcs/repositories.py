@@ -15,16 +15,24 @@ class PullFromRepositoryException(Exception):
 
 
 class PullFromRepository(object):
-    def __init__(self, source, target, branch):
+    def __init__(self, source, target, branch, timeout=None):
         self.source = source
         self.target = target
         self.branch = branch
+        self.timeout = timeout
+
+    def execute(self, command, cwd=None, env=None):
+        return execute(command, cwd=cwd, env=env, timeout=self.timeout)
 
     def pull(self, source=None, target=None):
         raise NotImplementedError
 
 
 class PullFromGit(PullFromRepository):
+    def __init__(self, source, target, branch, timeout=None, git_clone="full"):
+        super().__init__(source, target, branch, timeout=timeout)
+        self.git_clone = git_clone
+
     def pull(self, source=None, target=None, branch=None):
         log.debug("Git: Update repository.")
 
@@ -32,22 +40,32 @@ class PullFromGit(PullFromRepository):
         target = target or self.target
         branch = branch or self.branch
 
-        command = ["git", "fetch", "--all"]
-        execute(command, target)
+        if self.git_clone == "full":
+            command = ["git", "fetch", "--all"]
+            self.execute(command, target)
 
-        # Undo local changes
-        remote = "origin"
-        if branch:
-            remote += "/" + branch
+            # Undo local changes
+            remote = "origin"
+            if branch:
+                remote += "/" + branch
+
+        else:
+            # Only fetch the configured branch, which in a shallow clone also
+            # only fetches commits since the previous pull
+            command = ["git", "fetch", "origin", branch or "HEAD"]
+            self.execute(command, target)
+
+            # Undo local changes
+            remote = "FETCH_HEAD"
 
         command = ["git", "reset", "--hard", remote]
-        code, output, error = execute(command, target)
+        code, output, error = self.execute(command, target)
 
         if code != 0:
             log.info("Git: " + str(error))
             log.debug("Git: Clone instead.")
-            command = ["git", "clone", source, target]
-            code, output, error = execute(command)
+            command = ["git", "clone"] + self.clone_options(branch) + [source, target]
+            code, output, error = self.execute(command)
 
             if code != 0:
                 raise PullFromRepositoryException(str(error))
@@ -56,15 +74,30 @@ class PullFromGit(PullFromRepository):
         else:
             log.debug("Git: Repository at " + source + " updated.")
 
-        if branch:
+        if branch and self.git_clone == "full":
             command = ["git", "checkout", branch]
-            code, output, error = execute(command, target)
+            code, output, error = self.execute(command, target)
 
             if code != 0:
                 raise PullFromRepositoryException(str(error))
 
             log.debug("Git: Branch " + branch + " checked out.")
 
+    def clone_options(self, branch):
+        if self.git_clone == "full":
+            return []
+
+        options = ["--single-branch"]
+        if branch:
+            options += ["--branch", branch]
+
+        if self.git_clone == "shallow":
+            options += ["--depth", "1"]
+        elif self.git_clone == "blobless":
+            options += ["--filter=blob:none"]
+
+        return options
+
 
 class PullFromHg(PullFromRepository):
     def pull(self, source=None, target=None):
@@ -73,12 +106,18 @@ class PullFromHg(PullFromRepository):
         source = source or self.source
         target = target or self.target
 
-        # Undo local changes: Mercurial doesn't offer anything more elegant
+        if os.path.isdir(os.path.join(target, ".hg")):
+            if self.update(source, target):
+                log.debug("Mercurial: Repository at " + source + " updated.")
+                return
+
+        # Missing or corrupt checkout: clone the whole repository again
+        log.debug("Mercurial: Clone instead.")
         command = ["rm", "-rf", target]
-        code, output, error = execute(command)
+        code, output, error = self.execute(command)
 
         command = ["hg", "clone", source, target]
-        code, output, error = execute(command)
+        code, output, error = self.execute(command)
 
         if code == 0:
             log.debug("Mercurial: Repository at " + source + " cloned.")
@@ -86,6 +125,63 @@ class PullFromHg(PullFromRepository):
         else:
             raise PullFromRepositoryException(str(error))
 
+    def update(self, source, target):
+        """
+        Only fetch new changesets and undo local changes of an existing checkout.
+        Return False if the checkout couldn't be updated.
+        """
+        code, output, error = self.execute(["hg", "pull", source], target)
+        if code != 0:
+            log.info("Mercurial: " + str(error))
+            return False
+
+        # Strip changesets left behind by failed pushes, which would otherwise
+        # diverge from the remote repository
+        command = ["hg", "outgoing", "--quiet", "--template", "{node}\n", source]
+        code, output, error = self.execute(command, target)
+
+        # Exit code 1 means there are no outgoing changesets
+        if code not in (0, 1):
+            log.info("Mercurial: " + str(error))
+            return False
+
+        local_changesets = output.split() if code == 0 else []
+
+        if local_changesets:
+            log.info(
+                "Mercurial: Stripping {} local changesets.".format(
+                    len(local_changesets)
+                )
+            )
+            command = [
+                "hg",
+                "--config",
+                "extensions.strip=",
+                "strip",
+                "--no-backup",
+                "--force",
+            ]
+            for node in local_changesets:
+                command += ["--rev", node]
+
+            code, output, error = self.execute(command, target)
+            if code != 0:
+                log.info("Mercurial: " + str(error))
+                return False
+
+        commands = [
+            ["hg", "update", "--clean", "--rev", "default"],
+            ["hg", "--config", "extensions.purge=", "purge", "--all"],
+        ]
+
+        for command in commands:
+            code, output, error = self.execute(command, target)
+            if code != 0:
+                log.info("Mercurial: " + str(error))
+                return False
+
+        return True
+
 
 class PullFromSvn(PullFromRepository):
     def pull(self, source=None, target=None):
@@ -109,7 +205,7 @@ class PullFromSvn(PullFromRepository):
                 target,
             ]
 
-        code, output, error = execute(command, env=get_svn_env())
+        code, output, error = self.execute(command, env=get_svn_env())
 
         if code != 0:
             raise PullFromRepositoryException(str(error))
@@ -242,14 +338,20 @@ class CommitToSvn(CommitToRepository):
         log.info(message)
 
 
-def execute(command, cwd=None, env=None):
+def execute(command, cwd=None, env=None, timeout=None):
     try:
         st = subprocess.PIPE
         proc = subprocess.Popen(
             args=command, stdout=st, stderr=st, stdin=st, cwd=cwd, env=env
         )
 
-        (output, error) = proc.communicate()
+        try:
+            (output, error) = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            # Don't leave hanging processes behind, e.g. unresponsive remotes
+            proc.kill()
+            proc.communicate()
+            return -1, "", "Command timed out after {} seconds.".format(timeout)
 
         # Make sure that we manipulate strings instead of bytes, to avoid
         # compatibility errors in Python 3.
@@ -267,8 +369,12 @@ def execute(command, cwd=None, env=None):
         return -1, "", error
 
 
-def update_from_vcs(repo_type, url, path, branch):
-    obj = globals()["PullFrom%s" % repo_type.capitalize()](url, path, branch)
+def update_from_vcs(repo_type, url, path, branch, timeout=None, git_clone="full"):
+    options = {"timeout": timeout}
+    if repo_type == "git":
+        options["git_clone"] = git_clone
+
+    obj = globals()["PullFrom%s" % repo_type.capitalize()](url, path, branch, **options)
     obj.pull()
 
 
@@ -319,6 +425,9 @@ class VCSRepository(object):
             )
         return code, output, error
 
+    def fetch_revision(self, revision):
+        """Make sure the given revision is available in the repository."""
+
     def get_changed_files(self, path, from_revision, statueses=None):
         """Get a list of changed files in the repository."""
         raise NotImplementedError
@@ -368,6 +477,47 @@ class GitRepository(VCSRepository):
         code, output, error = self.execute(["git", "rev-parse", "HEAD"],)
         return output.strip() if code == 0 else None
 
+    @property
+    def is_shallow(self):
+        code, output, error = self.execute(
+            ["git", "rev-parse", "--is-shallow-repository"]
+        )
+        return code == 0 and output.strip() == "true"
+
+    @property
+    def is_partial(self):
+        code, output, error = self.execute(
+            ["git", "config", "--get", "remote.origin.promisor"], log_errors=False,
+        )
+        return code == 0 and output.strip() == "true"
+
+    def fetch_revision(self, revision):
+        """
+        Make sure the given revision is available in the repository.
+
+        Shallow clones don't contain commits older than the first pull, so
+        fetch the missing commit, and fall back to fetching the complete
+        history. Full clones already contain all commits of the branch.
+        """
+        code, output, error = self.execute(
+            ["git", "cat-file", "-e", "{}^{{commit}}".format(revision)],
+            log_errors=False,
+        )
+        if code == 0:
+            return
+
+        if self.is_shallow:
+            log.info("Git: Fetching revision {} into {}.".format(revision, self.path))
+            code, output, error = self.execute(
+                ["git", "fetch", "--depth", "1", "origin", revision], log_errors=False,
+            )
+            if code != 0:
+                self.execute(["git", "fetch", "--unshallow", "origin"])
+
+        elif self.is_partial:
+            log.info("Git: Fetching revision {} into {}.".format(revision, self.path))
+            self.execute(["git", "fetch", "origin", revision])
+
     def get_changed_files(self, path, from_revision, statuses=None):
         statuses = statuses or ("A", "M")
         code, output, error = self.execute(
@@ -459,6 +609,8 @@ def get_changed_files(repo_type, path, revision):
                 paths.append(os.path.join(root, f).replace(path + "/", ""))
         return paths, []
 
+    repo.fetch_revision(revision)
+
     return (
         repo.get_changed_files(path, revision),
         repo.get_removed_files(path, revision),
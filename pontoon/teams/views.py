@@ -104,7 +104,7 @@ def ajax_insights(request, locale):
         raise ImproperlyConfigured("ENABLE_INSIGHTS_TAB variable not set in settings.")
 
     locale = get_object_or_404(Locale, code=locale)
-    insights = get_insights(Q(locale=locale))
+    insights = get_insights(locale=locale)
 
     return render(request, "teams/includes/insights.html", insights)
 
@@ -1,56 +1,162 @@
 import re
+import uuid
 
+from django.core.cache import cache
 from django.db import models
 
-from pontoon.base.models import Entity, ProjectLocale, Resource, TranslatedResource
+from pontoon.base.models import Entity, Resource, TranslatedResource
 
 
 def update_terminology_project_stats():
     resource = Resource.objects.get(project__slug="terminology")
-    project = resource.project
     total_strings = Entity.objects.filter(resource=resource, obsolete=False).count()
     resource.total_strings = total_strings
     resource.save(update_fields=["total_strings"])
 
-    translated_resources = list(TranslatedResource.objects.filter(resource=resource))
-
-    for translated_resource in translated_resources:
-        translated_resource.calculate_stats(save=False)
-
-    TranslatedResource.objects.bulk_update(
-        translated_resources,
-        [
-            "total_strings",
-            "approved_strings",
-            "fuzzy_strings",
-            "strings_with_errors",
-            "strings_with_warnings",
-            "unreviewed_strings",
-        ],
-    )
+    TranslatedResource.objects.filter(resource=resource).update_stats()
+
+
+TERM_MATCHER_VERSION_KEY = "terminology:term_matcher_version"
+
+WORD_BOUNDARY = re.compile(r"\b")
+
+# Matcher of the current process and the version it was built for
+_term_matcher = (None, None)
+
+
+class TermMatcher:
+    """
+    Find terms in strings.
+
+    Terms are stored in two prefix trees, one for case-sensitive and one for
+    case-insensitive terms. Since terms only match at word boundaries, trees
+    are walked from every word boundary of the string, which makes the cost of
+    a lookup independent of the number of terms.
+    """
+
+    def __init__(self, terms):
+        """
+        :arg terms: iterable of (pk, text, case_sensitive) tuples.
+        """
+        self.trees = {True: {}, False: {}}
+
+        for pk, text, case_sensitive in terms:
+            node = self.trees[case_sensitive]
+            for char in self.fold(text, case_sensitive):
+                node = node.setdefault(char, {})
+            # None marks the end of a term, chars are never None
+            node.setdefault(None, []).append(pk)
+
+    @staticmethod
+    def fold(string, case_sensitive):
+        """
+        Return characters of the string, lowercased one by one if matching is
+        case-insensitive, to keep positions aligned with the original string.
+        """
+        if case_sensitive:
+            return list(string)
+        return [char.lower() for char in string]
 
-    project.aggregate_stats()
+    def match(self, string):
+        """
+        Return primary keys of terms found in the given string.
+        """
+        pks = set()
+        boundaries = [m.start() for m in WORD_BOUNDARY.finditer(string)]
+
+        for case_sensitive, tree in self.trees.items():
+            if not tree:
+                continue
+
+            chars = self.fold(string, case_sensitive)
+            for start in boundaries:
+                node = tree
+                for index in range(start, len(chars)):
+                    node = node.get(chars[index])
+                    if node is None:
+                        break
+                    pks.update(node.get(None, ()))
+
+        return pks
+
+
+def get_term_matcher():
+    """
+    Return TermMatcher of all available terms.
+
+    The matcher is built once per process and rebuilt only after terms are
+    changed in any process, which is tracked by a version in cache.
+    """
+    global _term_matcher
+
+    version = cache.get(TERM_MATCHER_VERSION_KEY)
+    if version is None:
+        version = invalidate_term_matcher()
+
+    matcher, matcher_version = _term_matcher
+    if matcher is None or matcher_version != version:
+        matcher = TermMatcher(
+            Term.objects.available().values_list("pk", "text", "case_sensitive")
+        )
+        _term_matcher = (matcher, version)
 
-    for locale in project.locales.all():
-        locale.aggregate_stats()
+    return matcher
 
-    for projectlocale in ProjectLocale.objects.filter(project=project):
-        projectlocale.aggregate_stats()
+
+def invalidate_term_matcher():
+    """
+    Make all processes rebuild their TermMatcher on the next lookup.
+    """
+    version = uuid.uuid4().hex
+    cache.set(TERM_MATCHER_VERSION_KEY, version, timeout=None)
+    return version
 
 
 class TermQuerySet(models.QuerySet):
+    """
+    Bulk changes of terms bypass Term.save() and Term.delete(), so they
+    invalidate the TermMatcher themselves. `bulk_update()` goes through
+    `update()`.
+    """
+
+    def update(self, **kwargs):
+        updated = super().update(**kwargs)
+        invalidate_term_matcher()
+        return updated
+
+    def delete(self):
+        deleted = super().delete()
+        invalidate_term_matcher()
+        return deleted
+
+    def bulk_create(self, *args, **kwargs):
+        terms = super().bulk_create(*args, **kwargs)
+        invalidate_term_matcher()
+        return terms
+
+    def available(self):
+        """
+        Terms that can be matched in strings.
+        """
+        return self.exclude(definition="").exclude(forbidden=True)
+
     def for_string(self, string):
-        terms = []
-        available_terms = self.exclude(definition="").exclude(forbidden=True)
+        return self.for_strings([string])[0]
 
-        for term in available_terms:
-            term_text = r"\b" + re.escape(term.text)
-            flags = 0 if term.case_sensitive else re.IGNORECASE
+    def for_strings(self, strings):
+        """
+        Find terms in a batch of strings, e.g. in all entities of a page.
 
-            if re.search(term_text, string, flags):
-                terms.append(term)
+        :arg strings: list of strings.
+        :return: list of lists of terms, one for each string.
+        """
+        matcher = get_term_matcher()
+        matches = [matcher.match(string) for string in strings]
 
-        return terms
+        pks = set().union(*matches)
+        terms = list(self.available().filter(pk__in=pks)) if pks else []
+
+        return [[term for term in terms if term.pk in match] for match in matches]
 
 
 class Term(models.Model):
@@ -228,6 +334,7 @@ class Term(models.Model):
             self.handle_term_update()
 
         super(Term, self).save(*args, **kwargs)
+        invalidate_term_matcher()
 
         if created and self.localizable:
             self.handle_term_create()
@@ -240,6 +347,7 @@ class Term(models.Model):
         update_terminology_project_stats()
 
         super(Term, self).delete(*args, **kwargs)
+        invalidate_term_matcher()
 
     def __str__(self):
         return self.text
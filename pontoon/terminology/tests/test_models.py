@@ -69,6 +69,59 @@ def test_terms_for_string(string, found_terms, available_terms):
         assert term.text == found_terms[i]
 
 
+@pytest.mark.django_db
+def test_terms_for_strings(available_terms):
+    """
+    Find available terms in a batch of strings.
+    """
+    terms = Term.objects.for_strings(
+        [
+            "So avoid sensitive activities when surfing in public",
+            "No terms here",
+            "Join us as a STUDENT AMBASSADOR on the Channel",
+        ]
+    )
+
+    assert [[term.text for term in t] for t in terms] == [
+        ["sensitive", "surf"],
+        [],
+        ["student ambassador", "Channel"],
+    ]
+
+
+@pytest.mark.django_db
+@patch("pontoon.terminology.models.update_terminology_project_stats")
+def test_terms_for_string_overlapping(_):
+    """
+    Find all terms starting at the same word boundary.
+    """
+    TermFactory.create(text="add")
+    TermFactory.create(text="add-on")
+    TermFactory.create(text="on")
+    TermFactory.create(text="forbidden add-on", forbidden=True)
+
+    terms = Term.objects.for_string("Remove forbidden add-ons")
+    assert sorted(term.text for term in terms) == ["add", "add-on", "on"]
+
+
+@pytest.mark.django_db
+@patch("pontoon.terminology.models.update_terminology_project_stats")
+def test_terms_for_string_term_changes(_):
+    """
+    Matched terms reflect terms saved or deleted after the previous lookup.
+    """
+    term = TermFactory.create(text="bookmark")
+    assert Term.objects.for_string("Edit this bookmark") == [term]
+
+    term.text = "tab"
+    term.save()
+    assert Term.objects.for_string("Edit this bookmark") == []
+    assert Term.objects.for_string("Close this tab") == [term]
+
+    term.delete()
+    assert Term.objects.for_string("Close this tab") == []
+
+
 @pytest.mark.django_db
 @patch("pontoon.terminology.models.update_terminology_project_stats")
 def test_term_translation(_, locale_a):
@@ -255,3 +308,24 @@ def test_handle_term_update_definition(
     assert create_entity_mock.call_count == 0
     assert obsolete_entity_mock.call_count == 0
     assert update_terminology_project_stats_mock.call_count == 0
+
+
+@pytest.mark.django_db
+@patch("pontoon.terminology.models.update_terminology_project_stats")
+def test_terms_for_string_bulk_term_changes(_):
+    """
+    Matched terms reflect terms changed in bulk after the previous lookup.
+    """
+    term = TermFactory.create(text="bookmark")
+    assert Term.objects.for_string("Edit this bookmark") == [term]
+
+    Term.objects.filter(pk=term.pk).update(text="tab")
+    assert Term.objects.for_string("Edit this bookmark") == []
+
+    Term.objects.bulk_create([Term(text="bookmark", definition="definition")])
+    assert [t.text for t in Term.objects.for_string("Edit this bookmark")] == [
+        "bookmark"
+    ]
+
+    Term.objects.filter(text="bookmark").delete()
+    assert Term.objects.for_string("Edit this bookmark") == []
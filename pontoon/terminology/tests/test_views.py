@@ -0,0 +1,76 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from django.urls import reverse
+
+from pontoon.test.factories import TermFactory, TermTranslationFactory
+
+
+@pytest.fixture
+@patch("pontoon.terminology.models.update_terminology_project_stats")
+def terms(_, locale_a):
+    surf = TermFactory.create(text="surf")
+    TermTranslationFactory.create(term=surf, locale=locale_a, text="surfen")
+    TermFactory.create(text="Channel", case_sensitive=True, do_not_translate=True)
+    TermFactory.create(text="track")
+
+
+@pytest.mark.django_db
+def test_view_get_terms(client, locale_a, terms):
+    response = client.get(
+        reverse("pontoon.terms.get"),
+        {"source_string": "Surf the Channel", "locale": locale_a.code},
+        HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+    )
+
+    assert response.status_code == 200
+    assert sorted(
+        (term["text"], term["translation"]) for term in json.loads(response.content)
+    ) == [("Channel", "Channel"), ("surf", "surfen")]
+
+
+@pytest.mark.django_db
+def test_view_get_terms_many_strings(client, locale_a, terms):
+    response = client.get(
+        reverse("pontoon.terms.get"),
+        {
+            "source_strings": ["Surf the channel", "No terms", "Track the Channel"],
+            "locale": locale_a.code,
+        },
+        HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+    )
+
+    assert response.status_code == 200
+    assert [
+        sorted((term["text"], term["translation"]) for term in terms)
+        for terms in json.loads(response.content)
+    ] == [[("surf", "surfen")], [], [("Channel", "Channel"), ("track", None)]]
+
+
+@pytest.mark.django_db
+def test_view_get_terms_one_of_many_strings(client, locale_a, terms):
+    """A single source string is still returned as a list of its own."""
+    response = client.get(
+        reverse("pontoon.terms.get"),
+        {"source_strings": ["Surf the channel"], "locale": locale_a.code},
+        HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+    )
+
+    assert response.status_code == 200
+    assert [
+        [(term["text"], term["translation"]) for term in terms]
+        for terms in json.loads(response.content)
+    ] == [[("surf", "surfen")]]
+
+
+@pytest.mark.django_db
+def test_view_get_terms_no_source_string(client, locale_a):
+    response = client.get(
+        reverse("pontoon.terms.get"),
+        {"locale": locale_a.code},
+        HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+    )
+
+    assert response.status_code == 400
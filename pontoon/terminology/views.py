@@ -1,3 +1,4 @@
+from django.db.models import Prefetch
 from django.http import JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils.datastructures import MultiValueDictKeyError
@@ -11,11 +12,41 @@ from pontoon.terminology import utils
 from pontoon.terminology.models import Term, TermTranslation
 
 
+def _serialize_term(term):
+    """
+    Serialize a Term with `locale_translations` prefetched for a locale.
+    """
+    if term.do_not_translate:
+        translation = term.text
+    elif term.locale_translations:
+        translation = term.locale_translations[0].text
+    else:
+        translation = None
+
+    return {
+        "text": term.text,
+        "part_of_speech": term.part_of_speech,
+        "definition": term.definition,
+        "usage": term.usage,
+        "translation": translation,
+        "entity_id": term.entity_id,
+    }
+
+
 @require_AJAX
 def get_terms(request):
-    """Retrieve terms for given source string and Locale."""
+    """
+    Retrieve terms for given source string and Locale.
+
+    Terms of many source strings can be retrieved at once by repeating the
+    `source_strings` parameter instead, in which case they are found in a
+    single pass and returned as a list for each source string.
+    """
     try:
-        source_string = request.GET["source_string"]
+        source_strings = request.GET.getlist("source_strings")
+        batch = bool(source_strings)
+        if not batch:
+            source_strings = [request.GET["source_string"]]
         locale_code = request.GET["locale"]
     except MultiValueDictKeyError as e:
         return JsonResponse(
@@ -24,20 +55,18 @@ def get_terms(request):
         )
 
     locale = get_object_or_404(Locale, code=locale_code)
-    payload = []
-
-    for term in Term.objects.for_string(source_string):
-        data = {
-            "text": term.text,
-            "part_of_speech": term.part_of_speech,
-            "definition": term.definition,
-            "usage": term.usage,
-            "translation": term.translation(locale),
-            "entity_id": term.entity_id,
-        }
-        payload.append(data)
-
-    return JsonResponse(payload, safe=False)
+
+    terms = Term.objects.prefetch_related(
+        Prefetch(
+            "translations",
+            queryset=TermTranslation.objects.filter(locale=locale),
+            to_attr="locale_translations",
+        )
+    ).for_strings(source_strings)
+
+    payload = [[_serialize_term(term) for term in t] for t in terms]
+
+    return JsonResponse(payload if batch else payload[0], safe=False)
 
 
 @method_decorator(condition(etag_func=None), name="dispatch")
@@ -9,6 +9,8 @@ from django.views.decorators.http import require_POST
 from pontoon.actionlog.utils import log_action
 from pontoon.base import utils
 from pontoon.base.models import (
+    batch_stats_updates,
+    EntityLocaleStatus,
     TranslatedResource,
     Translation,
 )
@@ -104,14 +106,15 @@ def create_translation(request):
         translation.approved_user = user
         translation.approved_date = now
 
-    translation.save(failed_checks=failed_checks)
+    with batch_stats_updates():
+        translation.save(failed_checks=failed_checks)
 
-    log_action("translation:created", user, translation=translation)
+        log_action("translation:created", user, translation=translation)
 
-    if translations:
-        translation = entity.reset_active_translation(
-            locale=locale, plural_form=plural_form,
-        )
+        if translations:
+            translation = entity.reset_active_translation(
+                locale=locale, plural_form=plural_form,
+            )
 
     return JsonResponse(
         {
@@ -165,6 +168,7 @@ def delete_translation(request):
         )
 
     translation.delete()
+    EntityLocaleStatus.objects.refresh([entity], [locale])
 
     log_action("translation:deleted", request.user, entity=entity, locale=locale)
 
@@ -239,13 +243,14 @@ def approve_translation(request):
                 {"string": translation.string, "failedChecks": failed_checks}
             )
 
-    translation.approve(user)
+    with batch_stats_updates():
+        translation.approve(user)
 
-    log_action("translation:approved", user, translation=translation)
+        log_action("translation:approved", user, translation=translation)
 
-    active_translation = translation.entity.reset_active_translation(
-        locale=locale, plural_form=translation.plural_form,
-    )
+        active_translation = translation.entity.reset_active_translation(
+            locale=locale, plural_form=translation.plural_form,
+        )
 
     return JsonResponse(
         {
@@ -297,13 +302,14 @@ def unapprove_translation(request):
             status=403,
         )
 
-    translation.unapprove(request.user)
+    with batch_stats_updates():
+        translation.unapprove(request.user)
 
-    log_action("translation:unapproved", request.user, translation=translation)
+        log_action("translation:unapproved", request.user, translation=translation)
 
-    active_translation = translation.entity.reset_active_translation(
-        locale=locale, plural_form=translation.plural_form,
-    )
+        active_translation = translation.entity.reset_active_translation(
+            locale=locale, plural_form=translation.plural_form,
+        )
 
     return JsonResponse(
         {
@@ -361,13 +367,14 @@ def reject_translation(request):
                 status=403,
             )
 
-    translation.reject(request.user)
+    with batch_stats_updates():
+        translation.reject(request.user)
 
-    log_action("translation:rejected", request.user, translation=translation)
+        log_action("translation:rejected", request.user, translation=translation)
 
-    active_translation = translation.entity.reset_active_translation(
-        locale=locale, plural_form=translation.plural_form,
-    )
+        active_translation = translation.entity.reset_active_translation(
+            locale=locale, plural_form=translation.plural_form,
+        )
 
     return JsonResponse(
         {
@@ -419,13 +426,14 @@ def unreject_translation(request):
             status=403,
         )
 
-    translation.unreject(request.user)
+    with batch_stats_updates():
+        translation.unreject(request.user)
 
-    log_action("translation:unrejected", request.user, translation=translation)
+        log_action("translation:unrejected", request.user, translation=translation)
 
-    active_translation = translation.entity.reset_active_translation(
-        locale=locale, plural_form=translation.plural_form,
-    )
+        active_translation = translation.entity.reset_active_translation(
+            locale=locale, plural_form=translation.plural_form,
+        )
 
     return JsonResponse(
         {